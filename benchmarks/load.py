@@ -0,0 +1,374 @@
+"""
+Load test of the API: starts src.api.main:app locally (uvicorn) and replays a
+mix of requests from many concurrent clients.
+
+    python -m benchmarks.load                                   # 1 worker, 50 clients, 20 s
+    python -m benchmarks.load --workers 1,4 --cache on,off --output load.json
+    python -m benchmarks.load --url http://127.0.0.1:8000 --clients 200
+
+Each configuration (every combination of --workers and --cache) gets a fresh
+server with its own projects directory. Several workers run with
+STORAGE_BACKEND=sqlite and SHARED_PLANS=1, as they must. Before the clock
+starts, --projects projects are created and filled with a synthetic venue
+(benchmarks/venue.py) of --seats seats, uploaded as Avail XML. Every client
+works on one of them, with sections of its own to edit.
+
+The mix (--mix, relative weights) is drawn from:
+
+- list: GET sections/?view=summary (first page)
+- section: GET one venue section with its seats
+- seat: POST a seat to the client's section
+- rows: POST a range of 5 rows of 20 seats to the client's section
+- clone: clone the client's 10-seat box section
+- save: save the project (a background job, coalesced per project)
+- export: GET export/json
+
+With --cache on, the server keeps its export cache (EXPORT_CACHE_MB) and clients
+revalidate the GETs with If-None-Match (304 counts as success). With --cache off
+the export cache is disabled and clients send unconditional requests.
+
+The report gives per configuration the throughput (requests and edits per
+second), latency percentiles and error rate, overall and per operation; the exit
+status is 1 when any request failed. All clients run in this one process: when
+it uses a full CPU core, start several with --url to load more workers.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.venue import generate_venue, parse_size, write_avail
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MIX = {"list": 25, "section": 15, "seat": 30, "rows": 10, "clone": 5, "save": 5, "export": 10}
+WRITE_OPERATIONS = ("seat", "rows", "clone", "save")
+PERCENTILES = (50, 90, 95, 99)
+
+STARTUP_TIMEOUT = 60.0
+REQUEST_TIMEOUT = 60.0
+
+
+# ---- Server ----
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(workers: int, cache: bool, storage: str = "json") -> Iterator[str]:
+    """Run the API in a subprocess on a free port and yield its base URL."""
+    with tempfile.TemporaryDirectory() as projects_dir:
+        env = dict(os.environ, PROJECTS_DIR=projects_dir, STORAGE_BACKEND=storage)
+        env.pop("PROJECTS_DB", None)
+        if workers > 1:
+            env.update(STORAGE_BACKEND="sqlite", SHARED_PLANS="1")
+        if not cache:
+            env["EXPORT_CACHE_MB"] = "0"
+        port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "src.api.main:app", "--host", "127.0.0.1", "--port", str(port),
+             "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+            cwd=ROOT, env=env,
+        )
+        url = f"http://127.0.0.1:{port}"
+        try:
+            deadline = time.monotonic() + STARTUP_TIMEOUT
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"API server exited with status {process.returncode}")
+                try:
+                    if httpx.get(f"{url}/", timeout=1.0).status_code == 200:
+                        break
+                except httpx.HTTPError:
+                    pass
+                if time.monotonic() > deadline:
+                    raise RuntimeError("API server did not start")
+                time.sleep(0.1)
+            yield url
+        finally:
+            process.send_signal(signal.SIGINT)
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+# ---- Clients ----
+
+class Recorder:
+    """Latencies (seconds) and error counts per operation."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.statuses: Dict[str, int] = {}
+
+    def record(self, operation: str, seconds: float, status: str, ok: bool) -> None:
+        self.latencies.setdefault(operation, []).append(seconds)
+        if not ok:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+
+class LoadClient:
+    """One simulated user editing a project: its own sections, its own RNG."""
+
+    def __init__(self, index: int, http: httpx.AsyncClient, url: str, project: str,
+                 sections: List[str], mix: Dict[str, int], cache: bool, seed: int) -> None:
+        self.http: httpx.AsyncClient = http
+        self.project: str = project
+        self.base: str = f"{url}/api/projects/{project}"
+        self.sections: List[str] = sections
+        self.section: str = f"Load {index}"
+        self.box: str = f"Load {index} Box"
+        self.operations: List[str] = list(mix)
+        self.weights: List[int] = list(mix.values())
+        self.cache: bool = cache
+        self.rng: random.Random = random.Random(seed * 7919 + index)
+        self.etags: Dict[str, str] = {}
+        self.seats: int = 0
+        self.rows: int = 0
+
+    async def setup(self) -> None:
+        for name in (self.section, self.box):
+            res = await self.http.post(f"{self.base}/sections/", json={"name": name})
+            res.raise_for_status()
+        res = await self.http.post(f"{self.base}/sections/{self.box}/rows/A/range",
+                                   json={"start_seat": "1", "end_seat": "10"})
+        res.raise_for_status()
+
+    async def get(self, url: str, **params) -> httpx.Response:
+        headers = {}
+        etag = self.etags.get(url) if self.cache else None
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        res = await self.http.get(url, params=params, headers=headers)
+        if self.cache and res.status_code == 200 and "etag" in res.headers:
+            self.etags[url] = res.headers["etag"]
+        return res
+
+    async def request(self, operation: str) -> httpx.Response:
+        if operation == "list":
+            return await self.get(f"{self.base}/sections/", view="summary", limit=100)
+        if operation == "section":
+            return await self.get(f"{self.base}/sections/{self.rng.choice(self.sections)}")
+        if operation == "seat":
+            row, seat = divmod(self.seats, 40)
+            self.seats += 1
+            return await self.http.post(f"{self.base}/seats/{self.section}/{row + 1}",
+                                        json={"seat_number": str(seat + 1)})
+        if operation == "rows":
+            start = 1000 + 5 * self.rows
+            self.rows += 1
+            return await self.http.post(f"{self.base}/sections/{self.section}/rows/range", json={
+                "start_row": str(start), "end_row": str(start + 4), "start_seat": "1", "end_seat": "20"})
+        if operation == "clone":
+            return await self.http.post(f"{self.base}/sections/{self.box}/clone", params={"count": 1})
+        if operation == "save":
+            return await self.http.post(f"{self.base}/save")
+        if operation == "export":
+            return await self.get(f"{self.base}/export/json")
+        raise ValueError(f"Unknown operation '{operation}'")
+
+    async def run(self, until: float, recorder: Recorder) -> None:
+        loop = asyncio.get_running_loop()
+        while loop.time() < until:
+            operation = self.rng.choices(self.operations, self.weights)[0]
+            start = time.perf_counter()
+            try:
+                res = await self.request(operation)
+                await res.aread()
+                status, ok = str(res.status_code), res.status_code < 400
+            except httpx.HTTPError as e:
+                status, ok = type(e).__name__, False
+            recorder.record(operation, time.perf_counter() - start, status, ok)
+
+
+async def seed_projects(http: httpx.AsyncClient, url: str, projects: int, seats: int, seed: int) -> List[str]:
+    """Create the projects, each filled with the same synthetic venue; returns its section names."""
+    venue = generate_venue(seats, seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "venue.xml")
+        write_avail(venue, path)
+        with open(path, "rb") as f:
+            content = f.read()
+    for index in range(projects):
+        project = f"load-{index}"
+        res = await http.post(f"{url}/api/projects/{project}")
+        if res.status_code != 409:
+            # an existing project (on a server given by --url) is replaced by the import
+            res.raise_for_status()
+        res = await http.post(f"{url}/api/projects/{project}/import/avail", params={"wait": True},
+                              content=content)
+        res.raise_for_status()
+    # GA sections have no seats, so the Avail import leaves them out
+    return [name for name, section in venue.sections.items() if section.seats]
+
+
+async def run_load(url: str, clients: int, duration: float, mix: Dict[str, int], cache: bool,
+                   projects: int = 4, seats: int = 20_000, seed: int = 0) -> dict:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT, limits=limits) as http:
+        sections = await seed_projects(http, url, projects, seats, seed)
+        users = [LoadClient(index, http, url, f"load-{index % projects}", sections, mix, cache, seed)
+                 for index in range(clients)]
+        await asyncio.gather(*(user.setup() for user in users))
+        recorder = Recorder()
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        until = loop.time() + duration
+        await asyncio.gather(*(user.run(until, recorder) for user in users))
+        elapsed = time.perf_counter() - start
+    return summarize(recorder, elapsed)
+
+
+# ---- Reporting ----
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[min(len(sorted_values), int(rank)) - 1]
+
+
+def _stats(latencies: List[float], errors: int, elapsed: float) -> dict:
+    values = sorted(latencies)
+    stats = {
+        "requests": len(values),
+        "errors": errors,
+        "error_rate": errors / len(values) if values else 0.0,
+        "throughput": len(values) / elapsed if elapsed else 0.0,
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "max_ms": values[-1] * 1000 if values else 0.0,
+    }
+    for pct in PERCENTILES:
+        stats[f"p{pct}_ms"] = percentile(values, pct) * 1000
+    return stats
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    operations = {
+        operation: _stats(latencies, recorder.errors.get(operation, 0), elapsed)
+        for operation, latencies in sorted(recorder.latencies.items())
+    }
+    every = [latency for latencies in recorder.latencies.values() for latency in latencies]
+    total = _stats(every, sum(recorder.errors.values()), elapsed)
+    total["edits_per_second"] = sum(
+        operations[operation]["requests"] - operations[operation]["errors"]
+        for operation in WRITE_OPERATIONS if operation in operations
+    ) / elapsed
+    return {"elapsed_s": elapsed, "total": total, "operations": operations, "statuses": recorder.statuses}
+
+
+def print_report(label: str, result: dict) -> None:
+    total = result["total"]
+    print(f"\n== {label}: {total['requests']} requests in {result['elapsed_s']:.1f} s, "
+          f"{total['throughput']:.1f} req/s, {total['edits_per_second']:.1f} edits/s, "
+          f"{total['error_rate']:.2%} errors")
+    print(f"{'operation':<10} {'requests':>9} {'req/s':>8} {'errors':>7} "
+          + " ".join(f"{'p' + str(pct) + ' ms':>9}" for pct in PERCENTILES) + f" {'max ms':>9}")
+    for operation, stats in list(result["operations"].items()) + [("total", total)]:
+        print(f"{operation:<10} {stats['requests']:>9} {stats['throughput']:>8.1f} {stats['errors']:>7} "
+              + " ".join(f"{stats[f'p{pct}_ms']:>9.1f}" for pct in PERCENTILES) + f" {stats['max_ms']:>9.1f}")
+    print("statuses: " + ", ".join(f"{status}: {count}" for status, count in sorted(result["statuses"].items())))
+
+
+def print_comparison(runs: List[dict]) -> None:
+    print(f"\n{'configuration':<24} {'req/s':>8} {'edits/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'errors':>7}")
+    for run in runs:
+        total = run["result"]["total"]
+        print(f"{run['label']:<24} {total['throughput']:>8.1f} {total['edits_per_second']:>8.1f} "
+              f"{total['p50_ms']:>8.1f} {total['p95_ms']:>8.1f} {total['p99_ms']:>8.1f} "
+              f"{total['error_rate']:>7.2%}")
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """'list=30,seat=50' -> {'list': 30, 'seat': 50}."""
+    mix = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        operation, _, weight = part.partition("=")
+        operation = operation.strip()
+        if operation not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation '{operation}' (one of {', '.join(DEFAULT_MIX)})")
+        mix[operation] = int(weight)
+    if not any(mix.values()):
+        raise ValueError("The mix needs at least one operation with a positive weight")
+    return mix
+
+
+def configurations(workers: str, cache: str) -> List[Tuple[int, bool]]:
+    settings = {"on": True, "off": False}
+    return [(int(count), settings[setting.strip()])
+            for count in workers.split(",") if count.strip()
+            for setting in cache.split(",") if setting.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the seating plan API.")
+    parser.add_argument("--workers", default="1", help="comma separated worker counts to compare, e.g. 1,4")
+    parser.add_argument("--cache", default="on", help="'on', 'off' or 'on,off' (export cache + conditional GETs)")
+    parser.add_argument("--storage", choices=("json", "sqlite"), default="json",
+                        help="storage backend of single-worker servers (several workers always use sqlite)")
+    parser.add_argument("--url", help="load an already running server instead of starting one")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per configuration")
+    parser.add_argument("--projects", type=int, default=4)
+    parser.add_argument("--seats", default="20k", help="seats of the venue each project starts with")
+    parser.add_argument("--mix", help="relative weights, e.g. list=30,seat=50,save=5 "
+                                      f"(default {','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix) if args.mix else dict(DEFAULT_MIX)
+        configs = configurations(args.workers, args.cache)
+    except (KeyError, ValueError) as e:
+        parser.error(str(e))
+    options = dict(clients=args.clients, duration=args.duration, mix=mix, projects=args.projects,
+                   seats=parse_size(args.seats), seed=args.seed)
+
+    runs = []
+    if args.url:
+        for cache in dict.fromkeys(cache for _, cache in configs):
+            label = f"{args.url} cache={'on' if cache else 'off'}"
+            result = asyncio.run(run_load(args.url.rstrip("/"), cache=cache, **options))
+            runs.append({"label": label, "url": args.url, "cache": cache, "result": result})
+            print_report(label, result)
+    else:
+        for workers, cache in configs:
+            label = f"workers={workers} cache={'on' if cache else 'off'}"
+            with local_server(workers, cache, args.storage) as url:
+                result = asyncio.run(run_load(url, cache=cache, **options))
+            runs.append({"label": label, "workers": workers, "cache": cache, "result": result})
+            print_report(label, result)
+    if len(runs) > 1:
+        print_comparison(runs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"options": {**options, "storage": args.storage}, "runs": runs}, f, indent=2)
+    errors = sum(run["result"]["total"]["errors"] for run in runs)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
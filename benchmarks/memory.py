@@ -0,0 +1,180 @@
+"""
+Memory footprint of the models, the GUI undo stack and the file formats, measured
+with tracemalloc.
+
+    python -m benchmarks.memory                      # 100k seats
+    python -m benchmarks.memory --seats 1M --output memory.json
+
+Every measurement runs on a synthetic venue (benchmarks/venue.py) and is
+reported per seat, so results of different sizes compare:
+
+- section_bytes_per_seat: memory kept by a Section holding the seats
+- undo_snapshot_bytes_per_seat: memory kept by one MainWindow undo snapshot
+- *_peak_bytes_per_seat: peak memory allocated while importing a JSON project or
+  an Avail file (the imported plan included), or exporting an Excel manifest
+
+tests/test_memory.py checks these against thresholds. tracemalloc only sees
+allocations made through Python's allocator, which is nearly all of it here;
+memory held by Qt is not counted.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+from benchmarks.venue import generate_venue, parse_size, write_avail
+
+DEFAULT_SEATS = 100_000
+UNDO_SNAPSHOTS = 5
+
+
+class Usage:
+    """Memory traced during a 'with measure()' block: kept at its end, and peak."""
+
+    def __init__(self) -> None:
+        self.kept: int = 0
+        self.peak: int = 0
+
+
+@contextmanager
+def measure():
+    """Trace allocations in the block; the Usage yielded is filled in when it ends."""
+    usage = Usage()
+    gc.collect()
+    already = tracemalloc.is_tracing()
+    if not already:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    try:
+        yield usage
+    finally:
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        if not already:
+            tracemalloc.stop()
+        usage.kept = current - start
+        usage.peak = peak - start
+
+
+# ---- Measurements ----
+# Each takes a venue (and a temporary directory) and returns bytes per seat.
+
+def seat_count(plan: SeatingPlan) -> int:
+    return sum(len(section.seats) for section in plan.sections.values())
+
+
+def section_bytes_per_seat(plan: SeatingPlan, tmpdir: str) -> float:
+    data = [section.to_dict() for section in plan.sections.values()]
+    with measure() as usage:
+        sections = [Section.from_dict(section) for section in data]
+    del sections
+    return usage.kept / seat_count(plan)
+
+
+def _application():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def undo_snapshot_bytes_per_seat(plan: SeatingPlan, tmpdir: str) -> float:
+    app = _application()
+    from src.ui.main_window import MainWindow
+
+    window = MainWindow()
+    window.seating_plan = plan
+    with measure() as usage:
+        for index in range(UNDO_SNAPSHOTS):
+            window.push_undo_snapshot(f"snapshot {index}")
+    window.undo_stack.clear()
+    window.close()
+    app.processEvents()
+    return usage.kept / UNDO_SNAPSHOTS / seat_count(plan)
+
+
+def import_project_peak_bytes_per_seat(plan: SeatingPlan, tmpdir: str) -> float:
+    path = os.path.join(tmpdir, "venue.json")
+    plan.export_project(path)
+    imported = SeatingPlan()
+    with measure() as usage:
+        imported.import_project(path)
+    return usage.peak / seat_count(plan)
+
+
+def import_from_avail_peak_bytes_per_seat(plan: SeatingPlan, tmpdir: str) -> float:
+    path = os.path.join(tmpdir, "venue.xml")
+    write_avail(plan, path)
+    imported = SeatingPlan()
+    with warnings.catch_warnings():
+        # import_from_avail parses the XML with BeautifulSoup's lxml HTML parser on purpose
+        warnings.simplefilter("ignore")
+        # module imports are not part of the footprint
+        import bs4  # noqa: F401
+        import lxml.etree  # noqa: F401
+        with measure() as usage:
+            imported.import_from_avail(path)
+    return usage.peak / seat_count(plan)
+
+
+def export_to_excel_peak_bytes_per_seat(plan: SeatingPlan, tmpdir: str) -> float:
+    path = os.path.join(tmpdir, "venue.xlsx")
+    import openpyxl  # noqa: F401
+    with measure() as usage:
+        plan.export_to_excel(path)
+    return usage.peak / seat_count(plan)
+
+
+MEASUREMENTS: Dict[str, Callable[[SeatingPlan, str], float]] = {
+    "section_bytes_per_seat": section_bytes_per_seat,
+    "undo_snapshot_bytes_per_seat": undo_snapshot_bytes_per_seat,
+    "import_project_peak_bytes_per_seat": import_project_peak_bytes_per_seat,
+    "import_from_avail_peak_bytes_per_seat": import_from_avail_peak_bytes_per_seat,
+    "export_to_excel_peak_bytes_per_seat": export_to_excel_peak_bytes_per_seat,
+}
+
+
+def run(seats: int, names: Optional[List[str]] = None, seed: int = 0) -> Dict[str, float]:
+    plan = generate_venue(seats, seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in names or MEASUREMENTS:
+            results[name] = MEASUREMENTS[name](plan, tmpdir)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure memory footprints with tracemalloc.")
+    parser.add_argument("--seats", default=str(DEFAULT_SEATS), help="venue size, e.g. 100k, 1M")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", help="comma separated measurements (or prefixes)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    names = list(MEASUREMENTS)
+    if args.only:
+        prefixes = [prefix.strip() for prefix in args.only.split(",") if prefix.strip()]
+        names = [name for name in names if any(name.startswith(prefix) for prefix in prefixes)]
+        if not names:
+            parser.error(f"no measurement matches {args.only!r}")
+    seats = parse_size(args.seats)
+    results = run(seats, names, args.seed)
+    for name, value in results.items():
+        print(f"{name:<40} {value:10.1f} bytes  ({value * seats / 1e6:9.1f} MB for {seats} seats)")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"seats": seats, "seed": args.seed, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
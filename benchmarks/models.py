@@ -0,0 +1,348 @@
+"""
+Benchmarks of the model operations at venue scale.
+
+    python -m benchmarks.models                          # 1k, 10k, 100k and 1M seats
+    python -m benchmarks.models --seats 1k,10k --output results.json
+    python -m benchmarks.models --only to_dict,json --baseline results.json
+
+    python -m benchmarks.models --venue synthetic --seats 100k
+
+Venues are built from sections of ROWS_PER_SECTION rows of SEATS_PER_ROW seats
+(1M seats: 1000 sections), or with --venue synthetic generated by
+benchmarks/venue.py (tiers, boxes, GA areas, odd/even aisles). Each benchmark builds its input untimed, then times
+the operation over --repeat runs and reports the best and median time and the
+best time per seat. Results are written as JSON; with --baseline, every result
+more than --threshold slower than the same benchmark and size in the baseline
+is flagged and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+from benchmarks.venue import generate_venue, parse_size, write_avail
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEATS_PER_ROW = 20
+ROWS_PER_SECTION = 50
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.25
+
+
+def default_repeat(seats: int) -> int:
+    # fewer runs for the big venues, where one run takes seconds
+    return 5 if seats <= 10_000 else 3 if seats <= 100_000 else 1
+
+
+# ---- Venues ----
+
+def venue_layout(seats: int) -> List[Tuple[str, List[str]]]:
+    """(section name, row labels 1..n) of a venue of about 'seats' seats, SEATS_PER_ROW per row."""
+    rows_total = max(1, seats // SEATS_PER_ROW)
+    layout = []
+    index = 1
+    while rows_total > 0:
+        rows = min(ROWS_PER_SECTION, rows_total)
+        layout.append((f"Section {index}", [str(i) for i in range(1, rows + 1)]))
+        rows_total -= rows
+        index += 1
+    return layout
+
+
+def build_plan(seats: int, venue: str = "grid") -> SeatingPlan:
+    """The venue benchmarks work on: the regular grid of venue_layout() or a synthetic venue."""
+    if venue == "synthetic":
+        return generate_venue(seats, seed=seats)
+    plan = SeatingPlan(f"Benchmark {seats}")
+    for name, rows in venue_layout(seats):
+        plan.add_section(name)
+        plan.sections[name].add_row_range(rows[0], rows[-1], "1", str(SEATS_PER_ROW))
+    return plan
+
+
+# ---- Benchmarks ----
+# Each benchmark takes (seats, tmpdir, venue) and returns a runner: a function
+# doing the untimed setup and returning the operation to time. The seat adds and
+# clone_section_many always work on the grid of venue_layout().
+
+Runner = Callable[[], Callable[[], object]]
+BENCHMARKS: Dict[str, Callable[[int, str, str], Runner]] = {}
+
+
+def benchmark(name: str):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+@benchmark("add_seat")
+def bench_add_seat(seats: int, tmpdir: str, venue: str) -> Runner:
+    layout = venue_layout(seats)
+    labels = [str(i) for i in range(1, SEATS_PER_ROW + 1)]
+
+    def setup():
+        sections = [(Section(name), rows) for name, rows in layout]
+
+        def run():
+            for section, rows in sections:
+                for row in rows:
+                    for label in labels:
+                        section.add_seat(row, label)
+        return run
+    return setup
+
+
+@benchmark("add_seat_range")
+def bench_add_seat_range(seats: int, tmpdir: str, venue: str) -> Runner:
+    layout = venue_layout(seats)
+
+    def setup():
+        sections = [(Section(name), rows) for name, rows in layout]
+
+        def run():
+            for section, rows in sections:
+                for row in rows:
+                    section.add_seat_range(row, 1, SEATS_PER_ROW)
+        return run
+    return setup
+
+
+@benchmark("add_row_range")
+def bench_add_row_range(seats: int, tmpdir: str, venue: str) -> Runner:
+    layout = venue_layout(seats)
+
+    def setup():
+        sections = [(Section(name), rows) for name, rows in layout]
+
+        def run():
+            for section, rows in sections:
+                section.add_row_range(rows[0], rows[-1], "1", str(SEATS_PER_ROW))
+        return run
+    return setup
+
+
+@benchmark("delete_row")
+def bench_delete_row(seats: int, tmpdir: str, venue: str) -> Runner:
+    def setup():
+        sections = list(build_plan(seats, venue).sections.values())
+
+        def run():
+            for section in sections:
+                for row in section.row_numbers():
+                    section.delete_row(row)
+        return run
+    return setup
+
+
+@benchmark("renumber_rows")
+def bench_renumber_rows(seats: int, tmpdir: str, venue: str) -> Runner:
+    def setup():
+        sections = list(build_plan(seats, venue).sections.values())
+
+        def run():
+            for section in sections:
+                section.renumber_rows(section.row_numbers(), "A", add_prefix=True)
+        return run
+    return setup
+
+
+@benchmark("clone_section_many")
+def bench_clone_section_many(seats: int, tmpdir: str, venue: str) -> Runner:
+    # one section cloned until the plan holds 'seats' seats
+    per_section = min(seats, SEATS_PER_ROW * ROWS_PER_SECTION)
+    count = max(1, seats // per_section - 1)
+
+    def setup():
+        plan = build_plan(per_section)
+        source = next(iter(plan.sections))
+        return lambda: plan.clone_section_many(source, count)
+    return setup
+
+
+@benchmark("to_dict")
+def bench_to_dict(seats: int, tmpdir: str, venue: str) -> Runner:
+    plan = build_plan(seats, venue)
+    return lambda: plan.to_dict
+
+
+@benchmark("from_dict")
+def bench_from_dict(seats: int, tmpdir: str, venue: str) -> Runner:
+    data = build_plan(seats, venue).to_dict()
+    return lambda: lambda: SeatingPlan().from_dict(data)
+
+
+@benchmark("json_export")
+def bench_json_export(seats: int, tmpdir: str, venue: str) -> Runner:
+    plan = build_plan(seats, venue)
+    path = os.path.join(tmpdir, "export.json")
+    return lambda: lambda: plan.export_project(path)
+
+
+@benchmark("json_import")
+def bench_json_import(seats: int, tmpdir: str, venue: str) -> Runner:
+    path = os.path.join(tmpdir, "import.json")
+    build_plan(seats, venue).export_project(path)
+    return lambda: lambda: SeatingPlan().import_project(path)
+
+
+@benchmark("excel_export")
+def bench_excel_export(seats: int, tmpdir: str, venue: str) -> Runner:
+    plan = build_plan(seats, venue)
+    path = os.path.join(tmpdir, "export.xlsx")
+    return lambda: lambda: plan.export_to_excel(path)
+
+
+@benchmark("excel_import")
+def bench_excel_import(seats: int, tmpdir: str, venue: str) -> Runner:
+    path = os.path.join(tmpdir, "import.xlsx")
+    build_plan(seats, venue).export_to_excel(path)
+    return lambda: lambda: SeatingPlan().import_from_excel(path)
+
+
+@benchmark("avail_import")
+def bench_avail_import(seats: int, tmpdir: str, venue: str) -> Runner:
+    path = os.path.join(tmpdir, "import.xml")
+    write_avail(build_plan(seats, venue), path)
+    return lambda: lambda: SeatingPlan().import_from_avail(path)
+
+
+# ---- Running ----
+
+def measure(runner: Runner, repeat: int) -> List[float]:
+    times = []
+    for _ in range(repeat):
+        operation = runner()
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_benchmarks(names: List[str], sizes: List[int], repeat: Optional[int] = None, venue: str = "grid",
+                   log: Callable[[str], None] = print) -> List[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for seats in sizes:
+            for name in names:
+                times = measure(BENCHMARKS[name](seats, tmpdir, venue), repeat or default_repeat(seats))
+                best = min(times)
+                result = {
+                    "benchmark": name,
+                    "seats": seats,
+                    "venue": venue,
+                    "repeat": len(times),
+                    "best_s": best,
+                    "median_s": statistics.median(times),
+                    "per_seat_us": best / seats * 1e6,
+                }
+                results.append(result)
+                log(f"{name:<20} {seats:>9} seats  best {best * 1000:10.2f} ms  "
+                    f"median {result['median_s'] * 1000:10.2f} ms  {result['per_seat_us']:8.3f} us/seat")
+    return results
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float = DEFAULT_THRESHOLD) -> List[dict]:
+    """
+    Match results with the baseline by benchmark, size and venue; returns one entry per
+    match with the ratio of best times and whether it is a regression (slower by
+    more than 'threshold', e.g. 0.25 = 25 %).
+    """
+    previous = {(entry["benchmark"], entry["seats"], entry.get("venue", "grid")): entry for entry in baseline}
+    comparisons = []
+    for entry in results:
+        before = previous.get((entry["benchmark"], entry["seats"], entry.get("venue", "grid")))
+        if before is None or before["best_s"] <= 0:
+            continue
+        ratio = entry["best_s"] / before["best_s"]
+        comparisons.append({
+            "benchmark": entry["benchmark"],
+            "seats": entry["seats"],
+            "baseline_s": before["best_s"],
+            "best_s": entry["best_s"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return comparisons
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the seating plan model operations.")
+    parser.add_argument("--seats", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma separated venue sizes, e.g. 1k,10k,100k,1M")
+    parser.add_argument("--only", help="comma separated benchmarks (or prefixes, e.g. 'json')")
+    parser.add_argument("--venue", choices=("grid", "synthetic"), default="grid",
+                        help="regular grid of sections, or a synthetic venue (benchmarks/venue.py)")
+    parser.add_argument("--repeat", type=int, help="runs per benchmark (default: 5 to 1 by size)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown flagged as a regression (default 0.25 = 25%%)")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+    names = list(BENCHMARKS)
+    if args.only:
+        prefixes = [prefix.strip() for prefix in args.only.split(",") if prefix.strip()]
+        names = [name for name in names if any(name.startswith(prefix) for prefix in prefixes)]
+        if not names:
+            parser.error(f"no benchmark matches {args.only!r}; see --list")
+    sizes = [parse_size(value) for value in args.seats.split(",") if value.strip()]
+    # import_from_avail parses the XML with BeautifulSoup's lxml HTML parser on purpose
+    warnings.filterwarnings("ignore", message="It looks like you're using an HTML parser")
+
+    results = run_benchmarks(names, sizes, args.repeat, args.venue)
+    report = {"environment": environment(), "results": results}
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        report["comparison"] = comparisons = compare(results, baseline, args.threshold)
+        print()
+        for entry in comparisons:
+            flag = "  REGRESSION" if entry["regression"] else ""
+            print(f"{entry['benchmark']:<20} {entry['seats']:>9} seats  "
+                  f"{entry['baseline_s'] * 1000:10.2f} -> {entry['best_s'] * 1000:10.2f} ms  "
+                  f"x{entry['ratio']:.2f}{flag}")
+        regressions = [entry for entry in comparisons if entry["regression"]]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            status = 1
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
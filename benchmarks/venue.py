@@ -0,0 +1,202 @@
+"""
+Deterministic synthetic venues for benchmarks and stress tests.
+
+    python -m benchmarks.venue --seats 100k --seed 7 --json venue.json --excel venue.xlsx --avail venue.xml
+
+generate_venue(seats, seed) builds a SeatingPlan of exactly 'seats' seats, the
+same one for the same arguments. The venue is stacked in tiers (Stalls, Dress
+Circle, ... then Level 7, Level 8 ...), each made of:
+
+- seated blocks with lettered rows (A, B ... skipping I and O, then AA ...) that
+  widen towards the back; the centre block is numbered from 101, blocks left of
+  it carry odd seat numbers only and blocks right of it even ones (aisles)
+- a run of boxes ("Grand Tier Box 12") of one to three short rows
+- now and then a terrace with '#'-prefixed rows (#1, #2 ...) or a GA standing
+  area (a GA section has no seats)
+
+A tier holds about 2500 seats in some 27 sections, so 1M seats make over ten
+thousand sections.
+"""
+import argparse
+import random
+import sys
+from typing import Dict, FrozenSet, List, Optional
+from xml.sax.saxutils import escape
+
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+
+TIER_NAMES = ("Stalls", "Dress Circle", "Grand Tier", "Upper Circle", "Balcony", "Gallery")
+
+# Row letters as venues print them: I and O look like 1 and 0
+ROW_LETTERS = [letter for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if letter not in "IO"]
+
+
+def parse_size(value: str) -> int:
+    """'1k' -> 1000, '2.5M' -> 2500000, '1_000' -> 1000."""
+    value = value.strip().lower().replace("_", "")
+    for suffix, factor in (("k", 1_000), ("m", 1_000_000)):
+        if value.endswith(suffix):
+            return int(float(value[:-1]) * factor)
+    return int(value)
+
+
+def row_letter(index: int) -> str:
+    """0 -> 'A', 23 -> 'Z', 24 -> 'AA' (over ROW_LETTERS)."""
+    label = ""
+    index += 1
+    while index > 0:
+        index, rem = divmod(index - 1, len(ROW_LETTERS))
+        label = ROW_LETTERS[rem] + label
+    return label
+
+
+def tier_name(index: int) -> str:
+    return TIER_NAMES[index] if index < len(TIER_NAMES) else f"Level {index + 1}"
+
+
+class _VenueBuilder:
+    """Adds sections to a plan until it holds exactly 'seats' seats."""
+
+    def __init__(self, plan: SeatingPlan, seats: int, rng: random.Random) -> None:
+        self.plan: SeatingPlan = plan
+        self.remaining: int = seats
+        self.rng: random.Random = rng
+
+    @property
+    def full(self) -> bool:
+        return self.remaining <= 0
+
+    def section(self, name: str, is_ga: bool = False) -> Section:
+        self.plan.add_section(name, is_ga=is_ga)
+        return self.plan.sections[name]
+
+    def row(self, section: Section, row: str, labels: List[str]) -> None:
+        for label in labels[:self.remaining]:
+            section.add_seat(row, label)
+        self.remaining -= min(len(labels), self.remaining)
+
+    def block(self, name: str, position: int, blocks: int) -> None:
+        """A seated block; position is its place from left (0) to right (blocks - 1)."""
+        if self.full:
+            return
+        rng = self.rng
+        section = self.section(name)
+        rows = rng.randint(8, 30)
+        width = rng.randint(10, 28)
+        rake = rng.randint(0, 2)
+        centre = blocks // 2
+        for index in range(rows):
+            if self.full:
+                return
+            # rows get wider towards the back
+            count = width + index * rake // 2
+            if position == centre:
+                labels = [str(101 + i) for i in range(count)]
+            elif position < centre:
+                labels = [str(1 + 2 * i) for i in range(count)]
+            else:
+                labels = [str(2 + 2 * i) for i in range(count)]
+            self.row(section, row_letter(index), labels)
+
+    def boxes(self, tier: str, count: int) -> None:
+        rng = self.rng
+        for number in range(1, count + 1):
+            if self.full:
+                return
+            section = self.section(f"{tier} Box {number}")
+            hashed = rng.random() < 0.5
+            for index in range(rng.randint(1, 3)):
+                row = f"#{index + 1}" if hashed else row_letter(index)
+                self.row(section, row, [str(i) for i in range(1, rng.randint(4, 8) + 1)])
+
+    def terrace(self, tier: str) -> None:
+        if self.full:
+            return
+        rng = self.rng
+        section = self.section(f"{tier} Terrace")
+        width = rng.randint(20, 40)
+        for index in range(rng.randint(5, 15)):
+            if self.full:
+                return
+            self.row(section, f"#{index + 1}", [str(i) for i in range(1, width + 1)])
+
+
+def generate_venue(seats: int, seed: int = 0, name: Optional[str] = None) -> SeatingPlan:
+    """A synthetic venue of exactly 'seats' seats; the same plan for the same seats and seed."""
+    rng = random.Random(seed)
+    plan = SeatingPlan(name or f"Synthetic venue {seats} seats (seed {seed})")
+    builder = _VenueBuilder(plan, seats, rng)
+    index = 0
+    while not builder.full:
+        tier = tier_name(index)
+        blocks = rng.choice((3, 5, 7))
+        for position in range(blocks):
+            builder.block(f"{tier} Block {chr(ord('A') + position)}", position, blocks)
+        builder.boxes(tier, rng.randint(10, 40))
+        extra = rng.random()
+        if extra < 0.3:
+            builder.terrace(tier)
+        elif extra < 0.5 and not builder.full:
+            builder.section(f"{tier} Standing", is_ga=True)
+        index += 1
+    return plan
+
+
+# ---- Output ----
+
+def write_avail(plan: SeatingPlan, path: str) -> None:
+    """
+    Write the plan as Avail XML, as read by SeatingPlan.import_from_avail: every
+    entry is a set of rows times a set of seat labels, so each section gets one
+    entry per group of rows with the same seats (GA sections: one empty entry).
+    """
+    entry_id = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0"?>\n<venue><section_id_list>\n')
+        for section in plan.sections.values():
+            groups: Dict[FrozenSet[str], List[str]] = {}
+            for row in section.row_numbers():
+                labels = frozenset(seat.seat_number for seat in section.row_seats(row))
+                groups.setdefault(labels, []).append(row)
+            if section.is_ga:
+                groups = {frozenset(): []}
+            name = escape(section.name)
+            for labels, rows in groups.items():
+                entry_id += 1
+                row_tags = "".join(f"<e>{escape(row)}</e>" for row in rows)
+                seat_tags = "".join(f"<e>{escape(label)}</e>" for label in sorted(labels))
+                f.write(f"<e><section_id>{entry_id}</section_id><section_name>{name}</section_name>"
+                        f"<secnam_list>{name}</secnam_list><row_names>{row_tags}</row_names>"
+                        f"<seat_names>{seat_tags}</seat_names>"
+                        f"<is_ga>{str(section.is_ga).lower()}</is_ga></e>\n")
+        f.write("</section_id_list></venue>\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic venue.")
+    parser.add_argument("--seats", default="10k", help="total seats, e.g. 5000, 100k, 1M")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--name", help="plan name")
+    parser.add_argument("--json", help="write a JSON project (.json, .json.gz, .json.xz)")
+    parser.add_argument("--excel", help="write an Excel manifest (.xlsx)")
+    parser.add_argument("--avail", help="write Avail XML")
+    args = parser.parse_args(argv)
+
+    plan = generate_venue(parse_size(args.seats), args.seed, args.name)
+    if args.json:
+        plan.export_project(args.json)
+    if args.excel:
+        plan.export_to_excel(args.excel)
+    if args.avail:
+        write_avail(plan, args.avail)
+    sections = plan.sections.values()
+    print(f"{plan.name}: {len(plan.sections)} sections "
+          f"({sum(1 for section in sections if section.is_ga)} GA), "
+          f"{sum(section.row_count for section in sections)} rows, "
+          f"{sum(len(section.seats) for section in sections)} seats")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
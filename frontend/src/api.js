@@ -9,16 +9,48 @@ const api = axios.create({
   },
 })
 
+export const jobsAPI = {
+  get: (jobId) => api.get(`/jobs/${jobId}`),
+}
+
+// Poll a background job (returned with 202 by save/load) until it finishes.
+// Resolves with the finished job, rejects if it failed.
+export const waitForJob = async (job, intervalMs = 250) => {
+  while (job.status === 'pending' || job.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, intervalMs))
+    job = (await jobsAPI.get(job.job_id)).data
+  }
+  if (job.status === 'failed') throw new Error(job.error)
+  return job
+}
+
 export const projectsAPI = {
   new: (name) => api.post(`/projects/new/${name}`),
+  // save and load run in the background: pass the response data to waitForJob
   save: (name) => api.post('/projects/save', { name }),
   load: (name) => api.post('/projects/load', { name }),
-  list: () => api.get('/projects/list'),
+  // params: { sort: 'name'|'modified'|'size'|'sections'|'rows'|'seats', order, q, min_seats, max_seats }
+  list: (params = {}) => api.get('/projects/list', { params }),
   delete: (name) => api.delete(`/projects/${name}`),
 }
 
+export const importAPI = {
+  // importer: 'excel' (.xlsx manifest) or 'avail' (XML); the file is sent as the raw body
+  upload: (importer, file, name) =>
+    api.post(`/import/${importer}`, file, {
+      params: { name },
+      headers: { 'Content-Type': 'application/octet-stream' },
+    }),
+}
+
+export const exportAPI = {
+  // format: 'json' (project file), 'csv' or 'xlsx' (Excel manifest); use as a download link
+  url: (format) => `${API_BASE}/export/${format}`,
+}
+
 export const sectionsAPI = {
-  list: () => api.get('/sections'),
+  list: (params = {}) => api.get('/sections', { params }),
+  summary: (params = {}) => api.get('/sections', { params: { ...params, view: 'summary' } }),
   get: (name) => api.get(`/sections/${name}`),
   create: (name, isGa = false) => api.post('/sections', { name, is_ga: isGa }),
   delete: (name) => api.delete(`/sections/${name}`),
@@ -28,6 +60,12 @@ export const sectionsAPI = {
     api.post(`/sections/${name}/rows/${row}/bulk`, { seat_numbers: seatNumbers }),
   seatRange: (name, row, startSeat, endSeat) =>
     api.post(`/sections/${name}/rows/${row}/range`, { start_seat: startSeat, end_seat: endSeat }),
+  rows: (name) => api.get(`/sections/${name}/rows`),
+  row: (name, row) => api.get(`/sections/${name}/rows/${row}`),
+  // seats: [{ row, seat_number }], rows: whole rows
+  deleteSeats: (name, seats = [], rows = []) => api.post(`/sections/${name}/seats/delete`, { seats, rows }),
+  moveSeats: (name, target, seats = [], rows = [], createTarget = false) =>
+    api.post(`/sections/${name}/seats/move`, { target, seats, rows, create_target: createTarget }),
   deleteRow: (name, row) => api.delete(`/sections/${name}/rows/${row}`),
 }
 
@@ -37,4 +75,25 @@ export const seatsAPI = {
   delete: (section, row, seat) => api.delete(`/seats/${section}/${row}/${seat}`),
 }
 
+// Apply several edits in one request; all succeed or none do.
+// ops: [{ op: 'add_seats', section, row, seat_numbers }, { op: 'delete_rows', section, rows }, ...]
+export const batchAPI = {
+  apply: (operations) => api.post('/batch', { operations }),
+}
+
+export const changesAPI = {
+  since: (version, epoch) => api.get('/changes', { params: { since: version, epoch } }),
+  // Live feed of plan changes. onChange gets { epoch, version, events } per plan
+  // version; onReset is called when the client must reload the plan.
+  subscribe: (onChange, onReset) => {
+    const source = new EventSource(`${API_BASE}/changes/stream`)
+    source.addEventListener('change', (e) => onChange(JSON.parse(e.data)))
+    source.addEventListener('reset', () => {
+      source.close()
+      if (onReset) onReset()
+    })
+    return source
+  },
+}
+
 export default api
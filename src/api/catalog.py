@@ -0,0 +1,126 @@
+import json
+import lzma
+import os
+import threading
+from typing import Dict, List, Optional
+
+from src.utils.compression import compression_for_path, detect_compression, open_text, strip_project_extension
+
+# Sidecar in the projects directory; no project extension, so it is never listed as a project
+CATALOG_FILE = ".catalog"
+
+
+def plan_metadata(data: dict) -> dict:
+    """Counts describing a plan serialized with SeatingPlan.to_dict()."""
+    sections = data.get("sections", [])
+    rows = seats = ga_sections = 0
+    for section in sections:
+        ga_sections += bool(section.get("is_ga"))
+        for row in section.get("rows", []):
+            rows += 1
+            seats += len(row.get("seats", []))
+    return {
+        "plan_name": data.get("seating_plan_name"),
+        "sections": len(sections),
+        "ga_sections": ga_sections,
+        "rows": rows,
+        "seats": seats,
+    }
+
+
+class ProjectCatalog:
+    """
+    Metadata of the saved projects in one directory, kept in a JSON sidecar file.
+
+    save_plan_data() and delete_project() keep the catalog up to date; entries()
+    additionally compares each file's mtime and size with the catalog, so files
+    copied in or edited outside the API are rescanned (and only those).
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory: str = directory
+        self.path: str = os.path.join(directory, CATALOG_FILE)
+        self._entries: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)["projects"]
+            except (OSError, ValueError, KeyError, TypeError):
+                # missing or damaged: rebuilt from the project files
+                self._entries = {}
+        return self._entries
+
+    def _store(self) -> None:
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"projects": self._entries}, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def _entry(name: str, path: str, stat: os.stat_result, metadata: dict) -> dict:
+        return dict(
+            metadata,
+            name=name,
+            file=os.path.basename(path),
+            compression=compression_for_path(path),
+            size=stat.st_size,
+            modified=stat.st_mtime,
+            mtime_ns=stat.st_mtime_ns,
+        )
+
+    @staticmethod
+    def _scan(path: str) -> dict:
+        with open_text(path, "r", detect_compression(path)) as f:
+            return plan_metadata(json.load(f))
+
+    # ---- Updates ----
+    def record(self, name: str, path: str, data: dict) -> None:
+        """Record a project just written to 'path' from 'data' (SeatingPlan.to_dict())."""
+        with self._lock:
+            entries = self._load()
+            entries[name] = self._entry(name, path, os.stat(path), plan_metadata(data))
+            self._store()
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            if self._load().pop(name, None) is not None:
+                self._store()
+
+    # ---- Reading ----
+    def entries(self) -> List[dict]:
+        """Catalog entries of all saved projects, refreshed from the directory listing."""
+        with self._lock:
+            entries = self._load()
+            changed = False
+            seen = set()
+            for filename in os.listdir(self.directory):
+                name = strip_project_extension(filename)
+                if name is None or name in seen:
+                    continue
+                path = os.path.join(self.directory, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(name)
+                entry = entries.get(name)
+                if (entry is not None and entry["file"] == filename
+                        and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size):
+                    continue
+                try:
+                    metadata = self._scan(path)
+                except (OSError, ValueError, EOFError, lzma.LZMAError):
+                    # unreadable files are still listed, without counts
+                    metadata = plan_metadata({})
+                    metadata["error"] = "unreadable"
+                entries[name] = self._entry(name, path, stat, metadata)
+                changed = True
+            for name in [name for name in entries if name not in seen]:
+                del entries[name]
+                changed = True
+            if changed:
+                self._store()
+            return [{k: v for k, v in entry.items() if k != "mtime_ns"} for entry in entries.values()]
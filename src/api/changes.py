@@ -0,0 +1,152 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from src.models.seating_plan import SeatingPlan
+
+# Versions kept for catching up with GET .../changes?since=<version>; clients that
+# fall further behind get 410 Gone and must reload the plan
+MAX_VERSIONS = 10_000
+
+
+class ChangeLog:
+    """
+    Versioned mutation events of one plan.
+
+    Each write request that changes the plan appends one entry: the plan version it
+    produced and the list of events describing the change. Event types:
+
+    - section_added / section_removed: {"section"}; a section replaced by a new object
+      (e.g. by loading a project) is reported as removed and added again
+    - section_renamed: {"section", "old_name"}
+    - section_changed: {"section", "seats_added", "seats_removed", "is_ga"}, seats as
+      [row, seat_number] pairs
+    - plan_renamed: {"name"}
+    """
+
+    def __init__(self, max_versions: int = MAX_VERSIONS) -> None:
+        self._entries: "deque[Tuple[int, List[dict]]]" = deque(maxlen=max_versions)
+        # version before the oldest retained entry; "since" older than this is unknown
+        self._floor: int = 0
+        # plan version the log is up to date with (lags PlanHandle.version until commit)
+        self.version: int = 0
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    # ---- Recording (called with the plan's write lock held) ----
+    def begin(self, plan: SeatingPlan) -> dict:
+        """Snapshot the plan before a write and start tracking seat changes."""
+        for section in plan.sections.values():
+            section.track_changes()
+        return {
+            "name": plan.name,
+            "sections": {id(section): (name, section, section.is_ga) for name, section in plan.sections.items()},
+        }
+
+    def commit(self, plan: SeatingPlan, version: int, snapshot: dict) -> List[dict]:
+        """Turn the differences since begin() into events recorded under 'version'; returns them."""
+        events = snapshot["events"] if "events" in snapshot else _events(plan, snapshot)
+        with self._lock:
+            self.version = version
+            if not events:
+                return events
+            if len(self._entries) == self._entries.maxlen:
+                self._floor = self._entries[0][0]
+            self._entries.append((version, events))
+            waiters, self._waiters = self._waiters, []
+        self._notify(waiters)
+        return events
+
+    @staticmethod
+    def unchanged(plan: SeatingPlan, snapshot: dict) -> bool:
+        """
+        Whether the plan is as it was at begin() (e.g. a failed write that was rolled
+        back). Ends seat tracking; commit() reuses the differences found.
+        """
+        snapshot["events"] = _events(plan, snapshot)
+        return not snapshot["events"]
+
+    @staticmethod
+    def _notify(waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]) -> None:
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # the subscriber's loop has been closed
+                pass
+
+    def reset(self, version: int) -> None:
+        """Forget all entries and continue at 'version'; clients behind it must reload."""
+        with self._lock:
+            self._entries.clear()
+            self._floor = self.version = version
+            waiters, self._waiters = self._waiters, []
+        self._notify(waiters)
+
+    # ---- Reading ----
+    def since(self, version: int) -> Tuple[int, Optional[List[dict]]]:
+        """
+        The current version and the events after 'version', each tagged with its
+        version. Events are None when they are no longer retained (or 'version' is
+        ahead of the log, e.g. from before the plan was reloaded).
+        """
+        with self._lock:
+            if version < self._floor or version > self.version:
+                return self.version, None
+            return self.version, [
+                dict(event, version=entry_version)
+                for entry_version, events in self._entries
+                if entry_version > version
+                for event in events
+            ]
+
+    def subscribe(self) -> asyncio.Event:
+        """An event set (once) when the next entry is recorded; call from the event loop."""
+        event = asyncio.Event()
+        with self._lock:
+            self._waiters.append((asyncio.get_running_loop(), event))
+        return event
+
+    def unsubscribe(self, event: asyncio.Event) -> None:
+        with self._lock:
+            self._waiters = [(loop, e) for loop, e in self._waiters if e is not event]
+
+
+def _seat_list(seats) -> List[List[str]]:
+    return [[row, seat_number] for row, seat_number in seats]
+
+
+def _events(plan: SeatingPlan, snapshot: dict) -> List[dict]:
+    """
+    Events in the order a client should apply them: removals, renames (applied
+    together), additions, then seat changes.
+    """
+    before: Dict[int, tuple] = snapshot["sections"]
+    removed, renamed, added, changed = [], [], [], []
+    current = {id(section) for section in plan.sections.values()}
+    for key, (name, section, _) in before.items():
+        if key not in current:
+            section.pop_changes()
+            removed.append({"type": "section_removed", "section": name})
+    for name, section in plan.sections.items():
+        entry = before.get(id(section))
+        if entry is None:
+            added.append({"type": "section_added", "section": name})
+            continue
+        old_name, _, old_is_ga = entry
+        if old_name != name:
+            renamed.append({"type": "section_renamed", "section": name, "old_name": old_name})
+        seats_added, seats_removed = section.pop_changes()
+        if seats_added or seats_removed or old_is_ga != section.is_ga:
+            changed.append({
+                "type": "section_changed",
+                "section": name,
+                "seats_added": _seat_list(seats_added),
+                "seats_removed": _seat_list(seats_removed),
+                "is_ga": section.is_ga,
+            })
+    events = removed + renamed + added + changed
+    if plan.name != snapshot["name"]:
+        events.insert(0, {"type": "plan_renamed", "name": plan.name})
+    return events
@@ -1,21 +1,166 @@
-from typing import Callable
+from typing import Callable, Optional
+
+import anyio
+from fastapi import Depends, HTTPException
 
 from src.models.seating_plan import SeatingPlan
+from src.api.registry import PlanHandle, PlanRegistry
+from src.api.jobs import JobRunner
+from src.api.shared import StalePlan
+
+
+# Dependency providers for the plan registry.
+# The registry lives on module-level here and routes get plans through these
+# injectors so they don't need to import `main`, avoiding circular imports.
+# Routes mounted under /api/projects/{project_id}/... receive that project's
+# plan; the legacy /api/... mounts (no project in the path) use the default plan.
+_registry: PlanRegistry | None = None
+
+
+def init_registry(registry: PlanRegistry) -> None:
+	global _registry
+	_registry = registry
+
+
+_jobs: JobRunner | None = None
+
+
+def init_jobs(jobs: JobRunner) -> None:
+	global _jobs
+	_jobs = jobs
 
 
-# Dependency provider for the global SeatingPlan instance.
-# We keep the instance on module-level here and provide an injector
-# so routes don't need to import `main`, avoiding circular imports.
-_plan: SeatingPlan | None = None
+def get_jobs() -> JobRunner:
+	if _jobs is None:
+		raise RuntimeError("JobRunner has not been initialized. Call init_jobs() during app startup.")
+	return _jobs
 
 
 def init_plan(plan: SeatingPlan) -> None:
-	global _plan
-	_plan = plan
+	"""Set the default plan served by the routes that have no project in the path."""
+	get_registry().default.plan = plan
+
+
+def get_registry() -> PlanRegistry:
+	if _registry is None:
+		raise RuntimeError("PlanRegistry has not been initialized. Call init_registry() during app startup.")
+	return _registry
+
+
+# Paths under /api/projects/ taken by the routes of the default plan and the project
+# list (routes/projects.py); a project with one of these IDs could not be reached
+RESERVED_PROJECT_IDS = frozenset({"list", "load", "new", "save"})
+
+
+def check_project_id(project_id: Optional[str]) -> None:
+	if project_id in RESERVED_PROJECT_IDS:
+		raise HTTPException(status_code=400, detail=f"'{project_id}' is reserved and cannot be used as a project ID")
+
+
+def get_handle(project_id: Optional[str] = None) -> PlanHandle:
+	check_project_id(project_id)
+	try:
+		return get_registry().get(project_id)
+	except KeyError:
+		raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found")
+
+
+def get_plan(project_id: Optional[str] = None) -> SeatingPlan:
+	return get_handle(project_id).plan
+
+
+# ---- Per-plan locking ----
+# Read routes share a plan, write routes get it exclusively. Waiting for the lock
+# happens on a dedicated thread (fresh limiter per call, as FastAPI does for
+# dependency exits) so blocked requests never tie up the threadpool that the
+# lock holder needs to run its own handler.
+
+async def _acquire(acquire: Callable[[], None]) -> None:
+	await anyio.to_thread.run_sync(acquire, limiter=anyio.CapacityLimiter(1))
+
+
+async def _refreshed(handle: PlanHandle, project_id: Optional[str]) -> PlanHandle:
+	"""Pick up writes made by other workers to a shared plan (no-op for unshared plans)."""
+	while handle.shared is not None:
+		try:
+			await anyio.to_thread.run_sync(handle.shared.refresh, handle)
+			return handle
+		except StalePlan:
+			get_registry().discard(project_id)
+			handle = await anyio.to_thread.run_sync(get_handle, project_id)
+	return handle
+
+
+async def _locked_handle(handle: PlanHandle, project_id: Optional[str], write: bool) -> PlanHandle:
+	registry = get_registry()
+	while True:
+		if not write:
+			# writes sync in begin_write
+			handle = await _refreshed(handle, project_id)
+		lock = handle.lock
+		await _acquire(lock.acquire_write if write else lock.acquire_read)
+		if registry.is_current(handle):
+			return handle
+		# evicted or replaced while we waited: retry on the current copy
+		if write:
+			lock.release_write()
+		else:
+			lock.release_read()
+		handle = await anyio.to_thread.run_sync(get_handle, project_id)
+
+
+async def fresh_handle(project_id: Optional[str] = None, handle: PlanHandle = Depends(get_handle)) -> PlanHandle:
+	"""
+	A plan's handle synced with other workers' writes, without holding its lock:
+	for long-lived readers such as event streams, which sync again as they go.
+	"""
+	return await _refreshed(handle, project_id)
+
+
+async def lock_for_read(handle: PlanHandle, project_id: Optional[str] = None) -> PlanHandle:
+	"""
+	Read-lock a plan from inside an async route that must release the lock before
+	its response is sent (read_handle holds it until the response is done). Returns
+	the handle to use; the caller releases it with handle.lock.release_read().
+	"""
+	return await _locked_handle(handle, project_id, write=False)
+
+
+async def read_handle(project_id: Optional[str] = None, handle: PlanHandle = Depends(get_handle)):
+	handle = await _locked_handle(handle, project_id, write=False)
+	try:
+		yield handle
+	finally:
+		handle.lock.release_read()
+
+
+async def write_handle(project_id: Optional[str] = None, handle: PlanHandle = Depends(get_handle)):
+	handle = await _locked_handle(handle, project_id, write=True)
+	try:
+		# in threads: shared plans wait for the store's write lock here
+		try:
+			snapshot = await anyio.to_thread.run_sync(handle.begin_write)
+		except StalePlan:
+			get_registry().discard(project_id)
+			raise HTTPException(status_code=409, detail="The plan was deleted or replaced meanwhile, fetch it again")
+		failed = False
+		try:
+			yield handle
+		except BaseException:
+			failed = True
+			raise
+		finally:
+			await anyio.to_thread.run_sync(handle.end_write, snapshot, failed)
+	finally:
+		handle.lock.release_write()
+
 
+async def read_plan(handle: PlanHandle = Depends(read_handle)) -> SeatingPlan:
+	return handle.plan
 
-def get_plan() -> SeatingPlan:
-	if _plan is None:
-		raise RuntimeError("SeatingPlan has not been initialized. Call init_plan() during app startup.")
-	return _plan
 
+# Writes end (and shared plans are committed to their store) before the response is
+# sent, so a failed commit is answered with an error and a client's next request,
+# whichever worker it reaches, sees its write.
+async def write_plan(handle: PlanHandle = Depends(write_handle, scope="function")) -> SeatingPlan:
+	return handle.plan
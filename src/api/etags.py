@@ -0,0 +1,47 @@
+from typing import Optional
+
+from fastapi import Request, Response
+
+from src.models.section import Section, seat_hash
+from src.api.registry import PlanHandle
+
+
+def plan_etag(handle: PlanHandle) -> str:
+    """Strong tag that changes after every write to the plan."""
+    return f'"{handle.epoch}-{handle.version}"'
+
+
+def section_etag(section: Section) -> str:
+    """
+    Weak tag derived from the section's content fingerprint, so edits to other
+    sections of the plan do not invalidate it.
+    """
+    tag = seat_hash(f"{section.name}\0{int(section.is_ga)}\0{section.fingerprint:016x}")
+    return f'W/"{tag:016x}"'
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against a tag (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = _opaque(etag)
+    return any(_opaque(candidate.strip()) == wanted for candidate in if_none_match.split(","))
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Set the ETag on the outgoing response; return a 304 response to send instead
+    when the client already has this version.
+    """
+    # "no-cache" lets browsers keep the body but revalidate it on every request
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
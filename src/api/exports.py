@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.models.seating_plan import SeatingPlan
+
+# Formats served by GET .../export/{format}: (media type, file extension)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "json": ("application/json", ".json"),
+    "csv": ("text/csv; charset=utf-8", ".csv"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx"),
+}
+
+DEFAULT_CACHE_BYTES = int(float(os.environ.get("EXPORT_CACHE_MB", "64")) * 1024 * 1024)
+
+
+# ---- Encoders ----
+# Each returns the export as a list of chunks, one per section where the format
+# allows it. They only read the plan, so callers hold its read lock.
+
+def encode_json(plan: SeatingPlan) -> List[bytes]:
+    """The project file format of SeatingPlan.export_project (compact), section by section."""
+    chunks = [b'{"seating_plan_name":' + json.dumps(plan.name, ensure_ascii=False).encode("utf-8") + b',"sections":[']
+    for index, section in enumerate(plan.sections.values()):
+        encoded = json.dumps(section.to_dict(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        chunks.append(b"," + encoded if index else encoded)
+    chunks.append(b"]}")
+    return chunks
+
+
+def _csv_lines(lines: List[list]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\r\n").writerows(lines)
+    return buffer.getvalue().encode("utf-8")
+
+
+def encode_csv(plan: SeatingPlan) -> List[bytes]:
+    """The Excel manifest (same columns and lines as export_to_excel) as CSV."""
+    # UTF-8 BOM so spreadsheet applications detect the encoding
+    chunks = [b"\xef\xbb\xbf" + _csv_lines([SeatingPlan.MANIFEST_HEADERS])]
+    for section in plan.sections.values():
+        chunks.append(_csv_lines(SeatingPlan.manifest_rows(section)))
+    return chunks
+
+
+def encode_xlsx(plan: SeatingPlan) -> List[bytes]:
+    """The Excel manifest of export_to_excel, built in memory with a write-only workbook."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Seating Plan")
+    ws.append(SeatingPlan.MANIFEST_HEADERS)
+    for section in plan.sections.values():
+        for line in SeatingPlan.manifest_rows(section):
+            ws.append(line)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return [buffer.getvalue()]
+
+
+ENCODERS = {"json": encode_json, "csv": encode_csv, "xlsx": encode_xlsx}
+
+
+class ExportCache:
+    """
+    Encoded exports keyed by (plan epoch, plan version, format), least recently used
+    dropped first once max_bytes is exceeded. A write to a plan bumps its version,
+    so stale entries are never served; they simply age out.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.max_bytes: int = max_bytes
+        self._entries: "OrderedDict[tuple, List[bytes]]" = OrderedDict()
+        self._size: int = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[List[bytes]]:
+        with self._lock:
+            chunks = self._entries.get(key)
+            if chunks is not None:
+                self._entries.move_to_end(key)
+            return chunks
+
+    def put(self, key: tuple, chunks: List[bytes]) -> None:
+        size = sum(len(chunk) for chunk in chunks)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = chunks
+            self._size += size
+            while self._size > self.max_bytes:
+                _, dropped = self._entries.popitem(last=False)
+                self._size -= sum(len(chunk) for chunk in dropped)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_default_cache: Optional[ExportCache] = None
+
+
+def get_export_cache() -> ExportCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ExportCache()
+    return _default_cache
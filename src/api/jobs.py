@@ -0,0 +1,195 @@
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Finished jobs are forgotten once this many newer jobs exist
+MAX_JOBS = 500
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    """A background task (project save, load, import ...) and its progress."""
+
+    def __init__(self, kind: str, project: Optional[str]) -> None:
+        self.id: str = secrets.token_hex(8)
+        self.kind: str = kind
+        self.project: Optional[str] = project
+        # pending -> running -> done | failed
+        self.status: str = "pending"
+        self.progress: float = 0.0
+        self.stage: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        # requests answered by this job instead of starting their own
+        self.coalesced: int = 0
+        self.created: float = time.time()
+        self.finished: Optional[float] = None
+        self._done = threading.Event()
+        # orders the statuses published to a mirror (see JobRunner._publish)
+        self._publish_lock = threading.Lock()
+
+    def update(self, progress: float, stage: Optional[str] = None) -> None:
+        self.progress = min(max(progress, 0.0), 1.0)
+        if stage is not None:
+            self.stage = stage
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "project": self.project,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "stage": self.stage,
+            "result": self.result,
+            "error": self.error,
+            "coalesced": self.coalesced,
+            "created": self.created,
+            "finished": self.finished,
+        }
+
+
+class JobRunner:
+    """
+    Runs jobs on a small thread pool, off the event loop and the request threads.
+
+    Jobs sharing a 'key' (e.g. the plan they read or write) run one at a time in
+    submission order. A coalescing job that is still waiting to start absorbs later
+    submissions of the same kind and key, so a burst of saves produces one write of
+    the latest state.
+    """
+
+    def __init__(self, max_workers: int = 4, max_jobs: int = MAX_JOBS, mirror: Any = None) -> None:
+        self.max_jobs: int = max_jobs
+        # where job statuses are published for other API workers (shared.SharedPlans)
+        self.mirror = mirror
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plan-job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._waiting: Dict[Tuple[str, Hashable, Hashable], Job] = {}
+        # jobs not yet started, per key; a key is present while one of its jobs runs
+        self._queues: Dict[Hashable, "deque[Tuple[Job, Callable[[Job], Any], Optional[tuple]]]"] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, project: Optional[str], fn: Callable[[Job], Any],
+               key: Hashable = None, coalesce: Hashable = None) -> Job:
+        """
+        Queue fn(job); its return value becomes job.result. Jobs with the same 'key'
+        run one after another. With 'coalesce' set, a waiting job of the same kind,
+        key and coalesce value is returned instead of queueing a new one.
+        """
+        waiting_key = (kind, key, coalesce) if coalesce is not None else None
+        with self._lock:
+            job = self._waiting.get(waiting_key) if waiting_key is not None else None
+            queued = job is not None
+            if queued:
+                job.coalesced += 1
+            else:
+                job = Job(kind, project)
+                self._jobs[job.id] = job
+                self._forget_old()
+                if waiting_key is not None:
+                    self._waiting[waiting_key] = job
+        # published outside self._lock: a slow mirror must not hold up other
+        # submissions, and the job is queued only after it has been reported pending
+        self._publish(job)
+        if queued:
+            return job
+        with self._lock:
+            idle = key not in self._queues
+            self._queues.setdefault(key, deque()).append((job, fn, waiting_key))
+        if idle:
+            self._executor.submit(self._drain, key)
+        return job
+
+    def _drain(self, key: Hashable) -> None:
+        """
+        Run the jobs queued under 'key' in order until none is left. Only one worker
+        drains a key at a time, so later jobs of a busy key wait in the queue rather
+        than occupying pool threads.
+        """
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                job, fn, waiting_key = queue.popleft()
+                if waiting_key is not None and self._waiting.get(waiting_key) is job:
+                    del self._waiting[waiting_key]
+            self._run(job, fn)
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]) -> None:
+        try:
+            job.status = "running"
+            self._publish(job)
+            job.result = fn(job)
+            job.update(1.0)
+            job.status = "done"
+        except Exception as e:
+            job.error = str(e) or e.__class__.__name__
+            job.status = "failed"
+        finally:
+            job.finished = time.time()
+            try:
+                self._publish(job)
+            finally:
+                job._done.set()
+
+    def _publish(self, job: Job) -> None:
+        """
+        Report a job's status to the mirror. Failures are logged, not raised: the
+        job itself and the queue of its key carry on.
+        """
+        if self.mirror is None:
+            return
+        with job._publish_lock:
+            # the status is read under the lock, so a stale one never lands last
+            try:
+                self.mirror.put_job(job.to_dict())
+            except Exception:
+                logger.exception("Publishing the status of job %s failed", job.id)
+
+    def _forget_old(self) -> None:
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.done][:max(excess, 0)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def status(self, job_id: str) -> Optional[dict]:
+        """A job's to_dict(), also for jobs run by other workers when mirrored."""
+        job = self.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        return self.mirror.get_job(job_id) if self.mirror is not None else None
+
+    def statuses(self) -> List[dict]:
+        """to_dict() of the recent jobs (of all workers when mirrored), oldest first."""
+        local = [job.to_dict() for job in self.list()]
+        if self.mirror is None:
+            return local
+        jobs = {job["job_id"]: job for job in self.mirror.list_jobs()}
+        jobs.update((job["job_id"], job) for job in local)
+        return sorted(jobs.values(), key=lambda job: job["created"])
+
+    def shutdown(self) -> None:
+        """Finish queued jobs and stop the workers."""
+        self._executor.shutdown(wait=True)
@@ -1,11 +1,31 @@
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+
+from contextlib import asynccontextmanager
 
 from src.models.seating_plan import SeatingPlan
-from .routes import sections, seats, projects
-from .dependencies import init_plan
+from .routes import batch, changes, exports, imports, jobs, sections, seats, projects
+from .dependencies import get_jobs, get_registry, init_jobs, init_plan, init_registry
+from .jobs import JobRunner
+from . import metrics
+from .registry import PlanRegistry
+from .shared import SHARED_PLANS, SharedPlans
+from .sqlite_storage import SqliteBackend
+from . import storage
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	yield
+	# let queued saves finish, then persist modified project plans before the worker exits
+	get_jobs().shutdown()
+	get_registry().flush_all()
+
 
-app = FastAPI(title="Seating Plan API")
+app = FastAPI(title="Seating Plan API", lifespan=lifespan)
 
 # Allow local frontend during development
 app.add_middleware(
@@ -14,18 +34,48 @@ app.add_middleware(
 	allow_credentials=True,
 	allow_methods=["*"],
 	allow_headers=["*"],
+	expose_headers=["ETag", "X-Next-Cursor", "Content-Disposition"],
 )
+# Request counts, latency and response sizes per route, served at /metrics
+app.add_middleware(metrics.MetricsMiddleware)
+# A tracing span per request while tracing is on (SEATING_TRACE, see src/utils/tracing.py)
+app.add_middleware(metrics.TracingMiddleware)
 
-# Global in-memory seating plan instance for this process
-seating_plan = SeatingPlan()
+# With SHARED_PLANS set, plans live in the SQLite store and every worker process
+# keeps a coherent in-memory copy (see shared.py), so several workers can run
+shared_plans = None
+if SHARED_PLANS:
+	backend = storage.get_backend()
+	if not isinstance(backend, SqliteBackend):
+		raise RuntimeError("SHARED_PLANS needs STORAGE_BACKEND=sqlite")
+	shared_plans = SharedPlans(backend)
 
-# initialize dependency module with our global instance
-init_plan(seating_plan)
+# Registry of per-project plans (loaded on demand, LRU-evicted)
+registry = PlanRegistry(shared=shared_plans)
+init_registry(registry)
+
+# Background save/load jobs
+job_runner = JobRunner(mirror=shared_plans)
+init_jobs(job_runner)
+
+if shared_plans is None:
+	# Default in-memory seating plan for the routes without a project in the path
+	seating_plan = SeatingPlan()
+
+	# initialize dependency module with our global instance
+	init_plan(seating_plan)
 
 
-app.include_router(sections.router, prefix="/api/sections", tags=["sections"], dependencies=[],)
-app.include_router(seats.router, prefix="/api/seats", tags=["seats"], dependencies=[],)
 app.include_router(projects.router, prefix="/api/projects", tags=["projects"], dependencies=[],)
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"], dependencies=[],)
+# Plan routes are served both for the default plan and per project
+for plan_prefix in ("/api", "/api/projects/{project_id}"):
+	app.include_router(sections.router, prefix=f"{plan_prefix}/sections", tags=["sections"], dependencies=[],)
+	app.include_router(seats.router, prefix=f"{plan_prefix}/seats", tags=["seats"], dependencies=[],)
+	app.include_router(batch.router, prefix=plan_prefix, tags=["batch"], dependencies=[],)
+	app.include_router(changes.router, prefix=plan_prefix, tags=["changes"], dependencies=[],)
+	app.include_router(imports.router, prefix=plan_prefix, tags=["import"], dependencies=[],)
+	app.include_router(exports.router, prefix=plan_prefix, tags=["export"], dependencies=[],)
 
 
 @app.get("/", tags=["root"])
@@ -33,8 +83,16 @@ def root():
 	return {"status": "ok", "message": "Seating Plan API"}
 
 
+@app.get("/metrics", tags=["root"], response_class=PlainTextResponse)
+def get_metrics():
+	"""Metrics of this worker process in the Prometheus text format."""
+	return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 if __name__ == "__main__":
 	import uvicorn
 
-	uvicorn.run("src.api.main:app", host="0.0.0.0", port=8000, reload=True)
+	# several workers need SHARED_PLANS=1 and STORAGE_BACKEND=sqlite
+	workers = int(os.environ.get("API_WORKERS", "1"))
+	uvicorn.run("src.api.main:app", host="0.0.0.0", port=8000, reload=workers == 1, workers=workers)
 
@@ -0,0 +1,257 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from src.utils import tracing
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """A monotonically increasing value per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()) -> None:
+        self.name: str = name
+        self.help: str = help
+        self.labels: Tuple[str, ...] = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(labels[name] for name in self.labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in values]
+
+
+class Histogram:
+    """Observations counted into cumulative buckets, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.name: str = name
+        self.help: str = help
+        self.labels: Tuple[str, ...] = tuple(labels)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # per label combination: [count per bucket (non-cumulative) + overflow, sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(tuple(labels[name] for name in self.labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        lines = []
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = _format_labels(self.labels, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """Values read when the metrics are rendered, from collect() -> {label values: value}."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, collect: Callable[[], Dict[Tuple[str, ...], float]],
+                 labels: Iterable[str] = ()) -> None:
+        self.name: str = name
+        self.help: str = help
+        self.labels: Tuple[str, ...] = tuple(labels)
+        self.collect = collect
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+                for key, value in sorted(self.collect().items())]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics: list = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUESTS = REGISTRY.add(Counter(
+    "seating_http_requests_total", "HTTP requests handled, by route template and status.",
+    ("method", "route", "status")))
+REQUEST_SECONDS = REGISTRY.add(Histogram(
+    "seating_http_request_duration_seconds", "Time from request to the end of the response body.",
+    ("method", "route")))
+RESPONSE_BYTES = REGISTRY.add(Histogram(
+    "seating_http_response_size_bytes", "Response body sizes.", ("method", "route"), buckets=SIZE_BUCKETS))
+OPERATION_SECONDS = REGISTRY.add(Histogram(
+    "seating_operation_duration_seconds",
+    "Serialization and persistence steps (serialize, save, load, export_*, import_*).", ("operation",)))
+
+
+def _plan_handles():
+    # imported here: the dependencies module pulls in the whole API
+    from src.api.dependencies import get_registry
+
+    try:
+        registry = get_registry()
+    except RuntimeError:
+        return []
+    return [registry.default] + registry.loaded()
+
+
+def _plan_counts() -> Tuple[int, int]:
+    sections = seats = 0
+    for handle in _plan_handles():
+        # list() snapshots the dict atomically, like PlanHandle.estimated_bytes
+        for section in list(handle.plan.sections.values()):
+            sections += 1
+            seats += len(section.seats)
+    return sections, seats
+
+
+REGISTRY.add(Gauge("seating_plans_in_memory", "Project plans loaded in the registry (plus the default plan).",
+                   lambda: {(): len(_plan_handles())}))
+REGISTRY.add(Gauge("seating_sections_in_memory", "Sections of the plans in memory.",
+                   lambda: {(): _plan_counts()[0]}))
+REGISTRY.add(Gauge("seating_seats_in_memory", "Seats of the plans in memory.",
+                   lambda: {(): _plan_counts()[1]}))
+
+
+@contextmanager
+def timed(operation: str):
+    """Record how long the block takes in seating_operation_duration_seconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        OPERATION_SECONDS.observe(time.perf_counter() - start, operation=operation)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware counting requests per route template (e.g.
+    /api/sections/{name}), with latency and response size histograms. Timing
+    ends with the last body chunk, so streamed responses are measured in full.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "<unmatched>"
+            method = scope["method"]
+            REQUESTS.inc(method=method, route=template, status=str(status))
+            REQUEST_SECONDS.observe(time.perf_counter() - start, method=method, route=template)
+            RESPONSE_BYTES.observe(size, method=method, route=template)
+
+
+class TracingMiddleware:
+    """
+    Opens a tracing span (src/utils/tracing.py) per request, named after the
+    method and route template, as the parent of the spans of the model code the
+    handler runs. Passes requests straight through while tracing is off.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracing.is_enabled():
+            await self.app(scope, receive, send)
+            return
+        with tracing.span(f"{scope['method']} {scope['path']}") as span:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.name = f"{scope['method']} {route}"
+                    span.args["path"] = scope["path"]
+
+
+def render() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,252 @@
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.models.seating_plan import SeatingPlan
+from src.api import storage
+from src.api.changes import ChangeLog
+from src.api.shared import StalePlan
+from src.utils.rwlock import RWLock
+
+if TYPE_CHECKING:
+    from src.api.shared import SharedPlans
+
+# Rough in-memory cost of a seat (Seat object, "ROW-SEAT" key, dict slot) and of an
+# empty section; used to keep the registry under its memory budget.
+BYTES_PER_SEAT = 300
+BYTES_PER_SECTION = 2_000
+
+DEFAULT_MEMORY_BUDGET = int(float(os.environ.get("PLAN_REGISTRY_MEMORY_MB", "512")) * 1024 * 1024)
+
+
+class PlanHandle:
+    """A plan held in memory by the registry, plus its bookkeeping."""
+
+    def __init__(self, project_id: Optional[str], plan: SeatingPlan, pinned: bool = False) -> None:
+        self.project_id: Optional[str] = project_id
+        self.plan: SeatingPlan = plan
+        # pinned handles (the legacy default plan) are never evicted or flushed
+        self.pinned: bool = pinned
+        # readers share the plan, writers get it exclusively (see dependencies.read_plan)
+        self.lock: RWLock = RWLock()
+        # bumped after every write request; 'epoch' tells apart copies of the same
+        # project reloaded after eviction, whose versions restart at 0
+        self.version: int = 0
+        self.epoch: str = secrets.token_hex(4)
+        # mutation events for live clients (routes/changes.py)
+        self.changes: ChangeLog = ChangeLog()
+        self.last_used: float = time.monotonic()
+        self._saved_state: Optional[Tuple[str, int]] = None
+        # set when API workers share plans through a store (see src/api/shared.py):
+        # the store revision mirrored, digests of the stored sections and the store
+        # transaction of the write in progress
+        self.shared: Optional["SharedPlans"] = None
+        self.revision: Optional[int] = None
+        self.digests: Dict[str, bytes] = {}
+        self.session = None
+
+    @property
+    def job_key(self) -> tuple:
+        """Key under which background jobs on this plan are serialized (see jobs.JobRunner)."""
+        return ("project", self.project_id) if self.project_id else ("default",)
+
+    def touch(self) -> None:
+        self.last_used = time.monotonic()
+
+    def mark_saved(self, state: Optional[Tuple[str, int]] = None) -> None:
+        """Record the plan as saved; 'state' is the saved_state() taken when it was serialized."""
+        self._saved_state = state or self.saved_state()
+
+    def saved_state(self) -> Tuple[str, int]:
+        return (self.plan.name, self.plan.fingerprint)
+
+    # ---- Writes ----
+    # Every write holds the write lock between begin_write() and end_write(), which
+    # bump the version and record change events (and write shared plans to their store).
+    # A write that failed and left the plan unchanged is dropped: the version stays.
+    def begin_write(self) -> dict:
+        if self.shared is not None:
+            self.shared.begin_write(self)
+        return self.changes.begin(self.plan)
+
+    def end_write(self, snapshot: dict, failed: bool = False) -> None:
+        if failed and self.changes.unchanged(self.plan, snapshot):
+            if self.shared is not None:
+                self.shared.abort_write(self)
+            return
+        if self.shared is not None:
+            self.shared.end_write(self, snapshot)
+            return
+        self.version += 1
+        self.changes.commit(self.plan, self.version, snapshot)
+
+    @contextmanager
+    def write(self):
+        """Modify the plan outside a request (background jobs)."""
+        with self.lock.write():
+            snapshot = self.begin_write()
+            failed = False
+            try:
+                yield self.plan
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self.end_write(snapshot, failed)
+
+    @property
+    def dirty(self) -> bool:
+        return self._saved_state != self.saved_state()
+
+    def estimated_bytes(self) -> int:
+        # list() snapshots the dict atomically, so this is safe without the plan lock
+        sections = list(self.plan.sections.values())
+        seats = sum(len(section.seats) for section in sections)
+        return seats * BYTES_PER_SEAT + len(sections) * BYTES_PER_SECTION
+
+
+class PlanRegistry:
+    """
+    Plans keyed by project ID, loaded on demand from the projects directory.
+
+    When the estimated size of the loaded plans exceeds memory_budget, the least
+    recently used plans are flushed to disk (if modified) and dropped. The most
+    recently requested plan is always kept, however large it is.
+    """
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, shared: Optional["SharedPlans"] = None) -> None:
+        self.memory_budget: int = memory_budget
+        # plans shared with other API workers through a store (multi-worker deployments)
+        self.shared: Optional["SharedPlans"] = shared
+        self.default: PlanHandle = PlanHandle(None, SeatingPlan(), pinned=True)
+        if shared is not None:
+            shared.attach(self.default)
+        self._plans: "OrderedDict[str, PlanHandle]" = OrderedDict()
+        self._lock = threading.Lock()
+        # serializes writes of project files, so a background save of an older
+        # snapshot cannot land after a flush of newer state
+        self.save_lock = threading.Lock()
+
+    # ---- Lookup ----
+    def get(self, project_id: Optional[str] = None) -> PlanHandle:
+        """Return the handle for a project. Raises KeyError if it is not saved or loaded."""
+        if project_id is None:
+            return self.default
+        with self._lock:
+            handle = self._plans.get(project_id)
+            if handle is not None:
+                self._plans.move_to_end(project_id)
+                handle.touch()
+                return handle
+        try:
+            loaded = self._load(project_id)
+        except FileNotFoundError:
+            raise KeyError(project_id)
+        with self._lock:
+            handle = self._plans.get(project_id)
+            if handle is None:
+                handle = loaded
+                self._plans[project_id] = handle
+            else:
+                # loaded concurrently by another request; keep the first copy
+                self._plans.move_to_end(project_id)
+                handle.touch()
+        self.evict()
+        return handle
+
+    def _load(self, project_id: str) -> PlanHandle:
+        if self.shared is not None:
+            handle = self.shared.attach(PlanHandle(project_id, SeatingPlan(project_id)))
+            try:
+                self.shared.refresh(handle)
+            except StalePlan:
+                raise FileNotFoundError(f"Project '{project_id}' not found")
+            return handle
+        handle = PlanHandle(project_id, storage.load_plan(project_id))
+        handle.mark_saved()
+        return handle
+
+    def create(self, project_id: str, plan: Optional[SeatingPlan] = None) -> PlanHandle:
+        """Register a new (unsaved) plan, replacing any in-memory copy."""
+        handle = PlanHandle(project_id, plan or SeatingPlan(project_id))
+        if self.shared is not None:
+            # other workers must see it too, so it is stored right away
+            self.shared.create(handle)
+        with self._lock:
+            self._plans[project_id] = handle
+        self.evict()
+        return handle
+
+    def exists(self, project_id: str) -> bool:
+        with self._lock:
+            if project_id in self._plans:
+                return True
+        return storage.project_exists(project_id)
+
+    def peek(self, project_id: str) -> Optional[PlanHandle]:
+        """The in-memory handle of a project, or None; never loads it."""
+        with self._lock:
+            return self._plans.get(project_id)
+
+    def discard(self, project_id: str) -> None:
+        """Drop a plan from memory without saving it."""
+        with self._lock:
+            self._plans.pop(project_id, None)
+
+    def is_current(self, handle: PlanHandle) -> bool:
+        """False once the handle has been evicted or replaced."""
+        if handle.pinned:
+            return True
+        with self._lock:
+            return self._plans.get(handle.project_id) is handle
+
+    def loaded(self) -> List[PlanHandle]:
+        with self._lock:
+            return list(self._plans.values())
+
+    # ---- Persistence ----
+    def flush(self, handle: PlanHandle, compression: Optional[str] = None, force: bool = False) -> bool:
+        """Write a plan to disk if it changed since it was loaded or last flushed."""
+        if handle.pinned or handle.project_id is None:
+            return False
+        with handle.lock.read():
+            return self._flush_locked(handle, compression, force)
+
+    def _flush_locked(self, handle: PlanHandle, compression: Optional[str] = None, force: bool = False) -> bool:
+        if not force and not handle.dirty:
+            return False
+        with self.save_lock:
+            if compression is None:
+                compression = storage.saved_compression(handle.project_id)
+            storage.save_plan(handle.project_id, handle.plan, compression)
+        handle.mark_saved()
+        return True
+
+    def flush_all(self) -> None:
+        for handle in self.loaded():
+            self.flush(handle)
+
+    def evict(self) -> None:
+        """Flush and drop least recently used plans until the budget is met."""
+        with self._lock:
+            handles = list(self._plans.values())
+        total = sum(h.estimated_bytes() for h in handles)
+        # handles are ordered least recently used first; never evict the newest
+        for handle in handles[:-1]:
+            if total <= self.memory_budget:
+                break
+            # plans in use by a request are skipped rather than waited for
+            if not handle.lock.try_acquire_write():
+                continue
+            try:
+                self._flush_locked(handle)
+                with self._lock:
+                    if self._plans.get(handle.project_id) is handle:
+                        del self._plans[handle.project_id]
+                        total -= handle.estimated_bytes()
+            finally:
+                handle.lock.release_write()
@@ -0,0 +1,141 @@
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+from src.api.schemas import BatchRequest, BatchResponse
+from src.api.dependencies import write_plan
+from src.api.routes.sections import selected_seat_keys
+
+router = APIRouter()
+
+
+class BatchError(Exception):
+	def __init__(self, status_code: int, message: str) -> None:
+		super().__init__(message)
+		self.status_code = status_code
+		self.message = message
+
+
+class _Journal:
+	"""
+	Undo information for a batch: the plan's name and section order, and a pristine
+	copy of each section taken just before the batch first modifies it. Sections the
+	batch never touches are not copied.
+
+	Rolling back restores the copies' state into the plan's own Section objects, so
+	a failed batch leaves nothing for the change log to report.
+	"""
+
+	def __init__(self, plan: SeatingPlan) -> None:
+		self.plan = plan
+		self.name = plan.name
+		self.order: List[Tuple[str, Section]] = list(plan.sections.items())
+		self.originals: Dict[int, Tuple[Section, Section]] = {}
+
+	def touch(self, section: Section) -> None:
+		if id(section) not in self.originals:
+			original = section.clone()
+			original.name = section.name
+			original.is_ga = section.is_ga
+			self.originals[id(section)] = (section, original)
+
+	def rollback(self) -> None:
+		for section, original in self.originals.values():
+			section.name = original.name
+			section.is_ga = original.is_ga
+			section.restore(original)
+		self.plan.name = self.name
+		self.plan.sections.clear()
+		for name, section in self.order:
+			self.plan.sections[name] = section
+
+
+def _section(plan: SeatingPlan, name: str, journal: Optional[_Journal] = None) -> Section:
+	section = plan.sections.get(name)
+	if section is None:
+		raise BatchError(404, f"Section '{name}' not found")
+	if journal is not None:
+		journal.touch(section)
+	return section
+
+
+def _apply(plan: SeatingPlan, op, journal: _Journal) -> dict:
+	if op.op == "add_seats":
+		section = _section(plan, op.section, journal)
+		before = len(section.seats)
+		for seat_number in op.seat_numbers:
+			section.add_seat(op.row, seat_number)
+		return {"added": len(section.seats) - before}
+
+	if op.op == "delete_seats":
+		section = _section(plan, op.section, journal)
+		before = len(section.seats)
+		for seat_number in op.seat_numbers:
+			section.delete_seat(op.row, seat_number)
+		return {"deleted": before - len(section.seats)}
+
+	if op.op == "add_row_range":
+		section = _section(plan, op.section, journal)
+		fields = op.model_dump(exclude={"op", "section"})
+		try:
+			rows = section.add_row_range(**fields)
+		except ValueError as e:
+			raise BatchError(400, str(e))
+		return {"rows_added": len(rows)}
+
+	if op.op == "delete_rows":
+		section = _section(plan, op.section, journal)
+		before = len(section.seats)
+		for row in op.rows:
+			section.delete_row(row)
+		return {"deleted": before - len(section.seats)}
+
+	if op.op == "move_seats":
+		section = _section(plan, op.section, journal)
+		if op.target == op.section:
+			raise BatchError(400, "Target is the source section")
+		if op.target not in plan.sections:
+			if not op.create_target:
+				raise BatchError(404, f"Section '{op.target}' not found")
+			plan.add_section(op.target)
+		target = _section(plan, op.target, journal)
+		return {"moved": section.transfer_to(target, selected_seat_keys(section, op))}
+
+	if op.op == "rename_section":
+		section = _section(plan, op.section, journal)
+		if op.new_name != op.section and op.new_name in plan.sections:
+			raise BatchError(409, f"Section '{op.new_name}' already exists")
+		plan.rename_section(op.section, op.new_name)
+		return {"name": op.new_name}
+
+	if op.op == "clone_section":
+		_section(plan, op.section)
+		if op.count < 1:
+			raise BatchError(400, "count must be at least 1")
+		return {"created": plan.clone_section_many(op.section, op.count)}
+
+	raise BatchError(400, f"Unknown operation '{op.op}'")
+
+
+@router.post("/batch", response_model=BatchResponse)
+def apply_batch(payload: BatchRequest, plan: SeatingPlan = Depends(write_plan)):
+	"""
+	Apply an ordered list of operations in one request, under a single write lock.
+
+	Either every operation succeeds, or the plan is rolled back to its state before
+	the batch and the error names the failing operation.
+	"""
+	journal = _Journal(plan)
+	results = []
+	for index, op in enumerate(payload.operations):
+		try:
+			results.append(_apply(plan, op, journal))
+		except BatchError as e:
+			journal.rollback()
+			raise HTTPException(status_code=e.status_code, detail={"index": index, "op": op.op, "error": e.message})
+		except Exception:
+			journal.rollback()
+			raise
+	return {"results": results}
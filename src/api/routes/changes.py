@@ -0,0 +1,136 @@
+import asyncio
+import json
+import time
+from itertools import groupby
+from typing import List, Optional, Tuple
+
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies import fresh_handle, get_registry, read_handle
+from src.api.registry import PlanHandle
+from src.api.shared import StalePlan
+
+router = APIRouter()
+
+# Seconds between comment lines on an idle stream, so proxies keep it open and
+# disconnected clients are noticed
+KEEPALIVE_SECONDS = 15.0
+
+# Seconds between checks for writes made by other API workers (shared plans only)
+SHARED_POLL_SECONDS = 1.0
+
+
+def _check_epoch(handle: PlanHandle, epoch: Optional[str]) -> None:
+	if epoch is not None and epoch != handle.epoch:
+		# the plan was reloaded since the client's version; versions restarted
+		raise HTTPException(status_code=410, detail="Plan was reloaded, fetch it again")
+
+
+@router.get("/changes")
+def get_changes(
+	since: int = Query(..., ge=0),
+	epoch: Optional[str] = None,
+	handle: PlanHandle = Depends(read_handle),
+):
+	"""
+	Events recorded after plan version 'since', for clients catching up after a
+	reconnect. Pass the 'epoch' from an earlier response to detect reloads of the
+	plan. 410 Gone means the events are no longer available: reload the plan.
+	"""
+	_check_epoch(handle, epoch)
+	version, events = handle.changes.since(since)
+	if events is None:
+		raise HTTPException(status_code=410, detail="Changes are no longer available, fetch the plan again")
+	return {"epoch": handle.epoch, "version": version, "events": events}
+
+
+def _sse(event: str, data: dict, event_id: Optional[str] = None) -> str:
+	lines = [f"id: {event_id}"] if event_id else []
+	lines += [f"event: {event}", f"data: {json.dumps(data, separators=(',', ':'))}"]
+	return "\n".join(lines) + "\n\n"
+
+
+def _resume_point(handle: PlanHandle, since: Optional[int], last_event_id: Optional[str]) -> Tuple[Optional[int], bool]:
+	"""(version to stream after, whether the client must reload the plan first)."""
+	if last_event_id:
+		# EventSource reconnects send back the id of the last message: "<epoch>-<version>"
+		epoch, _, version = last_event_id.rpartition("-")
+		if epoch != handle.epoch or not version.isdigit():
+			return None, True
+		return int(version), False
+	return since, False
+
+
+def _change_messages(handle: PlanHandle, events: List[dict]) -> List[str]:
+	messages = []
+	for version, group in groupby(events, key=lambda e: e["version"]):
+		payload = {"epoch": handle.epoch, "version": version, "events": list(group)}
+		messages.append(_sse("change", payload, f"{handle.epoch}-{version}"))
+	return messages
+
+
+@router.get("/changes/stream")
+async def stream_changes(
+	request: Request,
+	since: Optional[int] = Query(None, ge=0),
+	handle: PlanHandle = Depends(fresh_handle),
+):
+	"""
+	Server-sent events feed of the plan's changes.
+
+	Starts with a "hello" message carrying the current epoch and version, then sends
+	one "change" message per plan version (events as in GET .../changes). With
+	'since' (or a Last-Event-ID header on reconnect) missed changes are replayed
+	first. A "reset" message means the client must reload the plan and reconnect;
+	the stream ends after it.
+	"""
+	log = handle.changes
+	last, reset = _resume_point(handle, since, request.headers.get("last-event-id"))
+	timeout = SHARED_POLL_SECONDS if handle.shared is not None else KEEPALIVE_SECONDS
+
+	async def messages():
+		nonlocal last, reset
+		yield _sse("hello", {"epoch": handle.epoch, "version": log.version})
+		if last is None and not reset:
+			last = log.version
+		idle_since = time.monotonic()
+		while True:
+			waiter = log.subscribe()
+			try:
+				version, events = log.since(last) if not reset else (log.version, None)
+				if events is None:
+					yield _sse("reset", {"epoch": handle.epoch, "version": version})
+					return
+				for message in _change_messages(handle, events):
+					yield message
+					idle_since = time.monotonic()
+				last = version
+				try:
+					await asyncio.wait_for(waiter.wait(), timeout)
+				except asyncio.TimeoutError:
+					if await request.is_disconnected():
+						return
+					if not get_registry().is_current(handle):
+						# evicted from memory: later edits go to a reloaded copy
+						reset = True
+						continue
+					if handle.shared is not None:
+						# writes by other workers reach this log when the plan is synced
+						try:
+							await anyio.to_thread.run_sync(handle.shared.refresh, handle)
+						except StalePlan:
+							reset = True
+							continue
+					if handle.shared is None or time.monotonic() - idle_since >= KEEPALIVE_SECONDS:
+						idle_since = time.monotonic()
+						yield ": keepalive\n\n"
+			finally:
+				log.unsubscribe(waiter)
+
+	return StreamingResponse(
+		messages(),
+		media_type="text/event-stream",
+		headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+	)
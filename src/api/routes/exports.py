@@ -0,0 +1,63 @@
+import re
+from typing import List, Literal, Optional, Tuple, Union
+
+import anyio
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies import get_handle, lock_for_read
+from src.api.etags import etag_matches
+from src.api.exports import ENCODERS, EXPORT_FORMATS, ExportCache, get_export_cache
+from src.api.metrics import timed
+from src.api.registry import PlanHandle
+
+router = APIRouter()
+
+
+def _encode(handle: PlanHandle, fmt: str, if_none_match: Optional[str],
+			cache: ExportCache) -> Union[Response, Tuple[List[bytes], dict, str]]:
+	"""Encode (or fetch from the cache) the export; runs with the plan read-locked."""
+	etag = f'"{handle.epoch}-{handle.version}-{fmt}"'
+	headers = {"ETag": etag, "Cache-Control": "no-cache"}
+	if etag_matches(if_none_match, etag):
+		return Response(status_code=304, headers=headers)
+	key = (handle.epoch, handle.version, fmt)
+	chunks = cache.get(key)
+	headers["X-Export-Cache"] = "hit" if chunks is not None else "miss"
+	if chunks is None:
+		with timed(f"export_{fmt}"):
+			chunks = ENCODERS[fmt](handle.plan)
+		cache.put(key, chunks)
+	filename = re.sub(r"[^\w.-]+", "_", handle.plan.name).strip("_") or "seating_plan"
+	return chunks, headers, filename
+
+
+@router.get("/export/{fmt}")
+async def export_plan(
+	fmt: Literal["json", "csv", "xlsx"],
+	request: Request,
+	project_id: Optional[str] = None,
+	handle: PlanHandle = Depends(get_handle),
+	cache: ExportCache = Depends(get_export_cache),
+):
+	"""
+	Download the plan as a project JSON file or as an Excel/CSV manifest.
+
+	The export is encoded once per plan version and format; repeat downloads of an
+	unchanged plan are streamed from the cache (or answered 304 via If-None-Match).
+	"""
+	media_type, extension = EXPORT_FORMATS[fmt]
+	# wait for the read lock like read_handle does (not on a threadpool thread, which
+	# a queued writer may need), encode under it, and stream after releasing it so
+	# slow clients do not hold up writers
+	handle = await lock_for_read(handle, project_id)
+	try:
+		encoded = await anyio.to_thread.run_sync(_encode, handle, fmt, request.headers.get("if-none-match"), cache)
+	finally:
+		handle.lock.release_read()
+	if isinstance(encoded, Response):
+		return encoded
+	chunks, headers, filename = encoded
+	headers["Content-Disposition"] = f'attachment; filename="{filename}{extension}"'
+	headers["Content-Length"] = str(sum(len(chunk) for chunk in chunks))
+	return StreamingResponse(iter(chunks), media_type=media_type, headers=headers)
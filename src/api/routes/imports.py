@@ -0,0 +1,87 @@
+import os
+import tempfile
+from typing import Literal, Optional
+
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+
+from src.api.dependencies import get_handle, get_jobs, get_registry
+from src.api.jobs import Job, JobRunner
+from src.api.metrics import timed
+from src.api.registry import PlanHandle
+from src.utils.import_cache import cached_import
+
+router = APIRouter()
+
+# File suffix per importer (openpyxl picks its reader from the extension)
+IMPORT_SUFFIXES = {"excel": ".xlsx", "avail": ".xml"}
+
+MAX_UPLOAD_BYTES = int(float(os.environ.get("MAX_UPLOAD_MB", "200")) * 1024 * 1024)
+
+
+async def _receive_upload(request: Request, suffix: str) -> str:
+	"""Stream the request body to a temporary file and return its path."""
+	fd, path = tempfile.mkstemp(prefix="seating-import-", suffix=suffix)
+	os.close(fd)
+	size = 0
+	try:
+		async with await anyio.open_file(path, "wb") as f:
+			async for chunk in request.stream():
+				size += len(chunk)
+				if size > MAX_UPLOAD_BYTES:
+					raise HTTPException(status_code=413, detail="Upload too large")
+				await f.write(chunk)
+	except BaseException:
+		os.remove(path)
+		raise
+	if size == 0:
+		os.remove(path)
+		raise HTTPException(status_code=400, detail="Empty upload")
+	return path
+
+
+@router.post("/import/{importer}")
+async def import_file(
+	importer: Literal["excel", "avail"],
+	request: Request,
+	response: Response,
+	name: Optional[str] = None,
+	wait: bool = False,
+	handle: PlanHandle = Depends(get_handle),
+	jobs: JobRunner = Depends(get_jobs),
+):
+	"""
+	Replace the plan with an imported Excel manifest or Avail XML file.
+
+	Send the file as the raw request body. It is parsed by a background job (the
+	response is 202 with the job to poll at /api/jobs/{job_id}, or the finished job
+	with ?wait=true); files imported before are served from the import cache.
+	"""
+	path = await _receive_upload(request, IMPORT_SUFFIXES[importer])
+
+	def run(job: Job) -> dict:
+		try:
+			job.update(0.05, "parsing")
+			with timed(f"import_{importer}"):
+				plan = cached_import(path, importer)
+			job.update(0.9, "applying")
+			registry = get_registry()
+			# a project evicted while we parsed is reloaded, so the import is not lost
+			current = handle if registry.is_current(handle) else registry.get(handle.project_id)
+			with current.write() as target:
+				# without a 'name', the plan keeps its own
+				target.name = name or target.name
+				target.sections = plan.sections
+			seats = sum(len(section.seats) for section in plan.sections.values())
+			return {"name": target.name, "sections": len(plan.sections), "seats": seats}
+		finally:
+			os.remove(path)
+
+	job = jobs.submit("import", handle.project_id, run, key=handle.job_key)
+	if wait:
+		await anyio.to_thread.run_sync(job.wait)
+		if job.status == "failed":
+			raise HTTPException(status_code=422, detail=job.error)
+	else:
+		response.status_code = 202
+	return job.to_dict()
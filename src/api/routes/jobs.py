@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.api.dependencies import get_jobs
+from src.api.jobs import JobRunner
+
+router = APIRouter()
+
+
+@router.get("/")
+def list_jobs(jobs: JobRunner = Depends(get_jobs)):
+	"""Recent background jobs, oldest first."""
+	return {"jobs": jobs.statuses()}
+
+
+@router.get("/{job_id}")
+def get_job(job_id: str, jobs: JobRunner = Depends(get_jobs)):
+	"""Status and progress (0..1) of a background job."""
+	job = jobs.status(job_id)
+	if job is None:
+		raise HTTPException(status_code=404, detail="Job not found")
+	return job
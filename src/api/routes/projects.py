@@ -1,79 +1,218 @@
-import os
-from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from src.models.seating_plan import SeatingPlan
 from src.api.schemas import ProjectName
-from src.api.dependencies import get_plan
+from src.api.dependencies import check_project_id, get_handle, get_jobs, get_registry, read_handle, write_plan
+from src.api.jobs import Job, JobRunner
+from src.api.registry import PlanHandle, PlanRegistry
+from src.api import storage
+from src.api.metrics import timed
 
 router = APIRouter()
 
-PROJECTS_DIR = "projects"
-
-
-def ensure_projects_dir():
-    """Ensure projects directory exists."""
-    Path(PROJECTS_DIR).mkdir(exist_ok=True)
-
-
-def get_project_path(name: str) -> str:
-    """Get the file path for a project."""
-    ensure_projects_dir()
-    return os.path.join(PROJECTS_DIR, f"{name}.json")
-
 
 @router.post("/new/{name}")
-def new_project(name: str, plan: SeatingPlan = Depends(get_plan)):
+def new_project(name: str, plan: SeatingPlan = Depends(write_plan)):
     """Create a new empty seating plan project (clears current plan)."""
     # Reset in-memory plan and set its name
     plan.name = name
     plan.sections = {}
     return {"status": "new", "name": name, "seating_plan": plan.to_dict()}
 
+# ---- Background save/load ----
+# Saving and loading run as jobs (see src/api/jobs.py): the request returns 202 with
+# a job to poll at /api/jobs/{job_id}, or waits for it with ?wait=true.
+
+def job_response(job: Job, response: Response, wait: bool) -> dict:
+    if wait:
+        job.wait()
+        if job.status == "failed":
+            raise HTTPException(status_code=500, detail=job.error)
+    else:
+        response.status_code = 202
+    return job.to_dict()
+
+
+def _serialize(handle: PlanHandle, job: Job, share: float = 0.5):
+    """Serialize a plan under its read lock; returns the data and its saved_state."""
+    with handle.lock.read(), timed("serialize"):
+        data = handle.plan.to_dict(progress=lambda done, total: job.update(share * done / total, "serializing"))
+        return data, handle.saved_state()
+
+
 @router.post("/save")
-def save_project(payload: ProjectName, plan: SeatingPlan = Depends(get_plan)):
-    """Save the current seating plan to a JSON file."""
-    try:
-        # Ensure the seating plan's internal name is set before export
-        plan.name = payload.name
-        plan.export_project(get_project_path(payload.name))
-        return {"status": "saved", "name": payload.name}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def save_project(
+    payload: ProjectName,
+    response: Response,
+    wait: bool = False,
+    handle: PlanHandle = Depends(get_handle),
+    registry: PlanRegistry = Depends(get_registry),
+    jobs: JobRunner = Depends(get_jobs),
+):
+    """Save the current seating plan to a JSON file, in the background."""
+    check_project_id(payload.name)
+    loaded = registry.peek(payload.name)
+    if loaded is not None and loaded is not handle and loaded.dirty:
+        raise HTTPException(status_code=409, detail=f"Project '{payload.name}' is open with unsaved changes, save it first")
+
+    def run(job: Job) -> dict:
+        # the seating plan's internal name follows the name it is saved under
+        if handle.plan.name != payload.name:
+            with handle.write() as plan:
+                plan.name = payload.name
+        data, state = _serialize(handle, job)
+        job.update(0.5, "writing")
+        loaded = registry.peek(payload.name)
+        if loaded is None or loaded is handle:
+            with registry.save_lock:
+                storage.save_plan_data(payload.name, data, payload.compression)
+            if loaded is handle:
+                handle.mark_saved(state)
+            return {"name": payload.name}
+        # a loaded copy of this project would be stale: it is dropped, unless it has
+        # edits of its own that were never saved (locked first, like registry.flush)
+        with loaded.lock.write():
+            if loaded.dirty:
+                raise RuntimeError(f"Project '{payload.name}' is open with unsaved changes, save it first")
+            with registry.save_lock:
+                storage.save_plan_data(payload.name, data, payload.compression)
+            if registry.is_current(loaded):
+                registry.discard(payload.name)
+        return {"name": payload.name}
+
+    job = jobs.submit("save", payload.name, run, key=handle.job_key,
+                      coalesce=(payload.name, payload.compression))
+    return job_response(job, response, wait)
 
 
 @router.post("/load")
-def load_project(payload: ProjectName, plan: SeatingPlan = Depends(get_plan)):
-    """Load a seating plan from a JSON file (overwrites current plan)."""
-    path = get_project_path(payload.name)
-    if not os.path.exists(path):
+def load_project(
+    payload: ProjectName,
+    response: Response,
+    wait: bool = False,
+    handle: PlanHandle = Depends(get_handle),
+    jobs: JobRunner = Depends(get_jobs),
+):
+    """Load a seating plan from a JSON file (overwrites current plan), in the background."""
+    if not storage.project_exists(payload.name):
         raise HTTPException(status_code=404, detail=f"Project '{payload.name}' not found")
-    try:
-        plan.import_project(path)
-        return {"status": "loaded", "name": payload.name}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    def run(job: Job) -> dict:
+        # parse without holding the plan; only the swap needs the write lock
+        job.update(0.0, "reading")
+        loaded = storage.load_plan(payload.name)
+        job.update(0.9, "applying")
+        with handle.write() as plan:
+            plan.name = loaded.name
+            plan.sections = loaded.sections
+        return {"name": payload.name}
+
+    job = jobs.submit("load", payload.name, run, key=handle.job_key)
+    return job_response(job, response, wait)
 
 
 @router.get("/list")
-def list_projects():
-    """List all saved projects."""
-    ensure_projects_dir()
-    projects = []
-    for filename in os.listdir(PROJECTS_DIR):
-        if filename.endswith(".json"):
-            projects.append(filename[:-5])  # Remove .json extension
-    return {"projects": projects}
+def list_projects(
+    sort: Literal["name", "modified", "size", "sections", "rows", "seats"] = "name",
+    order: Literal["asc", "desc"] = "asc",
+    q: Optional[str] = None,
+    min_seats: Optional[int] = Query(None, ge=0),
+    max_seats: Optional[int] = Query(None, ge=0),
+):
+    """
+    List all saved projects: their names, and in 'items' the catalog metadata
+    (file, compression, size, modified time, section/row/seat counts).
+    Filter by a case-insensitive name substring 'q' and by seat count.
+    """
+    items = storage.project_entries()
+    if q:
+        needle = q.casefold()
+        items = [item for item in items if needle in item["name"].casefold()]
+    if min_seats is not None:
+        items = [item for item in items if item["seats"] >= min_seats]
+    if max_seats is not None:
+        items = [item for item in items if item["seats"] <= max_seats]
+    items.sort(key=lambda item: item["name"].casefold())
+    if sort != "name":
+        # fields a backend does not record (None) sort first
+        items.sort(key=lambda item: (item[sort] is not None, item[sort] or 0))
+    if order == "desc":
+        items.reverse()
+    return {"projects": [item["name"] for item in items], "items": items}
 
 
 @router.delete("/{name}")
-def delete_project(name: str):
-    """Delete a saved project."""
-    path = get_project_path(name)
-    if not os.path.exists(path):
+def delete_project(name: str, discard_unsaved: bool = False, registry: PlanRegistry = Depends(get_registry)):
+    """
+    Delete a saved project, and its copy in memory. A project that was created but
+    never saved only exists in memory: it is dropped when 'discard_unsaved' is set.
+    """
+    if not storage.project_exists(name):
+        if discard_unsaved and registry.peek(name) is not None:
+            registry.discard(name)
+            return {"status": "discarded", "name": name}
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
     try:
-        os.remove(path)
+        with registry.save_lock:
+            storage.delete_project(name)
+            registry.discard(name)
         return {"status": "deleted", "name": name}
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# ---- Per-project plans (/api/projects/{project_id}/...) ----
+
+def _project_info(handle: PlanHandle) -> dict:
+    plan = handle.plan
+    return {
+        "project_id": handle.project_id,
+        "name": plan.name,
+        "sections": len(plan.sections),
+        "seats": sum(len(section.seats) for section in plan.sections.values()),
+        "dirty": handle.dirty,
+    }
+
+
+@router.post("/{project_id}", status_code=201)
+def create_project(project_id: str, registry: PlanRegistry = Depends(get_registry)):
+    """Create a new empty plan for a project and keep it in memory (not saved yet)."""
+    check_project_id(project_id)
+    if registry.exists(project_id):
+        raise HTTPException(status_code=409, detail=f"Project '{project_id}' already exists")
+    return _project_info(registry.create(project_id))
+
+
+@router.get("/{project_id}")
+def get_project(handle: PlanHandle = Depends(read_handle)):
+    """Summary of a project's plan; loads it from disk if needed."""
+    return _project_info(handle)
+
+
+@router.post("/{project_id}/save")
+def save_registered_project(
+    response: Response,
+    compression: Optional[Literal["gzip", "xz"]] = None,
+    wait: bool = False,
+    handle: PlanHandle = Depends(get_handle),
+    registry: PlanRegistry = Depends(get_registry),
+    jobs: JobRunner = Depends(get_jobs),
+):
+    """Write a project's in-memory plan to its file, in the background."""
+    def run(job: Job) -> dict:
+        data, state = _serialize(handle, job)
+        job.update(0.5, "writing")
+        with registry.save_lock:
+            if not registry.is_current(handle):
+                # evicted meanwhile, and flushed with newer state than our snapshot
+                return {"name": handle.project_id, "skipped": True}
+            target = compression or storage.saved_compression(handle.project_id)
+            storage.save_plan_data(handle.project_id, data, target)
+            handle.mark_saved(state)
+        return {"name": handle.project_id}
+
+    job = jobs.submit("save", handle.project_id, run, key=handle.job_key, coalesce=compression or "")
+    return job_response(job, response, wait)
@@ -1,15 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List
 
 from src.models.seating_plan import SeatingPlan
 from src.api.schemas import SeatIn
-from src.api.dependencies import get_plan
+from src.api.dependencies import read_plan, write_plan
+from src.api.etags import check_not_modified, section_etag
 
 router = APIRouter()
 
 
 @router.post("/{section}/{row}", status_code=201)
-def add_seat(section: str, row: str, payload: SeatIn, plan: SeatingPlan = Depends(get_plan)):
+def add_seat(section: str, row: str, payload: SeatIn, plan: SeatingPlan = Depends(write_plan)):
 	if section not in plan.sections:
 		raise HTTPException(status_code=404, detail="Section not found")
 	plan.sections[section].add_seat(row, payload.seat_number)
@@ -17,7 +18,7 @@ def add_seat(section: str, row: str, payload: SeatIn, plan: SeatingPlan = Depend
 
 
 @router.delete("/{section}/{row}/{seat}", status_code=204)
-def delete_seat(section: str, row: str, seat: str, plan: SeatingPlan = Depends(get_plan)):
+def delete_seat(section: str, row: str, seat: str, plan: SeatingPlan = Depends(write_plan)):
 	if section not in plan.sections:
 		raise HTTPException(status_code=404, detail="Section not found")
 	plan.sections[section].delete_seat(row, seat)
@@ -25,8 +26,11 @@ def delete_seat(section: str, row: str, seat: str, plan: SeatingPlan = Depends(g
 
 
 @router.get("/{section}")
-def list_seats(section: str, plan: SeatingPlan = Depends(get_plan)):
+def list_seats(section: str, request: Request, response: Response, plan: SeatingPlan = Depends(read_plan)):
 	if section not in plan.sections:
 		raise HTTPException(status_code=404, detail="Section not found")
+	not_modified = check_not_modified(request, response, section_etag(plan.sections[section]))
+	if not_modified:
+		return not_modified
 	return plan.sections[section].to_dict()
 
@@ -1,23 +1,112 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
-from string import ascii_uppercase
+import base64
+import binascii
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import List, Literal, Optional, Tuple, Union
 
 from src.models.seating_plan import SeatingPlan
-from src.api.schemas import SectionCreate, SectionOut, CloneResponse, BulkSeats, SeatRange, RenameSection, RowRange
-from src.utils.alphanum_handler import alphanum_range
+from src.api.schemas import RowOut, RowSummary, SeatMove, SeatSelection, SectionCreate, SectionOut, SectionFieldsOut, SectionSummaryPage, CloneResponse, BulkSeats, SeatRange, RenameSection, RowRange
+from src.utils.alphanum_handler import alphanum_sort_key
 
-from src.api.dependencies import get_plan
+from src.api.dependencies import read_handle, read_plan, write_plan
+from src.api.etags import check_not_modified, plan_etag, section_etag
+from src.api.registry import PlanHandle
 
 router = APIRouter()
 
-
-@router.get("/", response_model=List[SectionOut])
-def list_sections(plan: SeatingPlan = Depends(get_plan)):
-	return [section.to_dict() for section in plan.sections.values()]
+SECTION_FIELDS = ("name", "is_ga", "rows")
+MAX_PAGE_SIZE = 1000
+
+
+def _encode_cursor(name: str) -> str:
+	return base64.urlsafe_b64encode(name.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> str:
+	try:
+		return base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+	except (binascii.Error, UnicodeError, ValueError):
+		raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _page(plan: SeatingPlan, cursor: Optional[str], limit: Optional[int]) -> Tuple[list, Optional[str]]:
+	"""
+	One page of sections in plan order, starting after the section named by the
+	cursor. Returns the sections and the cursor of the next page (None on the last).
+	"""
+	names = list(plan.sections)
+	start = 0
+	if cursor:
+		after = _decode_cursor(cursor)
+		if after not in plan.sections:
+			# the section the cursor points after was deleted or renamed
+			raise HTTPException(status_code=400, detail="Stale cursor, restart the listing")
+		start = names.index(after) + 1
+	end = len(names) if limit is None else min(start + limit, len(names))
+	sections = [plan.sections[name] for name in names[start:end]]
+	next_cursor = _encode_cursor(names[end - 1]) if end < len(names) else None
+	return sections, next_cursor
+
+
+def _parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+	if not fields:
+		return SECTION_FIELDS
+	selected = tuple(f.strip() for f in fields.split(",") if f.strip())
+	unknown = [f for f in selected if f not in SECTION_FIELDS]
+	if unknown or not selected:
+		raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}; choose from {', '.join(SECTION_FIELDS)}")
+	return selected
+
+
+def _section_fields(section, fields: Tuple[str, ...]) -> dict:
+	if "rows" in fields:
+		data = section.to_dict()
+		return {field: data[field] for field in fields}
+	# skip building the row/seat lists when they were not asked for
+	data = {"name": section.name, "is_ga": section.is_ga}
+	return {field: data[field] for field in fields}
+
+
+def _section_summary(section) -> dict:
+	return {
+		"name": section.name,
+		"is_ga": section.is_ga,
+		"row_count": section.row_count,
+		"seat_count": len(section.seats),
+	}
+
+
+@router.get("/", response_model=Union[List[SectionFieldsOut], SectionSummaryPage], response_model_exclude_unset=True)
+def list_sections(
+	request: Request,
+	response: Response,
+	cursor: Optional[str] = None,
+	limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+	fields: Optional[str] = None,
+	view: Literal["sections", "summary"] = "sections",
+	handle: PlanHandle = Depends(read_handle),
+):
+	"""
+	Every section with its rows and seats. Pass 'limit' to page through the list (the
+	next page's cursor is sent in the X-Next-Cursor header) and 'fields' (e.g.
+	"name,is_ga") to leave out the seat data.
+
+	With view=summary, returns {"items", "next_cursor"} instead: the names, GA flags
+	and row/seat counts of the sections, without the seats.
+	"""
+	selected = _parse_fields(fields)
+	sections, next_cursor = _page(handle.plan, cursor, limit)
+	not_modified = check_not_modified(request, response, plan_etag(handle))
+	if not_modified:
+		return not_modified
+	if view == "summary":
+		return {"items": [_section_summary(section) for section in sections], "next_cursor": next_cursor}
+	if next_cursor:
+		response.headers["X-Next-Cursor"] = next_cursor
+	return [_section_fields(section, selected) for section in sections]
 
 
 @router.post("/", response_model=SectionOut, status_code=201)
-def create_section(payload: SectionCreate, plan: SeatingPlan = Depends(get_plan)):
+def create_section(payload: SectionCreate, plan: SeatingPlan = Depends(write_plan)):
 	if payload.name in plan.sections:
 		raise HTTPException(status_code=409, detail="Section already exists")
 	plan.add_section(payload.name, is_ga=payload.is_ga)
@@ -25,25 +114,57 @@ def create_section(payload: SectionCreate, plan: SeatingPlan = Depends(get_plan)
 
 
 @router.get("/{name}", response_model=SectionOut)
-def get_section(name: str, plan: SeatingPlan = Depends(get_plan)):
+def get_section(name: str, request: Request, response: Response, plan: SeatingPlan = Depends(read_plan)):
+	if name not in plan.sections:
+		raise HTTPException(status_code=404, detail="Section not found")
+	section = plan.sections[name]
+	not_modified = check_not_modified(request, response, section_etag(section))
+	if not_modified:
+		return not_modified
+	return section.to_dict()
+
+
+@router.get("/{name}/rows", response_model=List[RowSummary])
+def list_rows(name: str, request: Request, response: Response, plan: SeatingPlan = Depends(read_plan)):
+	"""Row labels of a section in natural order, with the number of seats in each."""
 	if name not in plan.sections:
 		raise HTTPException(status_code=404, detail="Section not found")
-	return plan.sections[name].to_dict()
+	section = plan.sections[name]
+	not_modified = check_not_modified(request, response, section_etag(section))
+	if not_modified:
+		return not_modified
+	rows = sorted(section.row_numbers(), key=alphanum_sort_key)
+	return [{"row_number": row, "seat_count": len(section.row_seats(row))} for row in rows]
+
+
+@router.get("/{name}/rows/{row}", response_model=RowOut)
+def get_row(name: str, row: str, request: Request, response: Response, plan: SeatingPlan = Depends(read_plan)):
+	"""The seats of one row, looked up in the section's row index."""
+	if name not in plan.sections:
+		raise HTTPException(status_code=404, detail="Section not found")
+	section = plan.sections[name]
+	if not section.has_row(row):
+		raise HTTPException(status_code=404, detail="Row not found")
+	not_modified = check_not_modified(request, response, section_etag(section))
+	if not_modified:
+		return not_modified
+	seat_numbers = sorted((seat.seat_number for seat in section.row_seats(row)), key=alphanum_sort_key)
+	return {"row_number": row, "seats": [{"seat_number": n} for n in seat_numbers]}
 
 
 @router.delete("/{name}", status_code=204)
-def delete_section(name: str, plan: SeatingPlan = Depends(get_plan)):
+def delete_section(name: str, plan: SeatingPlan = Depends(write_plan)):
 	plan.delete_section(name)
 	return {}
 
 
 @router.post("/{name}/clone", response_model=CloneResponse)
-def clone_section(name: str, count: int = 1, plan: SeatingPlan = Depends(get_plan)):
+def clone_section(name: str, count: int = 1, plan: SeatingPlan = Depends(write_plan)):
 	created = plan.clone_section_many(name, count)
 	return {"created": created}
 
 @router.patch("/{name}", response_model=SectionOut)
-def rename_section(name: str, payload: RenameSection, plan: SeatingPlan = Depends(get_plan)):
+def rename_section(name: str, payload: RenameSection, plan: SeatingPlan = Depends(write_plan)):
     if name not in plan.sections:
         raise HTTPException(status_code=404, detail="Section not found")
     plan.rename_section(name, payload.new_name)
@@ -51,7 +172,7 @@ def rename_section(name: str, payload: RenameSection, plan: SeatingPlan = Depend
 
 
 @router.post("/{name}/rows/{row}/bulk", status_code=201)
-def add_bulk_seats(name: str, row: str, payload: BulkSeats, plan: SeatingPlan = Depends(get_plan)):
+def add_bulk_seats(name: str, row: str, payload: BulkSeats, plan: SeatingPlan = Depends(write_plan)):
     if name not in plan.sections:
         raise HTTPException(status_code=404, detail="Section not found")
     for seat_number in payload.seat_numbers:
@@ -60,7 +181,7 @@ def add_bulk_seats(name: str, row: str, payload: BulkSeats, plan: SeatingPlan =
 
 
 @router.post("/{name}/rows/{row}/range", status_code=201)
-def add_seat_range(name: str, row: str, payload: SeatRange, plan: SeatingPlan = Depends(get_plan)):
+def add_seat_range(name: str, row: str, payload: SeatRange, plan: SeatingPlan = Depends(write_plan)):
     if name not in plan.sections:
         raise HTTPException(status_code=404, detail="Section not found")
     plan.sections[name].add_seat_range(row, payload.start_seat, payload.end_seat)
@@ -68,7 +189,7 @@ def add_seat_range(name: str, row: str, payload: SeatRange, plan: SeatingPlan =
 
 
 @router.post("/{name}/rows/range", status_code=201)
-def add_row_range(name: str, payload: RowRange, plan: SeatingPlan = Depends(get_plan)):
+def add_row_range(name: str, payload: RowRange, plan: SeatingPlan = Depends(write_plan)):
     """
     Add multiple rows with seat ranges. Supports:
     - start_row, end_row: row range (numeric or letter)
@@ -80,97 +201,47 @@ def add_row_range(name: str, payload: RowRange, plan: SeatingPlan = Depends(get_
     """
     if name not in plan.sections:
         raise HTTPException(status_code=404, detail="Section not found")
-    
-    section = plan.sections[name]
-    
-    # Build rows list (numeric or letter ranges)
-    rows_raw = []
     try:
-        rs = int(payload.start_row)
-        re = int(payload.end_row)
-        if rs <= re:
-            rows_raw = [str(i) for i in range(rs, re + 1)]
-        else:
-            rows_raw = [str(i) for i in range(re, rs + 1)]
-    except ValueError:
-        # letter range
-        try:
-            si = ascii_uppercase.index(payload.start_row.upper())
-            ei = ascii_uppercase.index(payload.end_row.upper())
-            if si <= ei:
-                rows_raw = list(ascii_uppercase[si:ei+1])
-            else:
-                rows_raw = list(ascii_uppercase[ei:si+1])
-        except Exception:
-            raise HTTPException(status_code=400, detail="Invalid row range")
-    
-    # Apply prefix/suffix
-    prefix = payload.row_prefix or ""
-    suffix = payload.row_suffix or ""
-    if payload.unnumbered_rows:
-        rows = [f"#{r}" for r in rows_raw]
-    else:
-        rows = [f"{prefix}{r}{suffix}" for r in rows_raw]
-    
-    if not rows:
-        raise HTTPException(status_code=400, detail="No rows generated")
-    
-    # Handle continuous numbering
-    parity = (payload.parity or "all").lower()
-    continuous = payload.continuous or False
-    
-    if continuous:
-        # Only numeric seat labels support continuous
-        try:
-            s0 = int(payload.start_seat)
-            s1 = int(payload.end_seat)
-            seats_per_row = abs(s1 - s0) + 1
-            seq = min(s0, s1)
-            
-            for row in rows:
-                for i in range(seats_per_row):
-                    seat_label = str(seq)
-                    if parity == "all":
-                        section.add_seat(row, seat_label)
-                    else:
-                        val = int(seat_label)
-                        keep = (val % 2 == 0) if parity == "even" else (val % 2 == 1)
-                        if keep:
-                            section.add_seat(row, seat_label)
-                    seq += 1
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Continuous numbering requires numeric seat labels")
-    else:
-        # Standard: same seat range for each row
-        seats = alphanum_range(payload.start_seat, payload.end_seat)
-        if not seats:
-            try:
-                a = int(payload.start_seat)
-                b = int(payload.end_seat)
-                if a > b:
-                    a, b = b, a
-                seats = [str(i) for i in range(a, b + 1)]
-            except Exception:
-                raise HTTPException(status_code=400, detail="Invalid seat range")
-        
-        if parity == "all":
-            for row in rows:
-                for seat in seats:
-                    section.add_seat(row, seat)
-        else:
-            for row in rows:
-                for seat in seats:
-                    if seat.isdigit():
-                        val = int(seat)
-                        keep = (val % 2 == 0) if parity == "even" else (val % 2 == 1)
-                        if keep:
-                            section.add_seat(row, seat)
-    
+        rows = plan.sections[name].add_row_range(**payload.model_dump())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {"status": "ok", "rows_added": len(rows)}
 
 
+def selected_seat_keys(section, selection: SeatSelection) -> List[str]:
+	"""Seat keys named by a selection: its seats plus every seat of its rows."""
+	keys = [f"{ref.row}-{ref.seat_number}" for ref in selection.seats]
+	keys.extend(section.seat_keys_in_rows(selection.rows))
+	return keys
+
+
+@router.post("/{name}/seats/delete")
+def delete_seats(name: str, payload: SeatSelection, plan: SeatingPlan = Depends(write_plan)):
+	"""Delete a set of seats and/or whole rows in one call."""
+	if name not in plan.sections:
+		raise HTTPException(status_code=404, detail="Section not found")
+	section = plan.sections[name]
+	return {"deleted": section.delete_seats(selected_seat_keys(section, payload))}
+
+
+@router.post("/{name}/seats/move")
+def move_seats(name: str, payload: SeatMove, plan: SeatingPlan = Depends(write_plan)):
+	"""Move a set of seats and/or whole rows to another section, optionally creating it."""
+	if name not in plan.sections:
+		raise HTTPException(status_code=404, detail="Section not found")
+	if payload.target == name:
+		raise HTTPException(status_code=400, detail="Target is the source section")
+	if payload.target not in plan.sections:
+		if not payload.create_target:
+			raise HTTPException(status_code=404, detail="Target section not found")
+		plan.add_section(payload.target)
+	section = plan.sections[name]
+	moved = section.transfer_to(plan.sections[payload.target], selected_seat_keys(section, payload))
+	return {"moved": moved, "target": payload.target}
+
+
 @router.delete("/{name}/rows/{row}", status_code=204)
-def delete_row(name: str, row: str, plan: SeatingPlan = Depends(get_plan)):
+def delete_row(name: str, row: str, plan: SeatingPlan = Depends(write_plan)):
     if name not in plan.sections:
         raise HTTPException(status_code=404, detail="Section not found")
     plan.sections[name].delete_row(row)
@@ -1,5 +1,5 @@
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Annotated, List, Literal, Optional, Union
+from pydantic import BaseModel, Field
 
 # Add schemas here
 
@@ -13,6 +13,10 @@ class RowOut(BaseModel):
 	row_number: str
 	seats: List[SeatOut]
 
+class RowSummary(BaseModel):
+	row_number: str
+	seat_count: int
+
 class SectionCreate(BaseModel):
 	name: str
 	is_ga: bool = False
@@ -22,6 +26,22 @@ class SectionOut(BaseModel):
 	is_ga: bool
 	rows: List[RowOut]
 
+class SectionFieldsOut(BaseModel):
+	# SectionOut with every field optional, for listings narrowed by ?fields=
+	name: Optional[str] = None
+	is_ga: Optional[bool] = None
+	rows: Optional[List[RowOut]] = None
+
+class SectionSummary(BaseModel):
+	name: str
+	is_ga: bool
+	row_count: int
+	seat_count: int
+
+class SectionSummaryPage(BaseModel):
+	items: List[SectionSummary]
+	next_cursor: Optional[str] = None
+
 class CloneResponse(BaseModel):
 	created: List[str]
 
@@ -46,13 +66,89 @@ class BulkSeats(BaseModel):
 	seat_numbers: List[str]
 
 
+class SeatRef(BaseModel):
+	row: str
+	seat_number: str
+
+
+class SeatSelection(BaseModel):
+	# individual seats and/or whole rows
+	seats: List[SeatRef] = []
+	rows: List[str] = []
+
+
+class SeatMove(SeatSelection):
+	target: str
+	create_target: bool = False
+
+
 class RenameSection(BaseModel):
 	new_name: str
 
 
 class ProjectName(BaseModel):
 	name: str
+	compression: Optional[Literal["gzip", "xz"]] = None  # save only; load detects it
 
 
 class ProjectInfo(BaseModel):
-	filename: str
\ No newline at end of file
+	filename: str
+
+
+# ---- Batch operations (POST /api/batch) ----
+
+class AddSeatsOp(BaseModel):
+	op: Literal["add_seats"]
+	section: str
+	row: str
+	seat_numbers: List[str]
+
+
+class DeleteSeatsOp(BaseModel):
+	op: Literal["delete_seats"]
+	section: str
+	row: str
+	seat_numbers: List[str]
+
+
+class AddRowRangeOp(RowRange):
+	op: Literal["add_row_range"]
+	section: str
+
+
+class DeleteRowsOp(BaseModel):
+	op: Literal["delete_rows"]
+	section: str
+	rows: List[str]
+
+
+class MoveSeatsOp(SeatMove):
+	op: Literal["move_seats"]
+	section: str
+
+
+class RenameSectionOp(BaseModel):
+	op: Literal["rename_section"]
+	section: str
+	new_name: str
+
+
+class CloneSectionOp(BaseModel):
+	op: Literal["clone_section"]
+	section: str
+	count: int = 1
+
+
+BatchOp = Annotated[
+	Union[AddSeatsOp, DeleteSeatsOp, AddRowRangeOp, DeleteRowsOp, MoveSeatsOp, RenameSectionOp, CloneSectionOp],
+	Field(discriminator="op"),
+]
+
+
+class BatchRequest(BaseModel):
+	operations: List[BatchOp]
+
+
+class BatchResponse(BaseModel):
+	# one result object per operation, in request order
+	results: List[dict]
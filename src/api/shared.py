@@ -0,0 +1,170 @@
+import json
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.models.seating_plan import SeatingPlan
+from src.api.sqlite_storage import SHARED_DEFAULT_PLAN, SqliteBackend, section_digest
+
+if TYPE_CHECKING:
+    from src.api.registry import PlanHandle
+
+# Set to run several API workers (processes) on one set of plans; needs STORAGE_BACKEND=sqlite
+SHARED_PLANS = os.environ.get("SHARED_PLANS", "").lower() in ("1", "true", "yes")
+
+# Events whose section has to be rewritten in the store
+_WRITTEN_EVENTS = ("section_added", "section_changed", "section_renamed")
+
+
+class StalePlan(Exception):
+    """The plan behind a handle was deleted (or deleted and recreated) by another worker."""
+
+
+class SharedPlans:
+    """
+    Keeps the in-memory plans of several API workers coherent through an SQLite store.
+
+    Every write goes to the store as it happens: PlanHandle.begin_write() opens an
+    IMMEDIATE transaction (so writes to the store are serialized across processes)
+    and first syncs the handle, end_write() writes the sections the change events
+    name and bumps the plan's revision. Before a read, refresh() compares the
+    handle's revision with the store's and reloads only the sections whose digest
+    changed. Shared handles use the store's revision as their version and its
+    epoch as their epoch, so ETags and change-feed positions are the same on every
+    worker.
+    """
+
+    def __init__(self, backend: SqliteBackend) -> None:
+        self.backend: SqliteBackend = backend
+        if backend.revision(SHARED_DEFAULT_PLAN) is None:
+            backend.save_data(SHARED_DEFAULT_PLAN, SeatingPlan().to_dict())
+
+    @staticmethod
+    def key(handle: "PlanHandle") -> str:
+        return handle.project_id if handle.project_id is not None else SHARED_DEFAULT_PLAN
+
+    def attach(self, handle: "PlanHandle") -> "PlanHandle":
+        """Make a handle shared; its plan is replaced by the stored one on first use."""
+        handle.shared = self
+        handle.revision = None
+        handle.digests = {}
+        return handle
+
+    def create(self, handle: "PlanHandle") -> "PlanHandle":
+        """Store a new project's plan and share its handle."""
+        self.attach(handle)
+        self.backend.save_data(self.key(handle), handle.plan.to_dict())
+        with handle.lock.write():
+            with self.backend.reading() as db:
+                self._sync(db, handle)
+        return handle
+
+    # ---- Syncing ----
+    def refresh(self, handle: "PlanHandle") -> None:
+        """Bring a handle up to date with the store; cheap when it already is."""
+        if handle.revision is not None and self.backend.revision(self.key(handle)) == handle.revision:
+            return
+        with handle.lock.write():
+            with self.backend.reading() as db:
+                self._sync(db, handle)
+
+    def _sync(self, db, handle: "PlanHandle") -> None:
+        """Reload what changed in the store since the handle's revision (plan write lock held)."""
+        state = self.backend.plan_state(db, self.key(handle))
+        if state is None:
+            raise StalePlan(self.key(handle))
+        revision, epoch, plan_name, digests = state
+        if revision == handle.revision:
+            return
+        if handle.revision is not None and epoch != handle.epoch:
+            # deleted and recreated: positions in the old change feed mean nothing
+            raise StalePlan(self.key(handle))
+        plan = handle.plan
+        # a handle that never mirrored the store (new, or after a failed write)
+        # starts a fresh change log rather than replaying the whole plan as events
+        fresh = handle.revision is None
+        snapshot = handle.changes.begin(plan) if not fresh else None
+        sections = {}
+        for name, digest in digests:
+            current = plan.sections.get(name)
+            if current is not None and handle.digests.get(name) == digest:
+                sections[name] = current
+                continue
+            loaded = self.backend.read_section(db, self.key(handle), name)
+            if current is None:
+                sections[name] = loaded
+                continue
+            # patch the section in place, so clients get its seat changes as events
+            current.delete_seats([key for key in current.seats if key not in loaded.seats])
+            for key, seat in loaded.seats.items():
+                if key not in current.seats:
+                    current.add_seat(seat.row_number, seat.seat_number)
+            current.is_ga = loaded.is_ga
+            sections[name] = current
+        plan.name = plan_name or plan.name
+        plan.sections = sections
+        handle.digests = dict(digests)
+        handle.revision = handle.version = revision
+        handle.epoch = epoch
+        if fresh:
+            handle.changes.reset(revision)
+        else:
+            handle.changes.commit(plan, revision, snapshot)
+        handle.mark_saved()
+
+    # ---- Writing (called by PlanHandle.begin_write / end_write) ----
+    def begin_write(self, handle: "PlanHandle") -> None:
+        db = self.backend.open_session()
+        try:
+            self._sync(db, handle)
+        except BaseException:
+            self.backend.close_session(db, commit=False)
+            raise
+        handle.session = db
+
+    def end_write(self, handle: "PlanHandle", snapshot: dict) -> None:
+        db, handle.session = handle.session, None
+        plan = handle.plan
+        try:
+            # nobody else can write while we hold the session, so the store's next
+            # revision is known before the events are published
+            handle.version = handle.revision + 1
+            events = handle.changes.commit(plan, handle.version, snapshot)
+            written = {event["section"] for event in events if event["type"] in _WRITTEN_EVENTS}
+            # sections the store has not seen (e.g. after a failed write) go too
+            written.update(name for name in plan.sections if name not in handle.digests)
+            sections: Dict[str, Tuple[dict, bytes]] = {}
+            for name in written:
+                section = plan.sections.get(name)
+                if section is not None:
+                    data = section.to_dict()
+                    sections[name] = (data, section_digest(data))
+            revision = self.backend.write_sections(db, self.key(handle), plan.name, list(plan.sections), sections)
+        except BaseException:
+            self.backend.close_session(db, commit=False)
+            # the store no longer matches memory: reload everything on next use
+            handle.revision = None
+            handle.digests = {}
+            raise
+        self.backend.close_session(db)
+        handle.digests = {
+            name: sections[name][1] if name in sections else handle.digests[name] for name in plan.sections
+        }
+        handle.revision = handle.version = revision
+        handle.mark_saved()
+
+    def abort_write(self, handle: "PlanHandle") -> None:
+        db, handle.session = handle.session, None
+        self.backend.close_session(db, commit=False)
+
+    # ---- Jobs ----
+    # Job status lives in the worker that runs the job; it is mirrored here so
+    # /api/jobs/{job_id} can be answered by any worker.
+    def put_job(self, job: dict) -> None:
+        self.backend.put_job(job["job_id"], json.dumps(job))
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        data = self.backend.get_job(job_id)
+        return json.loads(data) if data is not None else None
+
+    def list_jobs(self) -> List[dict]:
+        return [json.loads(data) for data in self.backend.list_jobs()]
@@ -0,0 +1,364 @@
+import hashlib
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+from src.api.storage import StorageBackend
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    plan_name TEXT,
+    modified REAL NOT NULL,
+    -- bumped by every save; lets API workers sharing the database notice changes
+    revision INTEGER NOT NULL DEFAULT 0,
+    epoch TEXT,
+    sections INTEGER NOT NULL DEFAULT 0,
+    ga_sections INTEGER NOT NULL DEFAULT 0,
+    rows INTEGER NOT NULL DEFAULT 0,
+    seats INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    plan_id INTEGER NOT NULL REFERENCES plans(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    is_ga INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    rows INTEGER NOT NULL DEFAULT 0,
+    seats INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (plan_id, name)
+);
+CREATE TABLE IF NOT EXISTS section_rows (
+    id INTEGER PRIMARY KEY,
+    section_id INTEGER NOT NULL REFERENCES sections(id) ON DELETE CASCADE,
+    row_number TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS section_rows_by_section ON section_rows (section_id, position);
+CREATE TABLE IF NOT EXISTS seats (
+    row_id INTEGER NOT NULL REFERENCES section_rows(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    seat_number TEXT NOT NULL,
+    PRIMARY KEY (row_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+# Job statuses kept in the jobs table (see src/api/shared.py)
+MAX_STORED_JOBS = 500
+
+
+# Name under which the plan of the routes without a project in the path is shared
+# between API workers (see src/api/shared.py); never listed as a project
+SHARED_DEFAULT_PLAN = ""
+
+
+def section_digest(section_data: dict) -> bytes:
+    """Digest of a serialized section (Section.to_dict()); equal digests need no rewrite."""
+    encoded = json.dumps(section_data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+class SqliteBackend(StorageBackend):
+    """
+    Projects in one SQLite database, with sections, rows and seats in their own tables.
+
+    Saving compares each section's digest with the stored one and only rewrites the
+    sections that changed, in one short transaction, so re-saving a large plan after
+    a small edit touches a few rows. Single sections can be loaded on their own.
+    The database runs in WAL mode: readers (in any process) never wait for a save.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        # sqlite3 connections belong to the thread that opened them
+        self._local = threading.local()
+        self._sessions: List[sqlite3.Connection] = []
+        self._sessions_lock = threading.Lock()
+        db = self._connection()
+        db.executescript(SCHEMA)
+        self._migrate(db)
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        # autocommit mode; transactions are opened explicitly
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=check_same_thread)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA foreign_keys=ON")
+        return db
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = self._connect()
+        return db
+
+    @staticmethod
+    def _migrate(db: sqlite3.Connection) -> None:
+        """Add the revision and count columns to databases created before they existed."""
+        if "revision" in {column[1] for column in db.execute("PRAGMA table_info(plans)")}:
+            return
+        db.executescript("""
+            BEGIN IMMEDIATE;
+            ALTER TABLE plans ADD COLUMN revision INTEGER NOT NULL DEFAULT 0;
+            ALTER TABLE plans ADD COLUMN epoch TEXT;
+            ALTER TABLE sections ADD COLUMN rows INTEGER NOT NULL DEFAULT 0;
+            ALTER TABLE sections ADD COLUMN seats INTEGER NOT NULL DEFAULT 0;
+            UPDATE plans SET epoch = lower(hex(randomblob(4)));
+            UPDATE sections SET
+                rows = (SELECT COUNT(*) FROM section_rows r WHERE r.section_id = sections.id),
+                seats = (SELECT COUNT(*) FROM section_rows r JOIN seats t ON t.row_id = r.id
+                         WHERE r.section_id = sections.id);
+            COMMIT;
+        """)
+
+    @contextmanager
+    def _transaction(self):
+        """A write transaction; IMMEDIATE takes the database's write lock up front."""
+        db = self._connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    @contextmanager
+    def reading(self):
+        """A read transaction on this thread's connection: one consistent view of the database."""
+        db = self._connection()
+        db.execute("BEGIN")
+        try:
+            yield db
+        finally:
+            db.execute("COMMIT")
+
+    def open_session(self) -> sqlite3.Connection:
+        """
+        Start a write transaction on a connection of its own, which may be used and
+        finished from other threads (one at a time). Holding it keeps every other
+        writer, in any process, waiting; finish it with close_session().
+        """
+        with self._sessions_lock:
+            db = self._sessions.pop() if self._sessions else None
+        if db is None:
+            db = self._connect(check_same_thread=False)
+        try:
+            db.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            db.close()
+            raise
+        return db
+
+    def close_session(self, db: sqlite3.Connection, commit: bool = True) -> None:
+        try:
+            db.execute("COMMIT" if commit else "ROLLBACK")
+        except BaseException:
+            db.close()
+            raise
+        with self._sessions_lock:
+            self._sessions.append(db)
+
+    def close(self) -> None:
+        """Close this thread's connection and the idle session connections."""
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for db in sessions:
+            db.close()
+
+    def _plan_id(self, db: sqlite3.Connection, name: str) -> int:
+        row = db.execute("SELECT id FROM plans WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Project '{name}' not found")
+        return row[0]
+
+    # ---- Reading ----
+    def exists(self, name: str) -> bool:
+        return self._connection().execute("SELECT 1 FROM plans WHERE name = ?", (name,)).fetchone() is not None
+
+    def list_names(self) -> List[str]:
+        return [name for (name,) in self._connection().execute("SELECT name FROM plans WHERE name != '' ORDER BY id")]
+
+    def entries(self) -> List[dict]:
+        rows = self._connection().execute(
+            "SELECT name, plan_name, modified, sections, ga_sections, rows, seats FROM plans WHERE name != '' ORDER BY id")
+        return [
+            {
+                "name": name, "plan_name": plan_name, "file": os.path.basename(self.path), "compression": None,
+                "size": None, "modified": modified, "sections": sections, "ga_sections": ga_sections,
+                "rows": row_count, "seats": seats,
+            }
+            for name, plan_name, modified, sections, ga_sections, row_count, seats in rows
+        ]
+
+    @staticmethod
+    def _read_sections(db: sqlite3.Connection, where: str, params: tuple) -> Dict[str, Section]:
+        # one ordered join; sections, rows and seats come back in their saved order
+        cursor = db.execute(
+            "SELECT s.id, s.name, s.is_ga, r.row_number, t.seat_number FROM sections s "
+            "LEFT JOIN section_rows r ON r.section_id = s.id "
+            "LEFT JOIN seats t ON t.row_id = r.id "
+            f"WHERE {where} ORDER BY s.position, r.position, t.position",
+            params,
+        )
+        sections: Dict[str, Section] = {}
+        section, section_id = None, None
+        for sid, name, is_ga, row_number, seat_number in cursor:
+            if sid != section_id:
+                section, section_id = Section(name, is_ga=bool(is_ga)), sid
+                sections[name] = section
+            if seat_number is not None:
+                section.add_seat(row_number, seat_number)
+        return sections
+
+    def load(self, name: str) -> SeatingPlan:
+        # a read transaction sees one consistent save, even while another process writes
+        with self.reading() as db:
+            row = db.execute("SELECT id, plan_name FROM plans WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                raise FileNotFoundError(f"Project '{name}' not found")
+            plan = SeatingPlan(row[1] or name)
+            plan.sections = self._read_sections(db, "s.plan_id = ?", (row[0],))
+        return plan
+
+    def load_section(self, name: str, section_name: str) -> Section:
+        with self.reading() as db:
+            return self.read_section(db, name, section_name)
+
+    def read_section(self, db: sqlite3.Connection, name: str, section_name: str) -> Section:
+        """One section, inside the caller's transaction. Raises FileNotFoundError / KeyError."""
+        plan_id = self._plan_id(db, name)
+        sections = self._read_sections(db, "s.plan_id = ? AND s.name = ?", (plan_id, section_name))
+        if section_name not in sections:
+            raise KeyError(section_name)
+        return sections[section_name]
+
+    def revision(self, name: str) -> Optional[int]:
+        """The plan's current revision, None if it is not stored."""
+        row = self._connection().execute("SELECT revision FROM plans WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def plan_state(self, db: sqlite3.Connection, name: str) -> Optional[Tuple[int, str, str, List[Tuple[str, bytes]]]]:
+        """(revision, epoch, plan name, [(section name, digest)] in order), None if not stored."""
+        row = db.execute("SELECT id, revision, epoch, plan_name FROM plans WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        plan_id, revision, epoch, plan_name = row
+        digests = db.execute("SELECT name, digest FROM sections WHERE plan_id = ? ORDER BY position", (plan_id,)).fetchall()
+        return revision, epoch, plan_name, digests
+
+    # ---- Writing ----
+    @staticmethod
+    def _insert_section(db: sqlite3.Connection, plan_id: int, position: int, data: dict, digest: bytes) -> None:
+        rows = data.get("rows", [])
+        section_id = db.execute(
+            "INSERT INTO sections (plan_id, name, position, is_ga, digest, rows, seats) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (plan_id, data["name"], position, int(bool(data.get("is_ga"))), digest,
+             len(rows), sum(len(row.get("seats", [])) for row in rows)),
+        ).lastrowid
+        for row_position, row in enumerate(rows):
+            row_id = db.execute(
+                "INSERT INTO section_rows (section_id, row_number, position) VALUES (?, ?, ?)",
+                (section_id, row["row_number"], row_position),
+            ).lastrowid
+            db.executemany(
+                "INSERT INTO seats (row_id, position, seat_number) VALUES (?, ?, ?)",
+                ((row_id, seat_position, seat["seat_number"]) for seat_position, seat in enumerate(row.get("seats", []))),
+            )
+
+    def write_sections(self, db: sqlite3.Connection, name: str, plan_name: str, order: List[str],
+                       sections: Dict[str, Tuple[dict, bytes]]) -> int:
+        """
+        Bring a stored plan in line with 'order' (all its section names) inside the
+        caller's transaction. 'sections' maps names to (Section.to_dict(), digest) for
+        the sections that may have changed; any other name in 'order' must already be
+        stored. Sections whose digest matches are kept, missing names are deleted.
+        Returns the plan's new revision.
+        """
+        db.execute(
+            "INSERT INTO plans (name, plan_name, modified, epoch) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET plan_name = excluded.plan_name, modified = excluded.modified",
+            (name, plan_name, time.time(), secrets.token_hex(4)),
+        )
+        plan_id = self._plan_id(db, name)
+        stored = {
+            section_name: (section_id, digest, position)
+            for section_id, section_name, digest, position in db.execute(
+                "SELECT id, name, digest, position FROM sections WHERE plan_id = ?", (plan_id,))
+        }
+        kept = set()
+        replaced = []
+        for position, section_name in enumerate(order):
+            current = stored.get(section_name)
+            data, digest = sections.get(section_name, (None, current[1] if current else None))
+            if current is not None and current[1] == digest:
+                kept.add(current[0])
+                if current[2] != position:
+                    db.execute("UPDATE sections SET position = ? WHERE id = ?", (position, current[0]))
+                continue
+            if data is None:
+                raise ValueError(f"Section '{section_name}' is neither stored nor given")
+            replaced.append((position, data, digest))
+        # rows and seats of dropped or changed sections go with them (ON DELETE CASCADE)
+        db.executemany(
+            "DELETE FROM sections WHERE id = ?",
+            [(section_id,) for section_id, _, _ in stored.values() if section_id not in kept],
+        )
+        for position, data, digest in replaced:
+            self._insert_section(db, plan_id, position, data, digest)
+        db.execute(
+            "UPDATE plans SET revision = revision + 1, "
+            "sections = (SELECT COUNT(*) FROM sections WHERE plan_id = :id), "
+            "ga_sections = (SELECT COALESCE(SUM(is_ga), 0) FROM sections WHERE plan_id = :id), "
+            "rows = (SELECT COALESCE(SUM(rows), 0) FROM sections WHERE plan_id = :id), "
+            "seats = (SELECT COALESCE(SUM(seats), 0) FROM sections WHERE plan_id = :id) "
+            "WHERE id = :id",
+            {"id": plan_id},
+        )
+        return db.execute("SELECT revision FROM plans WHERE id = ?", (plan_id,)).fetchone()[0]
+
+    def save_data(self, name: str, data: dict, compression: Optional[str] = None) -> str:
+        # compression does not apply to a database; the argument is accepted and ignored
+        sections = {section["name"]: (section, section_digest(section)) for section in data.get("sections", [])}
+        with self._transaction() as db:
+            self.write_sections(db, name, data.get("seating_plan_name"), list(sections), sections)
+        return self.path
+
+    # ---- Job statuses ----
+    def put_job(self, job_id: str, data: str) -> None:
+        with self._transaction() as db:
+            db.execute("INSERT OR REPLACE INTO jobs (id, data, updated) VALUES (?, ?, ?)", (job_id, data, time.time()))
+            db.execute(
+                "DELETE FROM jobs WHERE id NOT IN (SELECT id FROM jobs ORDER BY updated DESC LIMIT ?)",
+                (MAX_STORED_JOBS,),
+            )
+
+    def get_job(self, job_id: str) -> Optional[str]:
+        row = self._connection().execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def list_jobs(self) -> List[str]:
+        return [data for (data,) in self._connection().execute("SELECT data FROM jobs ORDER BY updated")]
+
+    def delete(self, name: str) -> None:
+        with self._transaction() as db:
+            if db.execute("DELETE FROM plans WHERE name = ?", (name,)).rowcount == 0:
+                raise FileNotFoundError(f"Project '{name}' not found")
@@ -0,0 +1,222 @@
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+import threading
+from typing import Dict, List, Optional
+
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+from src.api.catalog import ProjectCatalog
+from src.api.metrics import timed
+from src.utils.compression import PROJECT_EXTENSIONS, compression_for_path, strip_project_extension
+
+# Directory holding saved projects (one JSON file per project)
+PROJECTS_DIR = os.environ.get("PROJECTS_DIR", "projects")
+
+# File extension used when saving with each compression setting
+SAVE_EXTENSIONS = {None: ".json", "gzip": ".json.gz", "xz": ".json.xz"}
+
+# "json" (one file per project in PROJECTS_DIR) or "sqlite" (one database, see
+# src/api/sqlite_storage.py, at PROJECTS_DB or PROJECTS_DIR/projects.db)
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "json")
+
+
+def ensure_projects_dir():
+    """Ensure projects directory exists."""
+    Path(PROJECTS_DIR).mkdir(exist_ok=True)
+
+
+class StorageBackend(ABC):
+    """
+    Where saved projects live. The module functions below (load_plan, save_plan ...)
+    delegate to the backend returned by get_backend().
+    """
+
+    @abstractmethod
+    def exists(self, name: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_names(self) -> List[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def entries(self) -> List[dict]:
+        """Metadata of every saved project, as listed by /api/projects/list."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, name: str) -> SeatingPlan:
+        """Raises FileNotFoundError when the project does not exist."""
+        raise NotImplementedError
+
+    def load_section(self, name: str, section_name: str) -> Section:
+        """One section of a saved project. Raises FileNotFoundError / KeyError."""
+        return self.load(name).sections[section_name]
+
+    @abstractmethod
+    def save_data(self, name: str, data: dict, compression: Optional[str] = None) -> str:
+        """Save a plan serialized with SeatingPlan.to_dict(); returns where it went."""
+        raise NotImplementedError
+
+    def saved_compression(self, name: str) -> Optional[str]:
+        return None
+
+    @abstractmethod
+    def delete(self, name: str) -> None:
+        """Raises FileNotFoundError when the project does not exist."""
+        raise NotImplementedError
+
+
+# ---- JSON files ----
+
+_catalogs: Dict[str, ProjectCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog() -> ProjectCatalog:
+    """The catalog of saved projects in PROJECTS_DIR."""
+    ensure_projects_dir()
+    with _catalogs_lock:
+        catalog = _catalogs.get(PROJECTS_DIR)
+        if catalog is None:
+            catalog = _catalogs[PROJECTS_DIR] = ProjectCatalog(PROJECTS_DIR)
+        return catalog
+
+
+def get_project_path(name: str, compression: Optional[str] = None) -> str:
+    """Get the file path a project is saved to."""
+    ensure_projects_dir()
+    return os.path.join(PROJECTS_DIR, f"{name}{SAVE_EXTENSIONS[compression]}")
+
+
+def find_project_path(name: str) -> Optional[str]:
+    """Find the existing file for a project, whatever its (compressed) format."""
+    ensure_projects_dir()
+    for ext in PROJECT_EXTENSIONS:
+        path = os.path.join(PROJECTS_DIR, f"{name}{ext}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def list_project_names() -> List[str]:
+    ensure_projects_dir()
+    names = []
+    for filename in os.listdir(PROJECTS_DIR):
+        name = strip_project_extension(filename)
+        if name is not None and name not in names:
+            names.append(name)
+    return names
+
+
+class JsonFileBackend(StorageBackend):
+    """One (optionally compressed) JSON file per project in PROJECTS_DIR, rewritten on save."""
+
+    def exists(self, name: str) -> bool:
+        return find_project_path(name) is not None
+
+    def list_names(self) -> List[str]:
+        return list_project_names()
+
+    def entries(self) -> List[dict]:
+        return get_catalog().entries()
+
+    def load(self, name: str) -> SeatingPlan:
+        path = find_project_path(name)
+        if path is None:
+            raise FileNotFoundError(f"Project '{name}' not found")
+        plan = SeatingPlan()
+        plan.import_project(path)
+        return plan
+
+    def save_data(self, name: str, data: dict, compression: Optional[str] = None) -> str:
+        path = get_project_path(name, compression)
+        SeatingPlan.write_project_data(data, path)
+        # replace copies of the project saved in another format
+        for ext in PROJECT_EXTENSIONS:
+            other = os.path.join(PROJECTS_DIR, f"{name}{ext}")
+            if other != path and os.path.exists(other):
+                os.remove(other)
+        get_catalog().record(name, path, data)
+        return path
+
+    def saved_compression(self, name: str) -> Optional[str]:
+        path = find_project_path(name)
+        return compression_for_path(path) if path else None
+
+    def delete(self, name: str) -> None:
+        path = find_project_path(name)
+        if path is None:
+            raise FileNotFoundError(f"Project '{name}' not found")
+        os.remove(path)
+        get_catalog().remove(name)
+
+
+# ---- Backend selection ----
+
+_backend: Optional[StorageBackend] = None
+
+
+def get_backend() -> StorageBackend:
+    global _backend
+    if _backend is None:
+        if STORAGE_BACKEND == "sqlite":
+            from src.api.sqlite_storage import SqliteBackend
+
+            ensure_projects_dir()
+            _backend = SqliteBackend(os.environ.get("PROJECTS_DB") or os.path.join(PROJECTS_DIR, "projects.db"))
+        elif STORAGE_BACKEND == "json":
+            _backend = JsonFileBackend()
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND '{STORAGE_BACKEND}'")
+    return _backend
+
+
+def set_backend(backend: Optional[StorageBackend]) -> None:
+    """Use another backend (None: the one configured by STORAGE_BACKEND)."""
+    global _backend
+    _backend = backend
+
+
+def project_exists(name: str) -> bool:
+    return get_backend().exists(name)
+
+
+def project_entries() -> List[dict]:
+    return get_backend().entries()
+
+
+def load_plan(name: str) -> SeatingPlan:
+    """Load a saved project. Raises FileNotFoundError when it does not exist."""
+    with timed("load"):
+        return get_backend().load(name)
+
+
+def load_section(name: str, section_name: str) -> Section:
+    """Load one section of a saved project without the rest of the plan where the backend can."""
+    with timed("load_section"):
+        return get_backend().load_section(name, section_name)
+
+
+def save_plan(name: str, plan: SeatingPlan, compression: Optional[str] = None) -> str:
+    """Save a project, replacing copies of it saved in another format."""
+    with timed("serialize"):
+        data = plan.to_dict()
+    return save_plan_data(name, data, compression)
+
+
+def save_plan_data(name: str, data: dict, compression: Optional[str] = None) -> str:
+    """Like save_plan, for a plan already serialized with SeatingPlan.to_dict()."""
+    with timed("save"):
+        return get_backend().save_data(name, data, compression)
+
+
+def saved_compression(name: str) -> Optional[str]:
+    """Compression of the existing saved file, so re-saves keep the format."""
+    return get_backend().saved_compression(name)
+
+
+def delete_project(name: str) -> None:
+    """Delete a saved project. Raises FileNotFoundError when it does not exist."""
+    get_backend().delete(name)
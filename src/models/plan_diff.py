@@ -0,0 +1,265 @@
+from typing import Dict, List, Optional, Tuple
+
+from .seating_plan import SeatingPlan
+from .section import Section
+from ..utils.alphanum_handler import alphanum_sort_key
+
+
+def _group_by_row(section: Section, keys) -> Dict[str, List[str]]:
+    rows: Dict[str, List[str]] = {}
+    for key in keys:
+        seat = section.seats[key]
+        rows.setdefault(seat.row_number, []).append(seat.seat_number)
+    return {
+        row: sorted(seats, key=alphanum_sort_key)
+        for row, seats in sorted(rows.items(), key=lambda item: alphanum_sort_key(item[0]))
+    }
+
+
+class SectionDiff:
+    """Seat-level changes of one section, grouped by row."""
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.seats_added: Dict[str, List[str]] = {}
+        self.seats_removed: Dict[str, List[str]] = {}
+        # (old, new) when the GA flag changed
+        self.is_ga: Optional[Tuple[bool, bool]] = None
+
+    def is_empty(self) -> bool:
+        return not self.seats_added and not self.seats_removed and self.is_ga is None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "seats_added": self.seats_added,
+            "seats_removed": self.seats_removed,
+            "is_ga": list(self.is_ga) if self.is_ga else None,
+        }
+
+
+class PlanDiff:
+    """Structured change set turning plan 'a' into plan 'b'."""
+
+    def __init__(self) -> None:
+        self.name: Optional[Tuple[str, str]] = None
+        self.sections_added: List[str] = []
+        self.sections_removed: List[str] = []
+        self.sections_renamed: List[Tuple[str, str]] = []
+        self.sections_changed: Dict[str, SectionDiff] = {}
+
+    def is_empty(self) -> bool:
+        return not (self.name or self.sections_added or self.sections_removed
+                    or self.sections_renamed or self.sections_changed)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": list(self.name) if self.name else None,
+            "sections_added": self.sections_added,
+            "sections_removed": self.sections_removed,
+            "sections_renamed": [list(pair) for pair in self.sections_renamed],
+            "sections_changed": [d.to_dict() for d in self.sections_changed.values()],
+        }
+
+
+def diff_sections(a: Section, b: Section) -> SectionDiff:
+    """Seat-level diff of two versions of a section (names are not compared)."""
+    result = SectionDiff(b.name)
+    if a.is_ga != b.is_ga:
+        result.is_ga = (a.is_ga, b.is_ga)
+    keys_a = a.seats.keys()
+    keys_b = b.seats.keys()
+    result.seats_added = _group_by_row(b, keys_b - keys_a)
+    result.seats_removed = _group_by_row(a, keys_a - keys_b)
+    return result
+
+
+def diff_plans(a: SeatingPlan, b: SeatingPlan) -> PlanDiff:
+    """
+    Compare two plans section by section.
+
+    Sections whose fingerprint and GA flag match are skipped without looking at their
+    seats. A section that disappeared from 'a' and appears in 'b' under another name
+    with identical content is reported as a rename rather than a remove + add.
+    """
+    result = PlanDiff()
+    if a.name != b.name:
+        result.name = (a.name, b.name)
+
+    fingerprints_a = {name: s.fingerprint for name, s in a.sections.items()}
+    fingerprints_b = {name: s.fingerprint for name, s in b.sections.items()}
+
+    for name, section_a in a.sections.items():
+        section_b = b.sections.get(name)
+        if section_b is None:
+            continue
+        if fingerprints_a[name] == fingerprints_b[name] and section_a.is_ga == section_b.is_ga:
+            continue
+        section_diff = diff_sections(section_a, section_b)
+        if not section_diff.is_empty():
+            result.sections_changed[name] = section_diff
+
+    removed = [name for name in a.sections if name not in b.sections]
+    added = [name for name in b.sections if name not in a.sections]
+
+    # pair removed/added sections with identical content as renames
+    candidates: Dict[Tuple[int, bool], List[str]] = {}
+    for name in added:
+        candidates.setdefault((fingerprints_b[name], b.sections[name].is_ga), []).append(name)
+    for name in removed:
+        matches = candidates.get((fingerprints_a[name], a.sections[name].is_ga))
+        if matches and a.sections[name].seats.keys() == b.sections[matches[0]].seats.keys():
+            result.sections_renamed.append((name, matches.pop(0)))
+        else:
+            result.sections_removed.append(name)
+    renamed_to = {new for _, new in result.sections_renamed}
+    result.sections_added = [name for name in added if name not in renamed_to]
+    return result
+
+
+def diff_project_files(path_a: str, path_b: str) -> PlanDiff:
+    """Diff two saved project files (plain or compressed JSON)."""
+    a = SeatingPlan()
+    a.import_project(path_a)
+    b = SeatingPlan()
+    b.import_project(path_b)
+    return diff_plans(a, b)
+
+
+# ---- Three-way merge ----
+
+class MergeConflict:
+    """A change both sides made incompatibly. 'ours' wins in the merged plan."""
+
+    def __init__(self, kind: str, section: Optional[str], detail: str) -> None:
+        self.kind: str = kind
+        self.section: Optional[str] = section
+        self.detail: str = detail
+
+    def __repr__(self) -> str:
+        return f"MergeConflict(kind='{self.kind}', section='{self.section}', detail='{self.detail}')"
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "section": self.section, "detail": self.detail}
+
+
+class MergeResult:
+    def __init__(self, plan: SeatingPlan, conflicts: List[MergeConflict]) -> None:
+        self.plan: SeatingPlan = plan
+        self.conflicts: List[MergeConflict] = conflicts
+
+    @property
+    def clean(self) -> bool:
+        return not self.conflicts
+
+
+def _fate(name: str, d: PlanDiff, renames: Dict[str, str]) -> Tuple[str, Optional[str]]:
+    """What one side did to a base section: (kind, new_name)."""
+    if name in renames:
+        return "renamed", renames[name]
+    if name in d.sections_removed:
+        return "removed", None
+    if name in d.sections_changed:
+        return "changed", name
+    return "unchanged", name
+
+
+def _apply_section_diff(section: Section, d: SectionDiff) -> None:
+    for row, seats in d.seats_removed.items():
+        for seat_number in seats:
+            section.delete_seat(row, seat_number)
+    for row, seats in d.seats_added.items():
+        for seat_number in seats:
+            section.add_seat(row, seat_number)
+    if d.is_ga is not None:
+        section.is_ga = d.is_ga[1]
+
+
+def _copy_section(section: Section, name: str) -> Section:
+    copied = section.clone()
+    copied.name = name
+    copied.is_ga = section.is_ga
+    return copied
+
+
+def merge_plans(base: SeatingPlan, ours: SeatingPlan, theirs: SeatingPlan) -> MergeResult:
+    """
+    Three-way merge of two edited copies of 'base'.
+
+    Independent edits (different sections, or different seats of the same section) are
+    combined. Incompatible edits (rename/rename to different names, delete/modify,
+    add/add with different content, differing GA flags or plan names) are reported as
+    conflicts and resolved in favour of 'ours'.
+    """
+    d_ours = diff_plans(base, ours)
+    d_theirs = diff_plans(base, theirs)
+    renames_ours = dict(d_ours.sections_renamed)
+    renames_theirs = dict(d_theirs.sections_renamed)
+    conflicts: List[MergeConflict] = []
+
+    name = base.name
+    if d_ours.name and d_theirs.name and d_ours.name[1] != d_theirs.name[1]:
+        conflicts.append(MergeConflict("name", None, f"plan renamed to '{ours.name}' and '{theirs.name}'"))
+        name = ours.name
+    elif d_ours.name or d_theirs.name:
+        name = (d_ours.name or d_theirs.name)[1]
+    merged = SeatingPlan(name)
+
+    def place(section: Section) -> None:
+        if section.name in merged.sections:
+            conflicts.append(MergeConflict("name_collision", section.name,
+                                           "both sides produced a section with this name"))
+            return
+        merged.sections[section.name] = section
+
+    for base_name, base_section in base.sections.items():
+        o_kind, o_name = _fate(base_name, d_ours, renames_ours)
+        t_kind, t_name = _fate(base_name, d_theirs, renames_theirs)
+
+        if o_kind == "removed" or t_kind == "removed":
+            other_kind = t_kind if o_kind == "removed" else o_kind
+            if other_kind in ("removed", "unchanged"):
+                continue
+            conflicts.append(MergeConflict("delete_modify", base_name,
+                                           f"ours {o_kind}, theirs {t_kind}"))
+            if o_kind != "removed":
+                place(_copy_section(ours.sections[o_name], o_name))
+            continue
+
+        # the surviving name: a rename on either side wins over keeping the base name
+        new_name = base_name
+        if o_kind == "renamed" and t_kind == "renamed" and o_name != t_name:
+            conflicts.append(MergeConflict("rename_rename", base_name,
+                                           f"renamed to '{o_name}' and '{t_name}'"))
+            new_name = o_name
+        elif o_kind == "renamed":
+            new_name = o_name
+        elif t_kind == "renamed":
+            new_name = t_name
+
+        section = _copy_section(base_section, new_name)
+        changes_ours = d_ours.sections_changed.get(base_name)
+        changes_theirs = d_theirs.sections_changed.get(base_name)
+        if (changes_ours and changes_theirs and changes_ours.is_ga and changes_theirs.is_ga
+                and changes_ours.is_ga[1] != changes_theirs.is_ga[1]):
+            conflicts.append(MergeConflict("is_ga", base_name, "GA flag changed differently"))
+        for changes in (changes_theirs, changes_ours):
+            if changes:
+                _apply_section_diff(section, changes)
+        place(section)
+
+    added_ours = set(d_ours.sections_added)
+    for added_name in d_ours.sections_added:
+        place(_copy_section(ours.sections[added_name], added_name))
+    for added_name in d_theirs.sections_added:
+        theirs_section = theirs.sections[added_name]
+        if added_name in added_ours:
+            ours_section = ours.sections[added_name]
+            if (ours_section.seats.keys() != theirs_section.seats.keys()
+                    or ours_section.is_ga != theirs_section.is_ga):
+                conflicts.append(MergeConflict("add_add", added_name,
+                                               "added on both sides with different seats"))
+            continue
+        place(_copy_section(theirs_section, added_name))
+
+    return MergeResult(merged, conflicts)
@@ -1,9 +1,12 @@
 import json
 import re
-from bs4 import BeautifulSoup
-from openpyxl import Workbook
-from typing import Dict, List
-from .section import Section
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from .section import Section, seat_hash
+from ..utils.compression import compression_for_path, detect_compression, open_text
+from ..utils.tracing import span, traced
+
+if TYPE_CHECKING:
+    from .plan_diff import PlanDiff
 
 class SeatingPlan:
     """Represents an entire seating plan project with multiple sections."""
@@ -12,6 +15,19 @@ class SeatingPlan:
         self.sections: Dict[str, Section] = {}
         self.name: str = name or "Unnamed Plan"
 
+    @property
+    def fingerprint(self) -> int:
+        """
+        Order-independent hash of all sections (names, GA flags and seats).
+
+        Built from the incrementally maintained Section.fingerprint values, so it costs
+        one small hash per section and never touches individual seats.
+        """
+        total = 0
+        for name, section in self.sections.items():
+            total += seat_hash(f"{name}\0{int(section.is_ga)}\0{section.fingerprint:016x}")
+        return total & ((1 << 64) - 1)
+
     # ---- Section Manipulation ----
     def add_section(self, name: str, is_ga: bool = False) -> None:
         if name not in self.sections:
@@ -33,6 +49,7 @@ class SeatingPlan:
             cloned.name = new_name
             self.sections[new_name] = cloned
 
+    @traced("SeatingPlan.clone_section_many")
     def clone_section_many(self, name: str, count: int) -> List[str]:
         """
         Clone the given section 'count' times, returning a list of created section names.
@@ -76,13 +93,29 @@ class SeatingPlan:
 
         return created
 
+    def diff(self, other: 'SeatingPlan') -> 'PlanDiff':
+        """Return the change set turning this plan into 'other'."""
+        from .plan_diff import diff_plans
+        return diff_plans(self, other)
+
     # ---- Serialization ----
-    def to_dict(self) -> dict:
+    @traced("SeatingPlan.to_dict")
+    def to_dict(self, progress: Optional[Callable[[int, int], None]] = None) -> dict:
+        """Serialize the plan; progress(done, total) is called after each section if given."""
+        if progress is None:
+            sections = [section.to_dict() for section in self.sections.values()]
+        else:
+            sections = []
+            total = len(self.sections)
+            for section in self.sections.values():
+                sections.append(section.to_dict())
+                progress(len(sections), total)
         return {
             "seating_plan_name": self.name,
-            "sections": [section.to_dict() for section in self.sections.values()]
+            "sections": sections
         }
 
+    @traced("SeatingPlan.from_dict")
     def from_dict(self, data: dict) -> None:
         self.name = data.get("seating_plan_name", "Unnamed Plan")
         self.sections = {}
@@ -91,19 +124,39 @@ class SeatingPlan:
             self.sections[section.name] = section
 
     # ---- File I/O ----
+    @traced("SeatingPlan.export_project")
     def export_project(self, file_path: str) -> None:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        """
+        Write the plan as JSON. Paths ending in .gz or .xz (e.g. "venue.json.gz",
+        "venue.seatproj.xz") are compressed on the fly with gzip/lzma.
+        """
+        self.write_project_data(self.to_dict(), file_path)
+
+    @staticmethod
+    @traced("SeatingPlan.write_project_data")
+    def write_project_data(data: dict, file_path: str) -> None:
+        """Write an already serialized plan (see to_dict) the way export_project does."""
+        compression = compression_for_path(file_path)
+        with open_text(file_path, "w", compression) as f:
+            if compression:
+                json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+            else:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
+    @traced("SeatingPlan.import_project")
     def import_project(self, file_path: str) -> None:
-        with open(file_path, "r", encoding="utf-8") as f:
+        """Load a JSON project; gzip/lzma compression is detected from the file content."""
+        with span("import_project.parse", path=file_path), \
+                open_text(file_path, "r", detect_compression(file_path)) as f:
             data = json.load(f)
-            self.from_dict(data)
+        self.from_dict(data)
 
+    @traced("SeatingPlan.import_from_excel")
     def import_from_excel(self, file_path: str) -> None:
         from openpyxl import load_workbook
 
-        wb = load_workbook(filename=file_path, read_only=True)
+        with span("import_from_excel.open", path=file_path):
+            wb = load_workbook(filename=file_path, read_only=True)
         ws = wb.active
         
         headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
@@ -136,10 +189,12 @@ class SeatingPlan:
             for seat_label in seat_labels:
                 self.sections[section_name].add_seat(row_identifier, seat_label)
 
+    @traced("SeatingPlan.import_from_avail")
     def import_from_avail(self, file_path: str) -> None:
-       
+        from bs4 import BeautifulSoup
+
         txt = file_path 
-        with open(txt, 'r', encoding='utf-8') as f:
+        with span("import_from_avail.read", path=file_path), open(txt, 'r', encoding='utf-8') as f:
             content = f.read()
         
         def get_dict_per_row(tag):
@@ -191,58 +246,74 @@ class SeatingPlan:
 
                 dicts.append(dict)
             return dicts
-        dicts = avail_parser(content)
-        for row_dict in dicts:
-            section_name = row_dict['section']
-            row_identifier = row_dict['rows']
-            seats_str = row_dict['seats']
-
-            if section_name is None or row_identifier is None or seats_str is None:
-                continue
+        with span("import_from_avail.parse"):
+            dicts = avail_parser(content)
+        with span("import_from_avail.build", lines=len(dicts)):
+            for row_dict in dicts:
+                section_name = row_dict['section']
+                row_identifier = row_dict['rows']
+                seats_str = row_dict['seats']
 
-            if section_name not in self.sections:
-                self.add_section(section_name)
+                if section_name is None or row_identifier is None or seats_str is None:
+                    continue
 
-            row_labels = [r.strip() for r in row_identifier.split(",") if r.strip()]
-            seat_labels = [s.strip() for s in seats_str.split(",") if s.strip()]
-            for row_label in row_labels:
-                for seat_label in seat_labels:
-                    self.sections[section_name].add_seat(row_label, seat_label)
+                if section_name not in self.sections:
+                    self.add_section(section_name)
 
+                row_labels = [r.strip() for r in row_identifier.split(",") if r.strip()]
+                seat_labels = [s.strip() for s in seats_str.split(",") if s.strip()]
+                for row_label in row_labels:
+                    for seat_label in seat_labels:
+                        self.sections[section_name].add_seat(row_label, seat_label)
+
+    # Columns of the Excel manifest written by export_to_excel and read by import_from_excel
+    MANIFEST_HEADERS = ["section", "rows", "seats", "secnam", "capacity", "type"]
+
+    @staticmethod
+    def manifest_rows(section: Section) -> List[list]:
+        """Manifest lines of one section: a GA line if it is GA, then one line per row."""
+        lines = []
+        if section.is_ga:
+            lines.append([
+                section.name,           # section
+                "",                     # rows
+                "",                     # seats
+                section.name,           # secnam
+                "1",                    # capacity (set to 1)
+                1                       # type (1 for GA)
+            ])
+        rows = {}
+        for seat in section.seats.values():
+            rows.setdefault(seat.row_number, []).append(str(seat.seat_number))
+
+        for row_number, seat_list in rows.items():
+            try:
+                seat_list_sorted = sorted(seat_list, key=lambda x: int(x) if x.isdigit() else x)
+            except:
+                seat_list_sorted = sorted(seat_list)
+            lines.append([
+                section.name,             # section
+                row_number,               # rows
+                ",".join(seat_list_sorted),  # seats
+                section.name,             # secnam
+                "",                       # capacity (blank)
+                0                         # type  (0 for seated)
+            ])
+        return lines
+
+    @traced("SeatingPlan.export_to_excel")
     def export_to_excel(self, file_path: str) -> None:
+        from openpyxl import Workbook
+
         wb = Workbook()
         ws = wb.active
         ws.title = "Seating Plan"
 
-        headers = ["section", "rows", "seats", "secnam", "capacity", "type"]
-        ws.append(headers)
+        ws.append(self.MANIFEST_HEADERS)
 
         # Iterate through sections and rows
         for section in self.sections.values():
-            if section.is_ga:
-                ws.append([
-                    section.name,           # section
-                    "",                     # rows
-                    "",                     # seats
-                    section.name,           # secnam
-                    "1",                    # capacity (set to 1)
-                    1                       # type (1 for GA)
-                ])
-            rows = {}
-            for seat in section.seats.values():
-                rows.setdefault(seat.row_number, []).append(str(seat.seat_number))
-
-            for row_number, seat_list in rows.items():
-                try:
-                    seat_list_sorted = sorted(seat_list, key=lambda x: int(x) if x.isdigit() else x)
-                except:
-                    seat_list_sorted = sorted(seat_list)
-                ws.append([
-                    section.name,             # section
-                    row_number,               # rows
-                    ",".join(seat_list_sorted),  # seats
-                    section.name,             # secnam
-                    "",                       # capacity (blank)
-                    0                         # type  (0 for seated)
-                ])
-        wb.save(file_path)
\ No newline at end of file
+            for line in self.manifest_rows(section):
+                ws.append(line)
+        with span("export_to_excel.save", path=file_path):
+            wb.save(file_path)
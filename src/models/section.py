@@ -1,7 +1,18 @@
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, Optional
+from hashlib import blake2b
 from .seat import Seat
 import copy
+from string import ascii_uppercase
 from ..utils.alphanum_handler import alphanum_range, to_index, from_index, alphanum_sort_key
+from ..utils.tracing import traced
+
+_HASH_MASK = (1 << 64) - 1
+
+
+def seat_hash(seat_key: str) -> int:
+    """Stable 64-bit hash of a seat key (identical across processes, unlike hash())."""
+    return int.from_bytes(blake2b(seat_key.encode(), digest_size=8).digest(), "little")
+
 
 class Section:
     """Represents a section containing multiple seats."""
@@ -11,13 +22,94 @@ class Section:
         # Seats keyed by "ROW-SEAT"
         self.seats: Dict[str, Seat] = {}
         self.is_ga: bool = is_ga
+        # Sum of seat_hash() over all seat keys, kept up to date by every mutation
+        self._fingerprint: int = 0
+        # Row index: row label -> {seat number: Seat}, sharing the Seat objects in
+        # self.seats. Rows appear in the order they were created and disappear when
+        # their last seat is removed.
+        self._rows: Dict[str, Dict[str, Seat]] = {}
+        # Net seat changes since track_changes(), or None when not tracking:
+        # seat key -> (added, row, seat number)
+        self._changes: Optional[Dict[str, tuple]] = None
+
+    @property
+    def fingerprint(self) -> int:
+        """Order-independent hash of the seats in this section (name and GA flag excluded)."""
+        return self._fingerprint
+
+    # ---- Change Tracking ----
+    # Every seat key entering or leaving self.seats goes through these two methods,
+    # which keep the fingerprint and the change log up to date.
+    def _key_added(self, seat_key: str, seat: Seat) -> None:
+        self._fingerprint = (self._fingerprint + seat_hash(seat_key)) & _HASH_MASK
+        if self._changes is not None:
+            self._log_change(seat_key, seat, True)
+
+    def _key_removed(self, seat_key: str, seat: Seat) -> None:
+        self._fingerprint = (self._fingerprint - seat_hash(seat_key)) & _HASH_MASK
+        if self._changes is not None:
+            self._log_change(seat_key, seat, False)
+
+    def _log_change(self, seat_key: str, seat: Seat, added: bool) -> None:
+        previous = self._changes.get(seat_key)
+        if previous is not None and previous[0] != added:
+            # removed and re-added (or the reverse) since tracking started
+            del self._changes[seat_key]
+        else:
+            self._changes[seat_key] = (added, seat.row_number, seat.seat_number)
+
+    def track_changes(self) -> None:
+        """Start recording which seats are added and removed (see pop_changes)."""
+        self._changes = {}
+
+    def pop_changes(self):
+        """
+        Stop tracking and return the net (added, removed) seats since track_changes(),
+        each a list of (row, seat number). Both are empty when tracking was off.
+        """
+        changes, self._changes = self._changes, None
+        added: List[tuple] = []
+        removed: List[tuple] = []
+        for is_added, row, seat_number in (changes or {}).values():
+            (added if is_added else removed).append((row, seat_number))
+        return added, removed
+
+    # ---- Row Index ----
+    def _index_add(self, seat: Seat) -> None:
+        self._rows.setdefault(seat.row_number, {})[seat.seat_number] = seat
+
+    def _index_remove(self, seat: Seat) -> None:
+        row_seats = self._rows.get(seat.row_number)
+        if row_seats is not None and row_seats.get(seat.seat_number) is seat:
+            del row_seats[seat.seat_number]
+            if not row_seats:
+                del self._rows[seat.row_number]
+
+    def row_numbers(self) -> List[str]:
+        """Row labels in the order the rows were created."""
+        return list(self._rows)
+
+    def row_seats(self, row: str) -> List[Seat]:
+        """Seats of one row (empty if the row does not exist), without scanning the section."""
+        return list(self._rows.get(row, {}).values())
+
+    def has_row(self, row: str) -> bool:
+        return row in self._rows
+
+    @property
+    def row_count(self) -> int:
+        return len(self._rows)
 
     # ---- Seat Manipulation ----
     def add_seat(self, row: str, seat_number: str) -> None:
         seat_key = f"{row}-{seat_number}"
         if seat_key not in self.seats:
-            self.seats[seat_key] = Seat(row, seat_number)
+            seat = Seat(row, seat_number)
+            self.seats[seat_key] = seat
+            self._index_add(seat)
+            self._key_added(seat_key, seat)
 
+    @traced("Section.add_seat_range")
     def add_seat_range(self, row: str, start_seat: Union[int, str], end_seat: Union[int, str]) -> None:
         """
         Add seats for a given 'row' between start_seat and end_seat inclusive.
@@ -47,14 +139,140 @@ class Section:
         for s in seats:
             self.add_seat(row, str(s))
 
+    @traced("Section.add_row_range")
+    def add_row_range(
+        self,
+        start_row: str,
+        end_row: str,
+        start_seat: str,
+        end_seat: str,
+        parity: Optional[str] = "all",
+        continuous: Optional[bool] = False,
+        row_prefix: Optional[str] = "",
+        row_suffix: Optional[str] = "",
+        unnumbered_rows: Optional[bool] = False,
+    ) -> List[str]:
+        """
+        Add several rows, each with a range of seats, and return the row labels.
+
+        - start_row, end_row: row range (numeric or single letters)
+        - start_seat, end_seat: seat range for each row
+        - parity: "all", "even" or "odd" (filters numeric seats)
+        - continuous: if True, seat numbers continue across rows (numeric seats only)
+        - row_prefix, row_suffix: applied to row labels
+        - unnumbered_rows: if True, rows are labelled '#<row>' instead
+
+        Raises ValueError for ranges that cannot be expanded; nothing is added then.
+        """
+        # Build rows list (numeric or letter ranges)
+        try:
+            rs = int(start_row)
+            re_ = int(end_row)
+            rows_raw = [str(i) for i in range(min(rs, re_), max(rs, re_) + 1)]
+        except ValueError:
+            try:
+                si = ascii_uppercase.index(start_row.upper())
+                ei = ascii_uppercase.index(end_row.upper())
+            except ValueError:
+                raise ValueError("Invalid row range")
+            rows_raw = list(ascii_uppercase[min(si, ei):max(si, ei) + 1])
+
+        if unnumbered_rows:
+            rows = [f"#{r}" for r in rows_raw]
+        else:
+            rows = [f"{row_prefix or ''}{r}{row_suffix or ''}" for r in rows_raw]
+        if not rows:
+            raise ValueError("No rows generated")
+
+        parity = (parity or "all").lower()
+
+        def keep(seat_label: str) -> bool:
+            if parity == "all":
+                return True
+            if not seat_label.isdigit():
+                return False
+            return int(seat_label) % 2 == (0 if parity == "even" else 1)
+
+        if continuous:
+            try:
+                s0 = int(start_seat)
+                s1 = int(end_seat)
+            except ValueError:
+                raise ValueError("Continuous numbering requires numeric seat labels")
+            seats_per_row = abs(s1 - s0) + 1
+            seq = min(s0, s1)
+            for row in rows:
+                for seat_number in range(seq, seq + seats_per_row):
+                    if keep(str(seat_number)):
+                        self.add_seat(row, str(seat_number))
+                seq += seats_per_row
+        else:
+            seats = alphanum_range(start_seat, end_seat)
+            if not seats:
+                try:
+                    a = int(start_seat)
+                    b = int(end_seat)
+                except ValueError:
+                    raise ValueError("Invalid seat range")
+                seats = [str(i) for i in range(min(a, b), max(a, b) + 1)]
+            for row in rows:
+                for seat in seats:
+                    if keep(seat):
+                        self.add_seat(row, seat)
+        return rows
+
     def delete_seat(self, row: str, seat_number: str) -> None:
         seat_key = f"{row}-{seat_number}"
-        self.seats.pop(seat_key, None)
+        seat = self.seats.pop(seat_key, None)
+        if seat is not None:
+            self._index_remove(seat)
+            self._key_removed(seat_key, seat)
+
+    @traced("Section.delete_seats")
+    def delete_seats(self, seat_keys) -> int:
+        """Delete the seats with the given "ROW-SEAT" keys; returns how many existed."""
+        deleted = 0
+        for seat_key in seat_keys:
+            seat = self.seats.pop(seat_key, None)
+            if seat is not None:
+                self._index_remove(seat)
+                self._key_removed(seat_key, seat)
+                deleted += 1
+        return deleted
 
+    def seat_keys_in_rows(self, rows) -> List[str]:
+        """Keys of every seat in the given rows, read from the row index."""
+        return [f"{row}-{seat.seat_number}" for row in rows for seat in self.row_seats(row)]
+
+    @traced("Section.transfer_to")
+    def transfer_to(self, other: 'Section', seat_keys) -> int:
+        """
+        Move the seats with the given keys into 'other', in O(len(seat_keys)).
+
+        Seat objects are handed over rather than copied. Keys missing from this section
+        are ignored; seats the target already has are removed here and not duplicated.
+        Returns the number of seats removed from this section.
+        """
+        if other is self:
+            return 0
+        moved = 0
+        for seat_key in seat_keys:
+            seat = self.seats.pop(seat_key, None)
+            if seat is None:
+                continue
+            self._index_remove(seat)
+            self._key_removed(seat_key, seat)
+            if seat_key not in other.seats:
+                other.seats[seat_key] = seat
+                other._index_add(seat)
+                other._key_added(seat_key, seat)
+            moved += 1
+        return moved
+
+    @traced("Section.delete_row")
     def delete_row(self, row: str) -> None:
-        keys_to_delete = [key for key in self.seats if key.startswith(f"{row}-")]
-        for key in keys_to_delete:
-            del self.seats[key]
+        for seat_number in list(self._rows.get(row, {})):
+            self.delete_seat(row, seat_number)
 
     # ---- Modification ----
     def rename(self, new_name: str) -> None:
@@ -64,10 +282,22 @@ class Section:
         old_key = f"{row}-{old_seat_number}"
         if old_key in self.seats:
             seat = self.seats.pop(old_key)
+            self._index_remove(seat)
+            self._key_removed(old_key, seat)
             seat.seat_number = new_seat_number
-            new_key = f"{row}-{new_seat_number}"
-            self.seats[new_key] = seat
+            self._insert_replacing(f"{row}-{new_seat_number}", seat)
 
+    def _insert_replacing(self, seat_key: str, seat: Seat) -> None:
+        """Store a seat under seat_key, replacing any seat already stored there."""
+        existing = self.seats.get(seat_key)
+        if existing is None:
+            self._key_added(seat_key, seat)
+        else:
+            self._index_remove(existing)
+        self.seats[seat_key] = seat
+        self._index_add(seat)
+
+    @traced("Section.renumber_rows")
     def renumber_rows(self, old_rows_ordered: list[str], new_start_row: str, add_prefix: bool = False):
         """
         Renumber multiple rows sequentially starting from new_start_row.
@@ -97,39 +327,53 @@ class Section:
         # Build mapping of old -> new rows
         row_mapping = dict(zip(old_rows_ordered, new_rows))
         
-        # Create a list of (old_key, new_key) pairs
-        changes = []
-        for old_key in list(self.seats.keys()):
-            seat = self.seats[old_key]
-            old_row = seat.row_number
-            if old_row in row_mapping:
-                new_row = row_mapping[old_row]
-                _, seat_number = old_key. split('-', 1)
-                new_key = f"{new_row}-{seat_number}"
-                changes.append((old_key, new_key, new_row))
-        
-        # Apply changes
-        for old_key, new_key, new_row in changes:
-            seat = self.seats[old_key]
+        # Detach every moved seat first so a row renumbered onto another renumbered
+        # row does not overwrite seats that have not moved yet
+        moved = []
+        for old_row, new_row in row_mapping.items():
+            for seat in self.row_seats(old_row):
+                old_key = f"{old_row}-{seat.seat_number}"
+                del self.seats[old_key]
+                self._key_removed(old_key, seat)
+                moved.append((new_row, seat))
+            self._rows.pop(old_row, None)
+        for new_row, seat in moved:
             seat.row_number = new_row
-            self.seats[new_key] = seat
-            del self.seats[old_key]
+            self._insert_replacing(f"{new_row}-{seat.seat_number}", seat)
+
+    def restore(self, other: 'Section') -> None:
+        """
+        Take over the seats of 'other' (e.g. a clone() taken earlier) in their order,
+        leaving 'other' empty. Seats that differ are logged as changes, so while tracking a restore undoes
+        the changes recorded since the clone.
+        """
+        for seat_key, seat in self.seats.items():
+            if seat_key not in other.seats:
+                self._key_removed(seat_key, seat)
+        for seat_key, seat in other.seats.items():
+            if seat_key not in self.seats:
+                self._key_added(seat_key, seat)
+        self.seats = other.seats
+        self._rows = other._rows
+        other.seats, other._rows, other._fingerprint = {}, {}, 0
 
+    @traced("Section.clone")
     def clone(self) -> 'Section':
         """Return a deep copy of this section with '_copy' appended to name."""
         new_section = Section(self.name + "_copy")
         for key, seat in self.seats.items():
-            new_section.seats[key] = copy.deepcopy(seat)
+            new_seat = copy.deepcopy(seat)
+            new_section.seats[key] = new_seat
+            new_section._index_add(new_seat)
+        new_section._fingerprint = self._fingerprint
         return new_section
 
     # ---- Serialization (JSON) ----
     def to_dict(self) -> dict:
         """Serialize section for hierarchical JSON structure."""
-        rows: Dict[str, List[Seat]] = {}
-        for seat in self.seats.values():
-            rows.setdefault(seat.row_number, []).append(seat)
         rows_list = []
-        for row_number, seats in rows.items():
+        for row_number, row_seats in self._rows.items():
+            seats = list(row_seats.values())
             try:
                 seats_sorted = sorted(seats, key=lambda s: int(s.seat_number))
             except ValueError:
@@ -141,6 +385,7 @@ class Section:
         return {"name": self.name, "is_ga": self.is_ga, "rows": rows_list}
 
     @classmethod
+    @traced("Section.from_dict")
     def from_dict(cls, data: dict) -> 'Section':
         """Deserialize section from hierarchical JSON structure."""
         section = cls(data["name"], is_ga=data.get("is_ga", False))
@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QAction
 from PyQt6.QtCore import Qt
 from ..models.seating_plan import SeatingPlan
+from ..utils.compression import PROJECT_EXTENSIONS
 from ..utils.json_io import import_project_dialog, import_from_excel_dialog, import_from_avail_dialog, export_project_dialog, export_to_excel_dialog
 from .section_view import SectionView
 
@@ -287,12 +288,18 @@ class MainWindow(QMainWindow):
     def save_project_dialog(self):
         # suggest filename using utils json helper behavior
         suggested = f"{self.seating_plan.name.replace(' ', '_').lower()}.seatproj"
-        path, _ = QFileDialog.getSaveFileName(self, "Save Project", suggested, "SeatProj (*.seatproj);;JSON (*.json);;All Files (*)")
+        filters = {
+            "SeatProj (*.seatproj)": ".seatproj",
+            "Compressed SeatProj (*.seatproj.xz)": ".seatproj.xz",
+            "Compressed JSON (*.json.gz)": ".json.gz",
+            "JSON (*.json)": ".json",
+        }
+        path, selected_filter = QFileDialog.getSaveFileName(self, "Save Project", suggested, ";;".join(filters) + ";;All Files (*)")
         if not path:
             return
-        # ensure extension
-        if not path.lower().endswith((".json", ".seatproj")):
-            path += ".seatproj"
+        # ensure extension (compressed formats are picked by extension)
+        if not path.lower().endswith(PROJECT_EXTENSIONS):
+            path += filters.get(selected_filter, ".seatproj")
         try:
             self.seating_plan.export_project(path)
             self.status_label.setText(f"\ud83d\udcbe Saved project: {Path(path).name} (Ctrl+S)")
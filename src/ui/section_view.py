@@ -8,6 +8,7 @@ from PyQt6.QtGui import QBrush, QPen, QPainter
 from PyQt6.QtCore import Qt, pyqtSignal, QEvent
 from ..models.section import Section
 from ..utils.alphanum_handler import alphanum_range, alphanum_sort_key
+from ..utils.tracing import traced
 from .dialogs import RangeInputDialog, RenumberRowsDialog
 from string import ascii_uppercase
 
@@ -146,20 +147,16 @@ class SectionView(QWidget):
                                vh - self.zoom_overlay.height() - margin)
 
     # ---------- Section Rendering ----------
+    @traced("SectionView.load_section")
     def load_section(self, section: Section | None):
         self.section = section
         self.scene.clear()
         if not section:
             return
 
-        # Group seats by row
-        seats_by_row = {}
-        for seat in section.seats.values():
-            seats_by_row.setdefault(seat.row_number, []).append(seat)
-
         all_seat_numbers = sorted({s.seat_number for s in section.seats.values()}, key=alphanum_sort_key)
 
-        sorted_rows = sorted(seats_by_row.keys(), key=alphanum_sort_key)
+        sorted_rows = sorted(section.row_numbers(), key=alphanum_sort_key)
 
         # Layout constants
         x_spacing = SeatItemRect.WIDTH + 5
@@ -171,7 +168,7 @@ class SectionView(QWidget):
         # Render seats
         y = 0
         for row in sorted_rows:
-            seats = {s.seat_number: s for s in seats_by_row[row]}
+            seats = {s.seat_number: s for s in section.row_seats(row)}
             row_label_sx = self.scene.addSimpleText(str(row))
             row_label_sx.setPos(-40, y)
             
@@ -272,13 +269,7 @@ class SectionView(QWidget):
             QMessageBox.warning(self, "Target Missing", "Target section could not be found.")
             return
 
-        for item in selected_items:
-            key = f"{item.row}-{item.seat}"
-            seat_obj = self.section.seats.get(key)
-            if seat_obj:
-                # add to target and remove from current
-                target_section.add_seat(seat_obj.row_number, seat_obj.seat_number)
-                self.section.delete_seat(seat_obj.row_number, seat_obj.seat_number)
+        self.section.transfer_to(target_section, [f"{item.row}-{item.seat}" for item in selected_items])
 
         # refresh main UI and this view
         try:
@@ -640,8 +631,7 @@ class SectionView(QWidget):
             return
         # push snapshot
         self.aboutToModify.emit()
-        for item in selected:
-            self.section.delete_seat(item.row, str(item.seat))
+        self.section.delete_seats([f"{item.row}-{item.seat}" for item in selected])
         self.load_section(self.section)
         self.sectionModified.emit()
 
@@ -0,0 +1,62 @@
+import gzip
+import io
+import lzma
+from typing import IO, Optional
+
+# Recognised project file extensions, longest first so suffix matching is unambiguous.
+PROJECT_EXTENSIONS = (
+    ".seatproj.gz", ".seatproj.xz", ".json.gz", ".json.xz",
+    ".seatproj", ".json",
+)
+
+# gzip level for saved projects: on plan JSON, level 9 takes about three times as
+# long as 6 for files only about a tenth smaller
+GZIP_LEVEL = 6
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
+
+def compression_for_path(file_path: str) -> Optional[str]:
+    """Return "gzip", "xz" or None depending on the file name suffix."""
+    lower = str(file_path).lower()
+    if lower.endswith(".gz"):
+        return "gzip"
+    if lower.endswith(".xz"):
+        return "xz"
+    return None
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """Return "gzip", "xz" or None by sniffing the file's magic bytes."""
+    with open(file_path, "rb") as f:
+        head = f.read(len(_XZ_MAGIC))
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(_XZ_MAGIC):
+        return "xz"
+    return None
+
+
+def strip_project_extension(filename: str) -> Optional[str]:
+    """Return the project name for a known project file name, or None."""
+    lower = filename.lower()
+    for ext in PROJECT_EXTENSIONS:
+        if lower.endswith(ext):
+            return filename[:-len(ext)]
+    return None
+
+
+def open_text(file_path: str, mode: str, compression: Optional[str] = None) -> IO[str]:
+    """
+    Open a (possibly compressed) UTF-8 text file. mode is "r" or "w".
+
+    Compressed streams are encoded/decoded incrementally, so callers writing with
+    json.dump() never hold the whole compressed payload in memory.
+    """
+    if compression == "gzip":
+        # mtime=0 keeps the output byte-identical for identical plans
+        return io.TextIOWrapper(gzip.GzipFile(file_path, mode + "b", compresslevel=GZIP_LEVEL, mtime=0), encoding="utf-8")
+    if compression == "xz":
+        return lzma.open(file_path, mode + "t", encoding="utf-8")
+    return open(file_path, mode, encoding="utf-8")
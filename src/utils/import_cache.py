@@ -0,0 +1,181 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..models.seating_plan import SeatingPlan
+
+# Bump the version of an importer whenever its parsing logic changes, so stale
+# cache entries are never returned for the new behaviour.
+IMPORTER_VERSIONS: Dict[str, int] = {
+    "excel": 1,
+    "avail": 1,
+}
+
+# Version of the on-disk entry layout written by ImportCache.put().
+CACHE_FORMAT = 1
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_CHUNK_SIZE = 1024 * 1024
+_SUFFIX = ".plan"
+
+
+def _default_cache_dir() -> Path:
+    """Per-user cache directory (overridable with SEATING_PLAN_CACHE_DIR)."""
+    env = os.environ.get("SEATING_PLAN_CACHE_DIR")
+    if env:
+        return Path(env) / "imports"
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "seating-plan-app" / "imports"
+
+
+def _default_max_bytes() -> int:
+    env = os.environ.get("SEATING_PLAN_IMPORT_CACHE_MB")
+    if env:
+        try:
+            return int(float(env) * 1024 * 1024)
+        except ValueError:
+            pass
+    return DEFAULT_MAX_BYTES
+
+
+class ImportCache:
+    """
+    On-disk cache of imported seating plans, keyed by file content and importer version.
+
+    Entries store the plan as compact pickled tuples so a cache hit skips XML/Excel
+    parsing entirely. The cache is best-effort: unreadable entries are dropped and
+    write errors never reach the caller. When the total size exceeds max_bytes the
+    least recently used entries (by mtime, refreshed on every hit) are evicted.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        self.cache_dir: Path = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.max_bytes: int = _default_max_bytes() if max_bytes is None else max_bytes
+
+    # ---- Keys ----
+    def key_for(self, file_path: str, importer: str) -> str:
+        if importer not in IMPORTER_VERSIONS:
+            raise ValueError(f"Unknown importer: {importer}")
+        digest = hashlib.sha256()
+        digest.update(f"{importer}:{IMPORTER_VERSIONS[importer]}:{CACHE_FORMAT}:".encode())
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_SUFFIX}"
+
+    # ---- Lookup / store ----
+    def get(self, key: str, name: str = "Unnamed Plan") -> Optional[SeatingPlan]:
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # corrupt or incompatible entry: drop it and treat as a miss
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return _plan_from_payload(payload, name)
+
+    def put(self, key: str, plan: SeatingPlan) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(_payload_from_plan(plan), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self._entry_path(key))
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+def _payload_from_plan(plan: SeatingPlan) -> list:
+    payload = []
+    for section in plan.sections.values():
+        rows: Dict[str, list] = {}
+        for seat in section.seats.values():
+            rows.setdefault(seat.row_number, []).append(seat.seat_number)
+        payload.append((section.name, section.is_ga, list(rows.items())))
+    return payload
+
+
+def _plan_from_payload(payload: list, name: str) -> SeatingPlan:
+    plan = SeatingPlan(name)
+    for section_name, is_ga, rows in payload:
+        plan.add_section(section_name, is_ga=is_ga)
+        section = plan.sections[section_name]
+        for row, seat_numbers in rows:
+            for seat_number in seat_numbers:
+                section.add_seat(row, seat_number)
+    return plan
+
+
+_default_cache: Optional[ImportCache] = None
+
+
+def get_import_cache() -> ImportCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ImportCache()
+    return _default_cache
+
+
+def cached_import(file_path: str, importer: str, name: str = "Unnamed Plan",
+                  cache: Optional[ImportCache] = None) -> SeatingPlan:
+    """
+    Import 'file_path' with the given importer ("excel" or "avail"), reusing a cached
+    result when the same file content was imported before.
+    """
+    cache = cache or get_import_cache()
+    key = cache.key_for(file_path, importer)
+    plan = cache.get(key, name)
+    if plan is not None:
+        return plan
+
+    plan = SeatingPlan(name)
+    if importer == "excel":
+        plan.import_from_excel(file_path)
+    else:
+        plan.import_from_avail(file_path)
+    cache.put(key, plan)
+    return plan
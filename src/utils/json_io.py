@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QFileDialog, QMessageBox
 from pathlib import Path
 from typing import Optional
 from ..models.seating_plan import SeatingPlan
+from .import_cache import cached_import
 
 _last_dir: Path | None = None  # remembers last used folder
 
@@ -20,7 +21,7 @@ def import_project_dialog(parent) -> Optional[SeatingPlan]:
         parent,
         "Import seating plan JSON",
         start_dir,
-        "JSON Files (*.json; *.seatproj);;All Files (*)"
+        "Project Files (*.json *.seatproj *.json.gz *.json.xz *.seatproj.gz *.seatproj.xz);;All Files (*)"
     )
     if path:
         try:
@@ -58,8 +59,7 @@ def import_from_excel_dialog(parent) -> Optional[SeatingPlan]:
             
             plan_name = plan_name.strip() or default_name
             
-            sp = SeatingPlan(plan_name)
-            sp.import_from_excel(path)
+            sp = cached_import(path, "excel", plan_name)
             _last_dir = Path(path).parent
             return sp
         except Exception as e:
@@ -92,8 +92,7 @@ def import_from_avail_dialog(parent) -> Optional[SeatingPlan]:
             
             plan_name = plan_name.strip() or default_name
             
-            sp = SeatingPlan(plan_name)
-            sp.import_from_avail(path)
+            sp = cached_import(path, "avail", plan_name)
             _last_dir = Path(path).parent
             return sp
         except Exception as e:
@@ -109,13 +108,13 @@ def export_project_dialog(parent, seating_plan: SeatingPlan) -> None:
         parent,
         "Export seating plan JSON",
         str(Path(start_dir) / suggested_name),
-        "JSON Files (*.json);;All Files (*)"
+        "JSON Files (*.json);;Compressed JSON (*.json.gz);;All Files (*)"
     )
     if not path:
         return
 
-    # ensure .json extension
-    if not path.lower().endswith(".json"):
+    # ensure .json extension (.json.gz is written gzip-compressed)
+    if not path.lower().endswith((".json", ".json.gz")):
         path += ".json"
     try:
         seating_plan.export_project(path)
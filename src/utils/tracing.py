@@ -0,0 +1,189 @@
+"""
+Lightweight tracing of slow operations.
+
+Spans nest through a context variable, so a span opened in a route handler is the
+parent of the model spans it causes, also across threads started with a copied
+context (asyncio / anyio do this). Spans slower than the threshold are logged on
+the "src.utils.tracing" logger, and all spans can be collected as a Chrome trace
+(open it in chrome://tracing or https://ui.perfetto.dev).
+
+Tracing is off unless SEATING_TRACE=1 or SEATING_TRACE_FILE is set in the
+environment, or configure() is called. While off, traced functions cost one flag
+check and span() returns a shared no-op context manager.
+
+    @traced("Section.add_row_range")
+    def add_row_range(...): ...
+
+    with span("import_project.parse", path=file_path):
+        ...
+"""
+import atexit
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Spans at least this long are logged (milliseconds)
+DEFAULT_SLOW_MS = float(os.environ.get("SEATING_TRACE_SLOW_MS", "100"))
+
+# Chrome trace events kept in memory; later spans are dropped from the trace file
+MAX_EVENTS = 1_000_000
+
+_NULL_SPAN = nullcontext()
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("seating_trace_span", default=None)
+
+
+class _State:
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.slow_ns: int = int(DEFAULT_SLOW_MS * 1_000_000)
+        self.chrome_trace: Optional[str] = None
+        self.events: List[dict] = []
+        self.lock = threading.Lock()
+        self.exit_hook: bool = False
+
+
+_state = _State()
+
+
+class Span:
+    """A timed operation; 'args' end up in the slow-operation log and the trace file."""
+
+    __slots__ = ("name", "args", "parent", "start_ns", "duration_ns", "_token")
+
+    def __init__(self, name: str, args: dict) -> None:
+        self.name: str = name
+        self.args: dict = args
+        self.parent: Optional[Span] = None
+        self.start_ns: int = 0
+        self.duration_ns: int = 0
+        self._token = None
+
+    @property
+    def path(self) -> str:
+        names = []
+        span = self
+        while span is not None:
+            names.append(span.name)
+            span = span.parent
+        return " > ".join(reversed(names))
+
+    def __enter__(self) -> "Span":
+        self.parent = _current.get()
+        self._token = _current.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration_ns = time.perf_counter_ns() - self.start_ns
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if self.duration_ns >= _state.slow_ns:
+            logger.warning("slow operation %s took %.1f ms %s", self.path, self.duration_ns / 1e6, self.args or "")
+        if _state.chrome_trace is not None:
+            _record(self)
+
+
+def _record(span: Span) -> None:
+    event = {
+        "name": span.name,
+        "ph": "X",
+        "ts": span.start_ns / 1000,
+        "dur": span.duration_ns / 1000,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+    }
+    if span.args:
+        event["args"] = {key: value if isinstance(value, (int, float, bool)) else str(value)
+                         for key, value in span.args.items()}
+    with _state.lock:
+        if len(_state.events) < MAX_EVENTS:
+            _state.events.append(event)
+
+
+# ---- Configuration ----
+
+def configure(enabled: bool = True, slow_ms: Optional[float] = None, chrome_trace: Optional[str] = None) -> None:
+    """
+    Turn tracing on or off. slow_ms sets the logging threshold; with chrome_trace
+    set, spans are collected and written to that file at exit (or by
+    write_chrome_trace()).
+    """
+    _state.enabled = enabled
+    if slow_ms is not None:
+        _state.slow_ns = int(slow_ms * 1_000_000)
+    _state.chrome_trace = chrome_trace if enabled else None
+    if _state.chrome_trace is not None and not _state.exit_hook:
+        _state.exit_hook = True
+        atexit.register(write_chrome_trace)
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+# ---- Instrumentation ----
+
+def span(name: str, **args: Any):
+    """Context manager timing a block (a no-op while tracing is off)."""
+    if not _state.enabled:
+        return _NULL_SPAN
+    return Span(name, args)
+
+
+def traced(name: Any = None) -> Callable:
+    """Decorator timing every call; use as @traced or @traced("name")."""
+    def decorate(fn: Callable) -> Callable:
+        span_name = name if isinstance(name, str) else fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+            with Span(span_name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    if callable(name):
+        return decorate(name)
+    return decorate
+
+
+# ---- Chrome trace output ----
+
+def chrome_trace_events() -> List[dict]:
+    with _state.lock:
+        return list(_state.events)
+
+
+def write_chrome_trace(path: Optional[str] = None) -> Optional[str]:
+    """Write the collected spans as Chrome trace JSON; returns the file written."""
+    path = path or _state.chrome_trace
+    if path is None:
+        return None
+    with _state.lock:
+        events = list(_state.events)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+def clear() -> None:
+    with _state.lock:
+        _state.events.clear()
+
+
+if os.environ.get("SEATING_TRACE", "").lower() in ("1", "true", "yes") or os.environ.get("SEATING_TRACE_FILE"):
+    configure(True, chrome_trace=os.environ.get("SEATING_TRACE_FILE") or None)
@@ -0,0 +1,132 @@
+import importlib.util
+import unittest
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_registry
+        from src.api.registry import PlanRegistry
+
+        self.registry = PlanRegistry()
+        init_registry(self.registry)
+        self.client = TestClient(app)
+        self.client.post("/api/sections/", json={"name": "A"})
+        self.client.post("/api/sections/", json={"name": "B", "is_ga": True})
+        self.client.post("/api/sections/A/rows/1/range", json={"start_seat": "1", "end_seat": "5"})
+
+    @property
+    def plan(self):
+        return self.registry.default.plan
+
+    def test_operations_apply_in_order(self):
+        res = self.client.post("/api/batch", json={"operations": [
+            {"op": "add_seats", "section": "A", "row": "2", "seat_numbers": ["1", "2", "2"]},
+            {"op": "delete_seats", "section": "A", "row": "1", "seat_numbers": ["1", "9"]},
+            {"op": "add_row_range", "section": "B", "start_row": "1", "end_row": "3",
+             "start_seat": "1", "end_seat": "4", "parity": "odd"},
+            {"op": "delete_rows", "section": "B", "rows": ["3"]},
+            {"op": "rename_section", "section": "A", "new_name": "Stalls"},
+            {"op": "clone_section", "section": "Stalls", "count": 2},
+        ]})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["results"], [
+            {"added": 2}, {"deleted": 1}, {"rows_added": 3}, {"deleted": 2},
+            {"name": "Stalls"}, {"created": ["Stalls 2", "Stalls 3"]},
+        ])
+        self.assertEqual(list(self.plan.sections), ["B", "Stalls", "Stalls 2", "Stalls 3"])
+        self.assertEqual(len(self.plan.sections["Stalls"].seats), 6)
+        self.assertEqual(self.plan.sections["B"].row_numbers(), ["1", "2"])
+
+    def test_failure_rolls_back_everything(self):
+        fingerprint = self.plan.fingerprint
+        res = self.client.post("/api/batch", json={"operations": [
+            {"op": "add_seats", "section": "A", "row": "2", "seat_numbers": ["1"]},
+            {"op": "rename_section", "section": "A", "new_name": "Stalls"},
+            {"op": "clone_section", "section": "Stalls"},
+            {"op": "delete_rows", "section": "B", "rows": ["1"]},
+            {"op": "add_seats", "section": "Missing", "row": "1", "seat_numbers": ["1"]},
+        ]})
+        self.assertEqual(res.status_code, 404)
+        self.assertEqual(res.json()["detail"]["index"], 4)
+        self.assertEqual(list(self.plan.sections), ["A", "B"])
+        self.assertEqual(self.plan.fingerprint, fingerprint)
+        self.assertEqual(self.plan.sections["A"].name, "A")
+        self.assertTrue(self.plan.sections["B"].is_ga)
+
+    def test_failed_batch_keeps_version_and_change_feed(self):
+        handle = self.registry.default
+        seats = list(self.plan.sections["A"].seats)
+        etag = self.client.get("/api/sections/").headers["etag"]
+        version = handle.version
+        res = self.client.post("/api/batch", json={"operations": [
+            {"op": "delete_seats", "section": "A", "row": "1", "seat_numbers": ["2"]},
+            {"op": "add_seats", "section": "A", "row": "1", "seat_numbers": ["0"]},
+            {"op": "move_seats", "section": "A", "target": "New", "create_target": True, "rows": ["1"]},
+            {"op": "rename_section", "section": "B", "new_name": "Standing"},
+            {"op": "clone_section", "section": "Standing"},
+            {"op": "rename_section", "section": "Missing", "new_name": "C"},
+        ]})
+        self.assertEqual(res.status_code, 404)
+        self.assertEqual(handle.version, version)
+        self.assertEqual(self.client.get("/api/sections/").headers["etag"], etag)
+        changes = self.client.get(f"/api/changes?since={version}").json()
+        self.assertEqual((changes["version"], changes["events"]), (version, []))
+        self.assertEqual(list(self.plan.sections["A"].seats), seats)
+
+        # the next write is recorded as usual
+        self.client.post("/api/sections/A/rows/2/range", json={"start_seat": "1", "end_seat": "2"})
+        events = self.client.get(f"/api/changes?since={version}").json()["events"]
+        self.assertEqual([(event["type"], event["version"]) for event in events], [("section_changed", version + 1)])
+        self.assertEqual(events[0]["seats_added"], [["2", "1"], ["2", "2"]])
+        self.assertEqual(events[0]["seats_removed"], [])
+
+    def test_rename_collision_and_bad_range(self):
+        res = self.client.post("/api/batch", json={"operations": [
+            {"op": "rename_section", "section": "A", "new_name": "B"},
+        ]})
+        self.assertEqual(res.status_code, 409)
+        res = self.client.post("/api/batch", json={"operations": [
+            {"op": "add_row_range", "section": "A", "start_row": "1", "end_row": "2",
+             "start_seat": "A", "end_seat": "C", "continuous": True},
+        ]})
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(len(self.plan.sections["A"].seats), 5)
+
+    def test_bulk_delete_and_move_endpoints(self):
+        self.client.post("/api/sections/A/rows/2/range", json={"start_seat": "1", "end_seat": "3"})
+        res = self.client.post("/api/sections/A/seats/delete", json={
+            "seats": [{"row": "1", "seat_number": "1"}, {"row": "1", "seat_number": "2"}]})
+        self.assertEqual(res.json(), {"deleted": 2})
+
+        res = self.client.post("/api/sections/A/seats/move", json={"target": "B", "rows": ["2"]})
+        self.assertEqual(res.json(), {"moved": 3, "target": "B"})
+        self.assertEqual(self.plan.sections["B"].row_numbers(), ["2"])
+
+        res = self.client.post("/api/sections/A/seats/move", json={"target": "C", "rows": ["1"]})
+        self.assertEqual(res.status_code, 404)
+        res = self.client.post("/api/sections/A/seats/move", json={"target": "C", "rows": ["1"], "create_target": True})
+        self.assertEqual(res.json()["moved"], 3)
+        self.assertEqual(len(self.plan.sections["A"].seats), 0)
+
+    def test_move_in_batch_rolls_back(self):
+        res = self.client.post("/api/batch", json={"operations": [
+            {"op": "move_seats", "section": "A", "target": "New", "create_target": True, "rows": ["1"]},
+            {"op": "delete_rows", "section": "Missing", "rows": ["1"]},
+        ]})
+        self.assertEqual(res.status_code, 404)
+        self.assertEqual(list(self.plan.sections), ["A", "B"])
+        self.assertEqual(len(self.plan.sections["A"].seats), 5)
+
+    def test_unknown_operation_is_rejected(self):
+        res = self.client.post("/api/batch", json={"operations": [{"op": "explode", "section": "A"}]})
+        self.assertEqual(res.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
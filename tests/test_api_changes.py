@@ -0,0 +1,130 @@
+import importlib.util
+import http.client
+import json
+import socket
+import threading
+import time
+import unittest
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+HAS_UVICORN = importlib.util.find_spec("uvicorn") is not None
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_registry
+        from src.api.registry import PlanRegistry
+
+        init_registry(PlanRegistry())
+        self.client = TestClient(app)
+
+    def changes(self, since, **params):
+        return self.client.get("/api/changes", params={"since": since, **params})
+
+    def test_events_describe_each_write(self):
+        self.client.post("/api/sections/", json={"name": "A"})
+        self.client.post("/api/sections/A/rows/1/range", json={"start_seat": "1", "end_seat": "3"})
+        self.client.delete("/api/seats/A/1/2")
+        self.client.patch("/api/sections/A", json={"new_name": "Stalls"})
+        self.client.get("/api/sections/")  # reads record nothing
+
+        body = self.changes(0).json()
+        self.assertEqual(body["version"], 4)
+        events = body["events"]
+        self.assertEqual([(e["version"], e["type"]) for e in events], [
+            (1, "section_added"), (2, "section_changed"), (3, "section_changed"), (4, "section_renamed"),
+        ])
+        self.assertEqual(events[1]["seats_added"], [["1", "1"], ["1", "2"], ["1", "3"]])
+        self.assertEqual(events[2]["seats_removed"], [["1", "2"]])
+        self.assertEqual(events[3]["old_name"], "A")
+        self.assertEqual([e["version"] for e in self.changes(3).json()["events"]], [4])
+
+    def test_batch_reports_net_changes(self):
+        self.client.post("/api/sections/", json={"name": "A"})
+        self.client.post("/api/sections/", json={"name": "B"})
+        self.client.post("/api/batch", json={"operations": [
+            {"op": "add_seats", "section": "A", "row": "1", "seat_numbers": ["1", "2"]},
+            {"op": "delete_seats", "section": "A", "row": "1", "seat_numbers": ["1"]},
+            {"op": "move_seats", "section": "A", "target": "B", "rows": ["1"]},
+        ]})
+        events = self.changes(2).json()["events"]
+        # seats added to A and then moved or deleted within the batch cancel out
+        self.assertEqual([(e["section"], e["seats_added"], e["seats_removed"]) for e in events], [
+            ("B", [["1", "2"]], []),
+        ])
+
+    def test_stale_version_or_epoch_is_gone(self):
+        self.client.post("/api/sections/", json={"name": "A"})
+        self.assertEqual(self.changes(5).status_code, 410)
+        self.assertEqual(self.changes(0, epoch="other").status_code, 410)
+        epoch = self.changes(0).json()["epoch"]
+        self.assertEqual(self.changes(0, epoch=epoch).status_code, 200)
+
+    def test_old_versions_expire(self):
+        from src.api.changes import ChangeLog
+        from src.api.dependencies import get_registry
+
+        handle = get_registry().default
+        handle.changes = ChangeLog(max_versions=2)
+        for name in ("A", "B", "C"):
+            self.client.post("/api/sections/", json={"name": name})
+        self.assertEqual(self.changes(0).status_code, 410)
+        self.assertEqual(len(self.changes(1).json()["events"]), 2)
+
+    @unittest.skipUnless(HAS_UVICORN, "uvicorn not installed")
+    def test_stream_replays_and_follows_changes(self):
+        # TestClient buffers whole responses, so the stream is read from a real server
+        import uvicorn
+        from src.api.main import app
+
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        try:
+            while not server.started:
+                time.sleep(0.01)
+            self.client.post("/api/sections/", json={"name": "A"})
+
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            conn.request("GET", "/api/changes/stream?since=0")
+            stream = conn.getresponse()
+            self.assertEqual(stream.status, 200)
+
+            def next_message():
+                fields = {}
+                while True:
+                    line = stream.readline().decode().rstrip("\n")
+                    if not line:
+                        return fields
+                    key, _, value = line.partition(": ")
+                    fields[key] = value
+
+            self.assertEqual(next_message()["event"], "hello")
+            replayed = next_message()
+            self.assertEqual(json.loads(replayed["data"])["events"][0]["type"], "section_added")
+
+            add = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            add.request("POST", "/api/seats/A/1", body=json.dumps({"seat_number": "7"}),
+                        headers={"Content-Type": "application/json"})
+            add.getresponse().read()
+            add.close()
+            live = next_message()
+            payload = json.loads(live["data"])
+            self.assertEqual(live["id"], f"{payload['epoch']}-2")
+            self.assertEqual(payload["events"][0]["seats_added"], [["1", "7"]])
+            conn.close()
+        finally:
+            server.should_exit = True
+            thread.join(10)
+
+
+if __name__ == "__main__":
+    unittest.main()
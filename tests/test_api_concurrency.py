@@ -0,0 +1,96 @@
+import importlib.util
+import random
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.rwlock import RWLock
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+class TestRWLock(unittest.TestCase):
+
+    def test_readers_share_writers_exclude(self):
+        lock = RWLock()
+        lock.acquire_read()
+        lock.acquire_read()
+        self.assertFalse(lock.try_acquire_write())
+        lock.release_read()
+        lock.release_read()
+        self.assertTrue(lock.try_acquire_write())
+        self.assertFalse(lock.try_acquire_write())
+        lock.release_write()
+
+    def test_waiting_writer_blocks_new_readers(self):
+        lock = RWLock()
+        lock.acquire_read()
+        order = []
+        writer = threading.Thread(target=lambda: (lock.acquire_write(), order.append("w"), lock.release_write()))
+        writer.start()
+        while not lock._waiting_writers:
+            time.sleep(0.001)
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), order.append("r"), lock.release_read()))
+        reader.start()
+        time.sleep(0.05)
+        self.assertEqual(order, [])
+        lock.release_read()
+        writer.join()
+        reader.join()
+        self.assertEqual(order, ["w", "r"])
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestConcurrentRoutes(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_registry
+        from src.api.registry import PlanRegistry
+
+        init_registry(PlanRegistry())
+        self.client = TestClient(app)
+        self.client.post("/api/projects/new/Stress")
+        for name in ("A", "B"):
+            self.client.post("/api/sections/", json={"name": name})
+
+    def test_mixed_reads_and_writes_from_many_threads(self):
+        def worker(worker_id: int):
+            rng = random.Random(worker_id)
+            statuses = []
+            for i in range(15):
+                section = rng.choice("AB")
+                op = rng.random()
+                if op < 0.4:
+                    res = self.client.get("/api/sections/")
+                elif op < 0.6:
+                    res = self.client.get(f"/api/seats/{section}")
+                elif op < 0.9:
+                    res = self.client.post(f"/api/sections/{section}/rows/range", json={
+                        "start_row": str(worker_id), "end_row": str(worker_id + 2),
+                        "start_seat": "1", "end_seat": str(50 + i),
+                    })
+                else:
+                    res = self.client.delete(f"/api/sections/{section}/rows/{worker_id}")
+                statuses.append(res.status_code)
+            return statuses
+
+        # switch threads very often so unsynchronized dict access would be caught
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                results = [s for statuses in pool.map(worker, range(16)) for s in statuses]
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertTrue(all(code < 500 for code in results), sorted(set(results)))
+        sections = self.client.get("/api/sections/").json()
+        self.assertEqual(sorted(s["name"] for s in sections), ["A", "B"])
+
+
+if __name__ == "__main__":
+    unittest.main()
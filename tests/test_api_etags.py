@@ -0,0 +1,56 @@
+import importlib.util
+import unittest
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestETags(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_registry
+        from src.api.registry import PlanRegistry
+
+        init_registry(PlanRegistry())
+        self.client = TestClient(app)
+        for name in ("A", "B"):
+            self.client.post("/api/sections/", json={"name": name})
+            self.client.post(f"/api/sections/{name}/rows/1/range", json={"start_seat": "1", "end_seat": "5"})
+
+    def revalidate(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["etag"]
+        again = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b"")
+        return etag
+
+    def test_section_list_revalidates_until_any_write(self):
+        etag = self.revalidate("/api/sections/")
+        self.client.post("/api/seats/B/2", json={"seat_number": "1"})
+        res = self.client.get("/api/sections/", headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res.headers["etag"], etag)
+
+    def test_section_tags_only_change_with_that_section(self):
+        section_tag = self.revalidate("/api/sections/A")
+        seats_tag = self.revalidate("/api/seats/A")
+        self.client.post("/api/seats/B/2", json={"seat_number": "1"})
+        self.assertEqual(self.client.get("/api/sections/A", headers={"If-None-Match": section_tag}).status_code, 304)
+
+        self.client.post("/api/seats/A/2", json={"seat_number": "1"})
+        self.assertEqual(self.client.get("/api/sections/A", headers={"If-None-Match": section_tag}).status_code, 200)
+        self.assertEqual(self.client.get("/api/seats/A", headers={"If-None-Match": seats_tag}).status_code, 200)
+
+    def test_if_none_match_lists_and_wildcard(self):
+        etag = self.client.get("/api/sections/A").headers["etag"]
+        res = self.client.get("/api/sections/A", headers={"If-None-Match": f'"other", {etag}'})
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(self.client.get("/api/sections/A", headers={"If-None-Match": "*"}).status_code, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()
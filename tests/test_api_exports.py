@@ -0,0 +1,114 @@
+import csv
+import importlib.util
+import io
+import json
+import unittest
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestExports(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_registry
+        from src.api.exports import get_export_cache
+        from src.api.registry import PlanRegistry
+
+        self.registry = PlanRegistry()
+        init_registry(self.registry)
+        get_export_cache().clear()
+        self.client = TestClient(app)
+        self.client.post("/api/projects/new/Grand Hall")
+        self.client.post("/api/sections/", json={"name": "Stalls"})
+        self.client.post("/api/sections/", json={"name": "Floor", "is_ga": True})
+        self.client.post("/api/sections/Stalls/rows/range", json={
+            "start_row": "A", "end_row": "C", "start_seat": "1", "end_seat": "12"})
+
+    def test_json_export_round_trips(self):
+        from src.models.seating_plan import SeatingPlan
+
+        res = self.client.get("/api/export/json")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn('filename="Grand_Hall.json"', res.headers["content-disposition"])
+        data = json.loads(res.content)
+        plan = SeatingPlan()
+        plan.from_dict(data)
+        self.assertEqual(plan.fingerprint, self.registry.default.plan.fingerprint)
+        self.assertEqual(data, self.registry.default.plan.to_dict())
+
+    def test_csv_manifest_matches_excel_columns(self):
+        from src.models.seating_plan import SeatingPlan
+
+        res = self.client.get("/api/export/csv")
+        rows = list(csv.reader(io.StringIO(res.content.decode("utf-8-sig"))))
+        self.assertEqual(rows[0], SeatingPlan.MANIFEST_HEADERS)
+        self.assertEqual(rows[1][:3], ["Stalls", "A", ",".join(str(i) for i in range(1, 13))])
+        self.assertEqual(rows[-1], ["Floor", "", "", "Floor", "1", "1"])
+
+    @unittest.skipUnless(HAS_OPENPYXL, "openpyxl not installed")
+    def test_xlsx_export_imports_back(self):
+        import os
+        import tempfile
+        from src.models.seating_plan import SeatingPlan
+
+        res = self.client.get("/api/projects/missing/export/xlsx")
+        self.assertEqual(res.status_code, 404)
+        res = self.client.get("/api/export/xlsx")
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        with os.fdopen(fd, "wb") as f:
+            f.write(res.content)
+        try:
+            plan = SeatingPlan()
+            plan.import_from_excel(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(len(plan.sections["Stalls"].seats), 36)
+
+    def test_repeat_downloads_hit_the_cache_until_a_write(self):
+        first = self.client.get("/api/export/json")
+        self.assertEqual(first.headers["x-export-cache"], "miss")
+        again = self.client.get("/api/export/json")
+        self.assertEqual(again.headers["x-export-cache"], "hit")
+        self.assertEqual(again.content, first.content)
+        self.assertEqual(self.client.get("/api/export/json", headers={"If-None-Match": first.headers["etag"]}).status_code, 304)
+
+        self.client.post("/api/seats/Stalls/D", json={"seat_number": "1"})
+        after = self.client.get("/api/export/json")
+        self.assertEqual(after.headers["x-export-cache"], "miss")
+        self.assertNotEqual(after.headers["etag"], first.headers["etag"])
+
+    def test_exports_queued_behind_a_writer_do_not_deadlock(self):
+        # more waiting exports than the threadpool has threads (40), behind a
+        # queued writer that needs a pool thread once it gets the lock
+        import asyncio
+        import httpx
+        from src.api.main import app
+
+        lock = self.registry.default.lock
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                lock.acquire_read()
+                try:
+                    write = asyncio.ensure_future(client.post("/api/seats/Stalls/D", json={"seat_number": "1"}))
+                    while not lock._waiting_writers:
+                        await asyncio.sleep(0.001)
+                    exports = [asyncio.ensure_future(client.get("/api/export/json")) for _ in range(45)]
+                    await asyncio.sleep(0.2)
+                finally:
+                    lock.release_read()
+                return await asyncio.wait_for(asyncio.gather(write, *exports), timeout=20)
+
+        responses = asyncio.run(scenario())
+        self.assertEqual(responses[0].status_code, 201)
+        self.assertEqual({res.status_code for res in responses[1:]}, {200})
+        self.assertIn(b'"row_number":"D"', responses[-1].content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+HAS_IMPORTERS = importlib.util.find_spec("openpyxl") is not None and importlib.util.find_spec("bs4") is not None
+
+AVAIL_XML = """<?xml version="1.0"?>
+<venue><section_id_list>
+  <e><section_id>1</section_id><section_name>Stalls</section_name><secnam_list>ST</secnam_list>
+    <row_names><e>A</e><e>B</e></row_names><seat_names><e>1</e><e>2</e><e>3</e></seat_names>
+    <is_ga>false</is_ga></e>
+  <e><section_id>2</section_id><section_name>Floor</section_name><secnam_list>FL</secnam_list>
+    <row_names></row_names><seat_names></seat_names><is_ga>true</is_ga></e>
+</section_id_list></venue>
+"""
+
+
+@unittest.skipUnless(HAS_API and HAS_IMPORTERS, "fastapi/httpx/openpyxl/bs4 not installed")
+class TestImportUploads(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_jobs, init_registry
+        from src.api.jobs import JobRunner
+        from src.api.registry import PlanRegistry
+        from src.utils import import_cache
+
+        self.tmp = tempfile.mkdtemp()
+        patcher = mock.patch.object(import_cache, "_default_cache", import_cache.ImportCache(os.path.join(self.tmp, "cache")))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = PlanRegistry()
+        init_registry(self.registry)
+        self.jobs = JobRunner()
+        init_jobs(self.jobs)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.jobs.shutdown()
+        shutil.rmtree(self.tmp)
+
+    def test_excel_upload_replaces_plan(self):
+        from src.models.seating_plan import SeatingPlan
+
+        source = SeatingPlan("Source")
+        source.add_section("North")
+        source.sections["North"].add_seat_range("1", 1, 20)
+        xlsx = os.path.join(self.tmp, "venue.xlsx")
+        source.export_to_excel(xlsx)
+        self.client.post("/api/sections/", json={"name": "Old"})
+
+        with open(xlsx, "rb") as f:
+            res = self.client.post("/api/import/excel", params={"name": "Venue"}, content=f.read())
+        self.assertEqual(res.status_code, 202)
+        job = self.jobs.get(res.json()["job_id"])
+        job.wait(10)
+        self.assertEqual(job.status, "done")
+        self.assertEqual(job.result, {"name": "Venue", "sections": 1, "seats": 20})
+        self.assertEqual([s["name"] for s in self.client.get("/api/sections/").json()], ["North"])
+        leftovers = [f for f in os.listdir(tempfile.gettempdir()) if f.startswith("seating-import-")]
+        self.assertEqual(leftovers, [])
+
+    def test_avail_upload_into_project(self):
+        self.client.post("/api/projects/arena")
+        res = self.client.post("/api/projects/arena/import/avail", params={"wait": True},
+                               content=AVAIL_XML.encode())
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["result"]["seats"], 6)
+        # no 'name' given: the project's plan keeps its name
+        self.assertEqual(res.json()["result"]["name"], "arena")
+        self.assertEqual(self.client.get("/api/projects/arena").json()["name"], "arena")
+        rows = self.client.get("/api/projects/arena/sections/Stalls/rows").json()
+        self.assertEqual([r["row_number"] for r in rows], ["A", "B"])
+
+    def test_bad_uploads(self):
+        self.assertEqual(self.client.post("/api/import/excel", content=b"").status_code, 400)
+        res = self.client.post("/api/import/excel", params={"wait": True}, content=b"not a workbook")
+        self.assertEqual(res.status_code, 422)
+        self.assertEqual(self.client.post("/api/import/pdf", content=b"x").status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
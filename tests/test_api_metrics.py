@@ -0,0 +1,95 @@
+import importlib.util
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+def _samples(text):
+    """{'name{labels}': value} of a Prometheus text exposition."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            samples[key] = float(value)
+    return samples
+
+
+class TestMetricsFormat(unittest.TestCase):
+
+    def test_histogram_buckets_are_cumulative(self):
+        from src.api.metrics import Counter, Histogram, MetricsRegistry
+
+        registry = MetricsRegistry()
+        counter = registry.add(Counter("jobs_total", "Jobs.", ("kind",)))
+        histogram = registry.add(Histogram("work_seconds", "Work.", buckets=(0.1, 1.0)))
+        counter.inc(kind='say "hi"\n')
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value)
+
+        text = registry.render()
+        self.assertIn("# TYPE work_seconds histogram", text)
+        samples = _samples(text)
+        self.assertEqual(samples['jobs_total{kind="say \\"hi\\"\\n"}'], 1)
+        self.assertEqual(samples['work_seconds_bucket{le="0.1"}'], 1)
+        self.assertEqual(samples['work_seconds_bucket{le="1"}'], 3)
+        self.assertEqual(samples['work_seconds_bucket{le="+Inf"}'], 4)
+        self.assertEqual(samples["work_seconds_count"], 4)
+        self.assertAlmostEqual(samples["work_seconds_sum"], 4.05)
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestMetricsEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api import storage
+        from src.api.dependencies import init_jobs, init_registry
+        from src.api.jobs import JobRunner
+        from src.api.registry import PlanRegistry
+
+        self.tmp = tempfile.mkdtemp()
+        patcher = mock.patch.object(storage, "PROJECTS_DIR", self.tmp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        init_registry(PlanRegistry())
+        self.jobs = JobRunner()
+        init_jobs(self.jobs)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.jobs.shutdown()
+        shutil.rmtree(self.tmp)
+
+    def test_routes_models_and_persistence_are_measured(self):
+        before = _samples(self.client.get("/metrics").text)
+        route = 'method="POST",route="/api/sections/{name}/rows/range"'
+        self.client.post("/api/sections/", json={"name": "North"})
+        for _ in range(3):
+            self.client.post("/api/sections/North/rows/range", json={
+                "start_row": "A", "end_row": "B", "start_seat": "1", "end_seat": "10"})
+        self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena"})
+
+        res = self.client.get("/metrics")
+        self.assertTrue(res.headers["content-type"].startswith("text/plain"))
+        after = _samples(res.text)
+
+        def delta(key):
+            return after.get(key, 0) - before.get(key, 0)
+
+        self.assertEqual(delta(f'seating_http_requests_total{{{route},status="201"}}'), 3)
+        self.assertEqual(delta(f'seating_http_request_duration_seconds_count{{{route}}}'), 3)
+        self.assertGreater(delta(f'seating_http_response_size_bytes_sum{{{route}}}'), 0)
+        self.assertEqual(after["seating_seats_in_memory"], 20)
+        self.assertEqual(after["seating_sections_in_memory"], 1)
+        self.assertEqual(delta('seating_operation_duration_seconds_count{operation="save"}'), 1)
+        self.assertEqual(delta('seating_operation_duration_seconds_count{operation="serialize"}'), 1)
+        self.client.get("/nope")
+        self.assertIn('route="<unmatched>",status="404"', self.client.get("/metrics").text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+import importlib.util
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestProjectRoutes(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api import storage
+        from src.api.dependencies import init_jobs, init_registry
+        from src.api.jobs import JobRunner
+        from src.api.registry import PlanRegistry
+
+        self.tmp = tempfile.mkdtemp()
+        patcher = mock.patch.object(storage, "PROJECTS_DIR", self.tmp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = PlanRegistry()
+        init_registry(self.registry)
+        self.jobs = JobRunner()
+        init_jobs(self.jobs)
+        self.client = TestClient(app)
+        self.client.post("/api/projects/new/Arena")
+        self.client.post("/api/sections/", json={"name": "North"})
+        self.client.post("/api/sections/North/rows/1/range", json={"start_seat": "1", "end_seat": "10"})
+
+    def tearDown(self):
+        self.jobs.shutdown()
+        shutil.rmtree(self.tmp)
+
+    def test_save_compressed_and_load(self):
+        res = self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena", "compression": "xz"})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["status"], "done")
+        self.assertEqual(self.client.get("/api/projects/list").json()["projects"], ["arena"])
+
+        self.client.post("/api/projects/new/Other")
+        res = self.client.post("/api/projects/load", params={"wait": True}, json={"name": "arena"})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(self.client.get("/api/sections/North").json()["rows"][0]["seats"]), 10)
+
+    def test_resave_replaces_other_format(self):
+        self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena", "compression": "gzip"})
+        self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena"})
+        self.assertEqual(self.client.get("/api/projects/list").json()["projects"], ["arena"])
+        self.assertEqual(self.client.delete("/api/projects/arena").status_code, 200)
+        self.assertEqual(self.client.get("/api/projects/list").json()["projects"], [])
+
+    def test_project_scoped_plans_are_isolated(self):
+        self.assertEqual(self.client.post("/api/projects/stadium").status_code, 201)
+        self.assertEqual(self.client.post("/api/projects/stadium").status_code, 409)
+        res = self.client.post("/api/projects/stadium/sections/", json={"name": "East"})
+        self.assertEqual(res.status_code, 201)
+        self.client.post("/api/projects/stadium/seats/East/A", json={"seat_number": "1"})
+
+        scoped = [s["name"] for s in self.client.get("/api/projects/stadium/sections/").json()]
+        default = [s["name"] for s in self.client.get("/api/sections/").json()]
+        self.assertEqual(scoped, ["East"])
+        self.assertEqual(default, ["North"])
+        self.assertEqual(self.client.get("/api/projects/missing/sections/").status_code, 404)
+
+        info = self.client.get("/api/projects/stadium").json()
+        self.assertEqual((info["sections"], info["seats"], info["dirty"]), (1, 1, True))
+        self.client.post("/api/projects/stadium/save", params={"wait": True})
+        self.assertIn("stadium", self.client.get("/api/projects/list").json()["projects"])
+
+    def test_save_as_open_project_keeps_its_unsaved_changes(self):
+        self.client.post("/api/projects/arena")
+        self.client.post("/api/projects/arena/sections/", json={"name": "East"})
+        res = self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena"})
+        self.assertEqual(res.status_code, 409)
+        self.assertEqual(self.client.get("/api/projects/list").json()["projects"], [])
+        self.assertEqual([s["name"] for s in self.client.get("/api/projects/arena/sections/").json()], ["East"])
+
+        # once saved, the open copy is replaced by the newly saved plan
+        self.client.post("/api/projects/arena/save", params={"wait": True})
+        res = self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena"})
+        self.assertEqual(res.status_code, 200)
+        self.assertIsNone(self.registry.peek("arena"))
+        self.assertEqual([s["name"] for s in self.client.get("/api/projects/arena/sections/").json()], ["North"])
+
+    def test_deleting_an_unsaved_project_keeps_it_unless_asked(self):
+        self.client.post("/api/projects/stadium")
+        self.client.post("/api/projects/stadium/sections/", json={"name": "East"})
+        self.assertEqual(self.client.delete("/api/projects/stadium").status_code, 404)
+        self.assertEqual(self.client.get("/api/projects/stadium").json()["sections"], 1)
+
+        res = self.client.delete("/api/projects/stadium", params={"discard_unsaved": True})
+        self.assertEqual(res.json(), {"status": "discarded", "name": "stadium"})
+        self.assertEqual(self.client.get("/api/projects/stadium").status_code, 404)
+
+        self.client.post("/api/projects/stadium")
+        self.client.post("/api/projects/stadium/save", params={"wait": True})
+        self.assertEqual(self.client.delete("/api/projects/stadium").json()["status"], "deleted")
+        self.assertIsNone(self.registry.peek("stadium"))
+
+    def test_reserved_project_ids_are_rejected(self):
+        for project in ("list", "load", "new", "save"):
+            # POST .../save and .../load reach the default plan's routes, which want a body
+            self.assertIn(self.client.post(f"/api/projects/{project}").status_code, (400, 422))
+            self.assertEqual(self.client.get(f"/api/projects/{project}/sections/").status_code, 400)
+            res = self.client.post("/api/projects/save", params={"wait": True}, json={"name": project})
+            self.assertEqual(res.status_code, 400)
+        self.assertEqual(self.registry.loaded(), [])
+        self.assertEqual(self.client.get("/api/projects/list").json()["projects"], [])
+
+    def test_plans_load_on_demand_and_lru_eviction_flushes(self):
+        for project in ("a", "b"):
+            self.client.post(f"/api/projects/{project}")
+            self.client.post(f"/api/projects/{project}/sections/", json={"name": "S"})
+            self.client.post(f"/api/projects/{project}/sections/S/rows/1/range",
+                             json={"start_seat": "1", "end_seat": "50"})
+        self.registry.memory_budget = 1
+        self.client.post("/api/projects/c")  # evicts "a" and "b", flushing them first
+
+        self.assertEqual([h.project_id for h in self.registry.loaded()], ["c"])
+        self.assertEqual(sorted(self.client.get("/api/projects/list").json()["projects"]), ["a", "b"])
+        seats = self.client.get("/api/projects/a/seats/S").json()["rows"][0]["seats"]
+        self.assertEqual(len(seats), 50)
+        self.assertEqual([h.project_id for h in self.registry.loaded()], ["a"])
+        self.assertIn("c", self.client.get("/api/projects/list").json()["projects"])
+
+    def test_save_and_load_run_as_jobs(self):
+        res = self.client.post("/api/projects/save", json={"name": "arena"})
+        self.assertEqual(res.status_code, 202)
+        job_id = res.json()["job_id"]
+        self.jobs.get(job_id).wait(10)
+        job = self.client.get(f"/api/jobs/{job_id}").json()
+        self.assertEqual((job["kind"], job["status"], job["progress"]), ("save", "done", 1.0))
+        self.assertIn(job_id, [j["job_id"] for j in self.client.get("/api/jobs/").json()["jobs"]])
+
+        self.assertEqual(self.client.post("/api/projects/load", json={"name": "missing"}).status_code, 404)
+        self.assertEqual(self.client.get("/api/jobs/unknown").status_code, 404)
+
+    def test_rapid_saves_coalesce(self):
+        import threading
+
+        # hold the plan's key busy so the following saves queue up behind it
+        gate = threading.Event()
+        blocker = self.jobs.submit("block", None, lambda job: gate.wait(10), key=("default",))
+        ids = {self.client.post("/api/projects/save", json={"name": "arena"}).json()["job_id"] for _ in range(5)}
+        gate.set()
+        blocker.wait(10)
+        self.assertEqual(len(ids), 1)
+        job = self.jobs.get(ids.pop())
+        job.wait(10)
+        self.assertEqual((job.status, job.coalesced), ("done", 4))
+
+    def test_jobs_queued_on_a_busy_key_leave_the_pool_free(self):
+        import threading
+        from src.api.jobs import JobRunner
+
+        runner = JobRunner(max_workers=2)
+        self.addCleanup(runner.shutdown)
+        gate = threading.Event()
+        order = []
+        busy = [runner.submit("block", None, lambda job: gate.wait(10), key="a")]
+        busy += [runner.submit("step", None, lambda job, i=i: order.append(i), key="a") for i in range(3)]
+        # with the first "a" job running, a job of another key still gets a worker
+        other = runner.submit("other", None, lambda job: "ok", key="b")
+        self.assertTrue(other.wait(5))
+        self.assertEqual(other.result, "ok")
+        self.assertEqual([job.status for job in busy[1:]], ["pending"] * 3)
+        gate.set()
+        for job in busy:
+            job.wait(10)
+        self.assertEqual(order, [0, 1, 2])
+        # keys are forgotten once they have no jobs left
+        runner.shutdown()
+        self.assertEqual(runner._queues, {})
+
+    def test_jobs_survive_a_failing_status_mirror(self):
+        from src.api.jobs import JobRunner
+
+        mirror = mock.Mock()
+        mirror.put_job.side_effect = RuntimeError("database is locked")
+        runner = JobRunner(mirror=mirror)
+        self.addCleanup(runner.shutdown)
+        with self.assertLogs("src.api.jobs", "ERROR"):
+            jobs = [runner.submit("step", None, lambda job, i=i: i, key="a") for i in range(3)]
+            self.assertTrue(all(job.wait(5) for job in jobs))
+        self.assertEqual([(job.status, job.result) for job in jobs], [("done", 0), ("done", 1), ("done", 2)])
+        self.assertTrue(all(job.finished for job in jobs))
+        runner.shutdown()
+        self.assertEqual(runner._queues, {})
+
+    def test_list_returns_catalog_metadata(self):
+        import os
+        import shutil as sh
+        from src.api import storage
+        from src.api.catalog import ProjectCatalog
+
+        self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena"})
+        self.client.post("/api/sections/", json={"name": "South"})
+        self.client.post("/api/sections/South/rows/1/range", json={"start_seat": "1", "end_seat": "30"})
+        self.client.post("/api/projects/save", params={"wait": True}, json={"name": "big", "compression": "gzip"})
+
+        items = self.client.get("/api/projects/list").json()["items"]
+        self.assertEqual([item["name"] for item in items], ["arena", "big"])
+        self.assertEqual((items[1]["sections"], items[1]["rows"], items[1]["seats"], items[1]["compression"]),
+                         (2, 2, 40, "gzip"))
+        self.assertEqual(self.client.get("/api/projects/list", params={"sort": "seats", "order": "desc"}).json()["projects"],
+                         ["big", "arena"])
+        self.assertEqual(self.client.get("/api/projects/list", params={"min_seats": 20}).json()["projects"], ["big"])
+        self.assertEqual(self.client.get("/api/projects/list", params={"q": "AR"}).json()["projects"], ["arena"])
+
+        # unchanged files are never reopened; files copied in are scanned once
+        sh.copy(os.path.join(self.tmp, "arena.json"), os.path.join(self.tmp, "copy.json"))
+        with mock.patch.object(ProjectCatalog, "_scan", wraps=ProjectCatalog._scan) as scan:
+            names = self.client.get("/api/projects/list").json()["projects"]
+            self.client.get("/api/projects/list")
+        self.assertEqual(names, ["arena", "big", "copy"])
+        self.assertEqual(scan.call_count, 1)
+
+        self.client.delete("/api/projects/big")
+        self.assertEqual(self.client.get("/api/projects/list").json()["projects"], ["arena", "copy"])
+        # a fresh catalog reads the sidecar written above
+        self.assertEqual(sorted(ProjectCatalog(storage.PROJECTS_DIR)._load()), ["arena", "copy"])
+
+    def test_sqlite_backend(self):
+        import os
+        from src.api import storage
+        from src.api.sqlite_storage import SqliteBackend
+
+        backend = SqliteBackend(os.path.join(self.tmp, "projects.db"))
+        storage.set_backend(backend)
+        self.addCleanup(storage.set_backend, None)
+        self.addCleanup(backend.close)
+
+        self.assertEqual(self.client.post("/api/projects/save", params={"wait": True}, json={"name": "arena"}).status_code, 200)
+        self.assertFalse([name for name in os.listdir(self.tmp) if name.endswith(".json")])
+        items = self.client.get("/api/projects/list", params={"sort": "size"}).json()["items"]
+        self.assertEqual([(item["name"], item["seats"]) for item in items], [("arena", 10)])
+        self.assertEqual(self.client.get("/api/projects/arena").json()["seats"], 10)
+        self.assertEqual(storage.load_section("arena", "North").to_dict()["rows"][0]["row_number"], "1")
+        self.assertEqual(self.client.delete("/api/projects/arena").status_code, 200)
+        self.assertEqual(self.client.get("/api/projects/list").json()["projects"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import importlib.util
+import unittest
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestSectionListing(unittest.TestCase):
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_registry
+        from src.api.registry import PlanRegistry
+
+        init_registry(PlanRegistry())
+        self.client = TestClient(app)
+        for name in ("A", "B", "C", "D", "E"):
+            self.client.post("/api/sections/", json={"name": name, "is_ga": name == "E"})
+        self.client.post("/api/sections/A/rows/range", json={
+            "start_row": "1", "end_row": "3", "start_seat": "1", "end_seat": "4"})
+
+    def test_summary_counts(self):
+        res = self.client.get("/api/sections/", params={"view": "summary"})
+        self.assertEqual(res.status_code, 200)
+        body = res.json()
+        self.assertIsNone(body["next_cursor"])
+        self.assertEqual([item["name"] for item in body["items"]], ["A", "B", "C", "D", "E"])
+        self.assertEqual(body["items"][0], {"name": "A", "is_ga": False, "row_count": 3, "seat_count": 12})
+        self.assertTrue(body["items"][4]["is_ga"])
+
+    def test_summary_pagination(self):
+        names = []
+        cursor = None
+        while True:
+            params = {"view": "summary", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            body = self.client.get("/api/sections/", params=params).json()
+            names.extend(item["name"] for item in body["items"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(names, ["A", "B", "C", "D", "E"])
+
+    def test_section_named_summary(self):
+        self.client.post("/api/sections/", json={"name": "summary"})
+        self.client.post("/api/sections/summary/rows/1/range", json={"start_seat": "1", "end_seat": "2"})
+        res = self.client.get("/api/sections/summary")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["name"], "summary")
+        self.assertEqual(len(res.json()["rows"][0]["seats"]), 2)
+        items = self.client.get("/api/sections/", params={"view": "summary"}).json()["items"]
+        self.assertEqual(items[-1], {"name": "summary", "is_ga": False, "row_count": 1, "seat_count": 2})
+
+    def test_listing_pagination_header(self):
+        res = self.client.get("/api/sections/", params={"limit": 3})
+        self.assertEqual([s["name"] for s in res.json()], ["A", "B", "C"])
+        cursor = res.headers["x-next-cursor"]
+        res = self.client.get("/api/sections/", params={"limit": 3, "cursor": cursor})
+        self.assertEqual([s["name"] for s in res.json()], ["D", "E"])
+        self.assertNotIn("x-next-cursor", res.headers)
+
+    def test_listing_fields_selector(self):
+        res = self.client.get("/api/sections/", params={"fields": "name,is_ga"})
+        self.assertEqual(res.json()[0], {"name": "A", "is_ga": False})
+        full = self.client.get("/api/sections/").json()
+        self.assertEqual(len(full[0]["rows"]), 3)
+        self.assertEqual(self.client.get("/api/sections/", params={"fields": "seats"}).status_code, 400)
+
+    def test_bad_and_stale_cursors(self):
+        self.assertEqual(self.client.get("/api/sections/", params={"cursor": "%%%"}).status_code, 400)
+        cursor = self.client.get("/api/sections/", params={"limit": 1}).headers["x-next-cursor"]
+        self.client.delete("/api/sections/A")
+        self.assertEqual(self.client.get("/api/sections/", params={"cursor": cursor}).status_code, 400)
+
+    def test_row_endpoints(self):
+        self.client.post("/api/sections/A/rows/10/range", json={"start_seat": "1", "end_seat": "12"})
+        res = self.client.get("/api/sections/A/rows")
+        self.assertEqual(res.json(), [
+            {"row_number": "1", "seat_count": 4},
+            {"row_number": "2", "seat_count": 4},
+            {"row_number": "3", "seat_count": 4},
+            {"row_number": "10", "seat_count": 12},
+        ])
+        row = self.client.get("/api/sections/A/rows/10").json()
+        self.assertEqual(row["row_number"], "10")
+        self.assertEqual([s["seat_number"] for s in row["seats"]][:3], ["1", "2", "3"])
+        self.assertEqual(len(row["seats"]), 12)
+        self.assertEqual(self.client.get("/api/sections/A/rows/99").status_code, 404)
+        self.assertEqual(self.client.get("/api/sections/Z/rows").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+@unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+class TestSharedPlans(unittest.TestCase):
+    """Two registries over one SQLite store stand in for two API worker processes."""
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api import storage
+        from src.api.dependencies import init_jobs
+        from src.api.jobs import JobRunner
+        from src.api.registry import PlanRegistry
+        from src.api.shared import SharedPlans
+        from src.api.sqlite_storage import SqliteBackend
+
+        self.tmp = tempfile.mkdtemp()
+        patcher = mock.patch.object(storage, "PROJECTS_DIR", self.tmp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        path = os.path.join(self.tmp, "projects.db")
+        self.backends = [SqliteBackend(path), SqliteBackend(path)]
+        storage.set_backend(self.backends[0])
+        self.addCleanup(storage.set_backend, None)
+        self.workers = []
+        for backend in self.backends:
+            shared = SharedPlans(backend)
+            self.workers.append((PlanRegistry(shared=shared), JobRunner(mirror=shared)))
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        for _, jobs in self.workers:
+            jobs.shutdown()
+        for backend in self.backends:
+            backend.close()
+        shutil.rmtree(self.tmp)
+
+    def on(self, worker):
+        from src.api.dependencies import init_jobs, init_registry
+
+        registry, jobs = self.workers[worker]
+        init_registry(registry)
+        init_jobs(jobs)
+        return self.client
+
+    def test_writes_are_seen_by_other_workers(self):
+        self.on(0).post("/api/sections/", json={"name": "North"})
+        self.on(0).post("/api/sections/", json={"name": "South"})
+        res = self.on(1).get("/api/sections/")
+        self.assertEqual([s["name"] for s in res.json()], ["North", "South"])
+        etag = res.headers["etag"]
+        self.assertEqual(self.on(0).get("/api/sections/").headers["etag"], etag)
+
+        south = self.workers[0][0].default.plan.sections["South"]
+        self.on(1).post("/api/sections/North/rows/A/range", json={"start_seat": "1", "end_seat": "5"})
+        res = self.on(0).get("/api/sections/North")
+        self.assertEqual(len(res.json()["rows"][0]["seats"]), 5)
+        # only the changed section was reloaded
+        self.assertIs(self.workers[0][0].default.plan.sections["South"], south)
+
+        # worker 0's change feed reports worker 1's write under the same version
+        version = int(etag.strip('"').split("-")[1])
+        feed = self.on(0).get("/api/changes", params={"since": version}).json()
+        self.assertEqual([(e["type"], e["section"], len(e["seats_added"])) for e in feed["events"]],
+                         [("section_changed", "North", 5)])
+        self.assertEqual(feed, self.on(1).get("/api/changes", params={"since": version}).json())
+
+    def test_failed_store_commit_fails_the_request(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+
+        self.on(0).post("/api/sections/", json={"name": "North"})
+        client = TestClient(app, raise_server_exceptions=False)
+        with mock.patch.object(self.backends[0], "write_sections", side_effect=RuntimeError("database is locked")):
+            res = client.post("/api/sections/", json={"name": "South"})
+        self.assertEqual(res.status_code, 500)
+        self.assertEqual([s["name"] for s in self.on(1).get("/api/sections/").json()], ["North"])
+        self.assertEqual([s["name"] for s in self.on(0).get("/api/sections/").json()], ["North"])
+
+    def test_exports_and_change_feed_see_other_workers_writes(self):
+        import asyncio
+        import json
+        from src.api.dependencies import fresh_handle
+        from src.api.routes.changes import stream_changes
+
+        stale = self.on(1).get("/api/export/json")
+        self.on(0).post("/api/sections/", json={"name": "North"})
+        self.on(0).post("/api/sections/", json={"name": "South"})
+
+        res = self.on(1).get("/api/export/json")
+        self.assertEqual([s["name"] for s in res.json()["sections"]], ["North", "South"])
+        self.assertNotEqual(res.headers["etag"], stale.headers["etag"])
+        self.assertEqual(res.headers["etag"], self.on(0).get("/api/export/json").headers["etag"])
+
+        version = int(stale.headers["etag"].strip('"').split("-")[1])
+        feed = self.on(1).get("/api/changes", params={"since": version})
+        self.assertEqual(feed.status_code, 200)
+        self.assertEqual([(e["type"], e["section"]) for e in feed.json()["events"]],
+                         [("section_added", "North"), ("section_added", "South")])
+
+        self.on(0).delete("/api/sections/North")
+        registry = self.workers[1][0]
+        self.on(1)
+
+        async def hello():
+            handle = await fresh_handle(None, registry.default)
+            res = await stream_changes(request=mock.Mock(headers={}), since=None, handle=handle)
+            try:
+                return await res.body_iterator.__anext__()
+            finally:
+                await res.body_iterator.aclose()
+
+        message = asyncio.run(hello())
+        data = json.loads(message.split("data: ", 1)[1])
+        self.assertEqual(data["version"], self.workers[0][0].default.version)
+
+    def test_projects_and_jobs_across_workers(self):
+        self.assertEqual(self.on(0).post("/api/projects/arena").status_code, 201)
+        self.on(0).post("/api/projects/arena/sections/", json={"name": "Floor", "is_ga": True})
+        self.assertEqual(self.on(1).get("/api/projects/arena").json()["sections"], 1)
+        self.assertIn("arena", self.on(1).get("/api/projects/list").json()["projects"])
+
+        job = self.on(0).post("/api/projects/arena/save").json()
+        self.workers[0][1].get(job["job_id"]).wait(10)
+        self.assertEqual(self.on(1).get(f"/api/jobs/{job['job_id']}").json()["status"], "done")
+
+        self.assertEqual(self.on(1).delete("/api/projects/arena").status_code, 200)
+        self.assertEqual(self.on(0).get("/api/projects/arena/sections/").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from benchmarks import models as bench
+
+
+class TestModelBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmpdir.name, "results.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_main(self, *args):
+        with redirect_stdout(StringIO()) as out:
+            status = bench.main(list(args))
+        return status, out.getvalue()
+
+    def test_venue_layout_has_requested_size(self):
+        self.assertEqual(sum(len(section.seats) for section in bench.build_plan(2_500).sections.values()), 2_500)
+        self.assertEqual(len(bench.venue_layout(1_000_000)), 1_000)
+        self.assertEqual(bench.parse_size("1M"), 1_000_000)
+        self.assertEqual(bench.parse_size("10k"), 10_000)
+
+    def test_every_benchmark_runs_and_writes_results(self):
+        status, _ = self.run_main("--seats", "200", "--repeat", "1", "--output", self.output)
+        self.assertEqual(status, 0)
+        with open(self.output, encoding="utf-8") as f:
+            report = json.load(f)
+        self.assertEqual([entry["benchmark"] for entry in report["results"]], list(bench.BENCHMARKS))
+        for entry in report["results"]:
+            self.assertEqual(entry["seats"], 200)
+            self.assertGreater(entry["best_s"], 0)
+        self.assertIn("python", report["environment"])
+
+    def test_avail_file_round_trips(self):
+        plan = bench.build_plan(400)
+        path = os.path.join(self.tmpdir.name, "venue.xml")
+        bench.write_avail(plan, path)
+        imported = bench.SeatingPlan()
+        imported.import_from_avail(path)
+        self.assertEqual(set(imported.sections["Section 1"].seats), set(plan.sections["Section 1"].seats))
+
+    def test_synthetic_venue_benchmarks_run(self):
+        status, out = self.run_main("--seats", "500", "--venue", "synthetic", "--repeat", "1",
+                                    "--only", "delete_row,avail", "--output", self.output)
+        self.assertEqual(status, 0)
+        with open(self.output, encoding="utf-8") as f:
+            self.assertEqual({entry["venue"] for entry in json.load(f)["results"]}, {"synthetic"})
+
+    def test_comparison_flags_regressions(self):
+        baseline = os.path.join(self.tmpdir.name, "baseline.json")
+        with open(baseline, "w", encoding="utf-8") as f:
+            json.dump({"results": [
+                {"benchmark": "to_dict", "seats": 200, "best_s": 1e-9},
+                {"benchmark": "from_dict", "seats": 200, "best_s": 1e3},
+            ]}, f)
+        status, out = self.run_main("--seats", "200", "--only", "to_dict,from_dict", "--repeat", "1",
+                                    "--baseline", baseline, "--output", self.output)
+        self.assertEqual(status, 1)
+        self.assertIn("1 regression(s)", out)
+        with open(self.output, encoding="utf-8") as f:
+            comparison = {entry["benchmark"]: entry for entry in json.load(f)["comparison"]}
+        self.assertTrue(comparison["to_dict"]["regression"])
+        self.assertFalse(comparison["from_dict"]["regression"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.models.seating_plan import SeatingPlan
+from src.utils.import_cache import ImportCache, cached_import
+
+
+@unittest.skipIf(importlib.util.find_spec("openpyxl") is None, "openpyxl not installed")
+class TestImportCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ImportCache(os.path.join(self.tmp.name, "cache"))
+        plan = SeatingPlan("Venue")
+        plan.add_section("Stalls")
+        plan.sections["Stalls"].add_seat_range("A", 1, 10)
+        plan.sections["Stalls"].add_seat_range("B", 1, 12)
+        self.xlsx = os.path.join(self.tmp.name, "manifest.xlsx")
+        plan.export_to_excel(self.xlsx)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_import_is_served_from_cache(self):
+        first = cached_import(self.xlsx, "excel", "First", cache=self.cache)
+        with mock.patch.object(SeatingPlan, "import_from_excel", side_effect=AssertionError("parsed again")):
+            second = cached_import(self.xlsx, "excel", "Second", cache=self.cache)
+        self.assertEqual(second.name, "Second")
+        self.assertEqual(first.to_dict()["sections"], second.to_dict()["sections"])
+        self.assertEqual(len(second.sections["Stalls"].seats), 22)
+
+    def test_key_depends_on_content_and_importer(self):
+        key = self.cache.key_for(self.xlsx, "excel")
+        self.assertNotEqual(key, self.cache.key_for(self.xlsx, "avail"))
+        with open(self.xlsx, "ab") as f:
+            f.write(b"\0")
+        self.assertNotEqual(key, self.cache.key_for(self.xlsx, "excel"))
+
+    def test_corrupt_entry_is_a_miss(self):
+        key = self.cache.key_for(self.xlsx, "excel")
+        cached_import(self.xlsx, "excel", cache=self.cache)
+        with open(self.cache._entry_path(key), "wb") as f:
+            f.write(b"garbage")
+        self.assertIsNone(self.cache.get(key))
+        self.assertFalse(self.cache._entry_path(key).exists())
+
+    def test_lru_eviction_under_size_cap(self):
+        plan = cached_import(self.xlsx, "excel", cache=self.cache)
+        entry_size = next(self.cache.cache_dir.glob("*.plan")).stat().st_size
+        self.cache.max_bytes = entry_size * 2
+        self.cache.clear()
+
+        for key, mtime in (("a", 100), ("b", 200)):
+            self.cache.put(key, plan)
+            os.utime(self.cache._entry_path(key), (mtime, mtime))
+        # touching "a" makes "b" the least recently used entry
+        self.cache.get("a")
+        self.cache.put("c", plan)
+
+        self.assertTrue(self.cache._entry_path("a").exists())
+        self.assertFalse(self.cache._entry_path("b").exists())
+        self.assertTrue(self.cache._entry_path("c").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-start budgets (seconds) for the API worker and GUI entry modules.
+API_IMPORT_BUDGET = 1.5
+GUI_IMPORT_BUDGET = 2.5
+
+# Modules that must only be loaded by the import/export code paths.
+HEAVY_MODULES = ("bs4", "openpyxl", "lxml")
+
+
+def measure_import(module: str):
+    """Import 'module' in a fresh interpreter with -X importtime.
+
+    Returns (total_seconds, set_of_imported_module_names).
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        # top-level entries (no indentation) add up to the full import cost
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1_000_000, modules
+
+
+class TestImportTime(unittest.TestCase):
+
+    @unittest.skipIf(importlib.util.find_spec("fastapi") is None, "fastapi not installed")
+    def test_api_import_budget(self):
+        seconds, modules = measure_import("src.api.main")
+        for heavy in HEAVY_MODULES + ("PyQt6",):
+            self.assertNotIn(heavy, modules)
+        self.assertLess(seconds, API_IMPORT_BUDGET)
+
+    @unittest.skipIf(importlib.util.find_spec("PyQt6") is None, "PyQt6 not installed")
+    def test_gui_import_budget(self):
+        seconds, modules = measure_import("src.ui.main_window")
+        for heavy in HEAVY_MODULES:
+            self.assertNotIn(heavy, modules)
+        self.assertLess(seconds, GUI_IMPORT_BUDGET)
+
+    def test_models_do_not_import_heavy_dependencies(self):
+        _, modules = measure_import("src.models.seating_plan")
+        for heavy in HEAVY_MODULES + ("PyQt6", "fastapi"):
+            self.assertNotIn(heavy, modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
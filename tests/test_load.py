@@ -0,0 +1,40 @@
+import importlib.util
+import unittest
+
+HAS_SERVER = all(importlib.util.find_spec(module) is not None for module in ("fastapi", "httpx", "uvicorn"))
+
+
+@unittest.skipUnless(HAS_SERVER, "fastapi/httpx/uvicorn not installed")
+class TestLoadHarness(unittest.TestCase):
+
+    def test_percentile_and_options(self):
+        from benchmarks.load import configurations, parse_mix, percentile
+
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([3.0], 95), 3.0)
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(parse_mix("list=3, seat=1"), {"list": 3, "seat": 1})
+        with self.assertRaises(ValueError):
+            parse_mix("dance=1")
+        self.assertEqual(configurations("1,4", "on,off"), [(1, True), (1, False), (4, True), (4, False)])
+
+    def test_short_run_against_a_local_server(self):
+        import asyncio
+
+        from benchmarks.load import DEFAULT_MIX, local_server, run_load
+
+        with local_server(workers=1, cache=True) as url:
+            result = asyncio.run(run_load(url, clients=4, duration=1.5, mix=DEFAULT_MIX, cache=True,
+                                          projects=2, seats=500))
+        total = result["total"]
+        self.assertGreater(total["requests"], 0)
+        self.assertEqual(total["errors"], 0, result["statuses"])
+        self.assertGreater(total["edits_per_second"], 0)
+        self.assertLessEqual(total["p50_ms"], total["p99_ms"])
+        self.assertLessEqual(set(result["operations"]), set(DEFAULT_MIX))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import importlib.util
+import tempfile
+import unittest
+
+from benchmarks import memory
+from benchmarks.venue import generate_venue
+
+# Venue size the footprints are measured on
+SEATS = 10_000
+
+# Budgets in bytes per seat, about 30% over what the code used when they were set.
+SECTION_BUDGET = 270
+UNDO_SNAPSHOT_BUDGET = 420
+IMPORT_PROJECT_PEAK_BUDGET = 600
+IMPORT_FROM_AVAIL_PEAK_BUDGET = 1_600
+EXPORT_TO_EXCEL_PEAK_BUDGET = 170
+
+
+class TestMemoryFootprint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.plan = generate_venue(SEATS, seed=0)
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def assertWithinBudget(self, measurement, budget):
+        used = measurement(self.plan, self.tmpdir.name)
+        self.assertGreater(used, 0)
+        self.assertLess(used, budget, f"{measurement.__name__}: {used:.0f} bytes per seat")
+
+    def test_measure_reports_kept_and_peak_memory(self):
+        with memory.measure() as usage:
+            kept = bytearray(1_000_000)
+            transient = bytearray(4_000_000)
+            del transient
+        self.assertGreaterEqual(usage.kept, 1_000_000)
+        self.assertGreaterEqual(usage.peak, 4_000_000)
+        del kept
+
+    def test_section_bytes_per_seat(self):
+        self.assertWithinBudget(memory.section_bytes_per_seat, SECTION_BUDGET)
+
+    @unittest.skipIf(importlib.util.find_spec("PyQt6") is None, "PyQt6 not installed")
+    def test_undo_snapshot_bytes_per_seat(self):
+        self.assertWithinBudget(memory.undo_snapshot_bytes_per_seat, UNDO_SNAPSHOT_BUDGET)
+
+    def test_import_project_peak(self):
+        self.assertWithinBudget(memory.import_project_peak_bytes_per_seat, IMPORT_PROJECT_PEAK_BUDGET)
+
+    @unittest.skipIf(importlib.util.find_spec("bs4") is None or importlib.util.find_spec("lxml") is None,
+                     "bs4/lxml not installed")
+    def test_import_from_avail_peak(self):
+        self.assertWithinBudget(memory.import_from_avail_peak_bytes_per_seat, IMPORT_FROM_AVAIL_PEAK_BUDGET)
+
+    @unittest.skipIf(importlib.util.find_spec("openpyxl") is None, "openpyxl not installed")
+    def test_export_to_excel_peak(self):
+        self.assertWithinBudget(memory.export_to_excel_peak_bytes_per_seat, EXPORT_TO_EXCEL_PEAK_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import time
+import unittest
+
+from src.models.plan_diff import diff_plans, merge_plans
+from src.models.seating_plan import SeatingPlan
+
+
+def make_plan(sections: int = 3, rows: int = 5, seats: int = 10) -> SeatingPlan:
+    plan = SeatingPlan("Venue")
+    for i in range(1, sections + 1):
+        plan.add_section(f"Block {i}")
+        for r in range(1, rows + 1):
+            plan.sections[f"Block {i}"].add_seat_range(str(r), 1, seats)
+    return plan
+
+
+def copy_plan(plan: SeatingPlan) -> SeatingPlan:
+    copied = SeatingPlan()
+    copied.from_dict(plan.to_dict())
+    return copied
+
+
+class TestPlanDiff(unittest.TestCase):
+
+    def test_identical_plans_have_empty_diff(self):
+        plan = make_plan()
+        self.assertTrue(diff_plans(plan, copy_plan(plan)).is_empty())
+
+    def test_section_and_seat_changes(self):
+        a = make_plan()
+        b = copy_plan(a)
+        b.delete_section("Block 3")
+        b.add_section("Floor", is_ga=True)
+        b.sections["Block 1"].add_seat("6", "1")
+        b.sections["Block 1"].delete_seat("2", "10")
+        b.sections["Block 2"].is_ga = True
+
+        d = a.diff(b)
+        self.assertEqual(d.sections_added, ["Floor"])
+        self.assertEqual(d.sections_removed, ["Block 3"])
+        self.assertEqual(d.sections_changed["Block 1"].seats_added, {"6": ["1"]})
+        self.assertEqual(d.sections_changed["Block 1"].seats_removed, {"2": ["10"]})
+        self.assertEqual(d.sections_changed["Block 2"].is_ga, (False, True))
+
+    def test_rename_is_detected(self):
+        a = make_plan()
+        b = copy_plan(a)
+        b.rename_section("Block 2", "Balcony")
+        d = diff_plans(a, b)
+        self.assertEqual(d.sections_renamed, [("Block 2", "Balcony")])
+        self.assertEqual(d.sections_added, [])
+        self.assertEqual(d.sections_removed, [])
+
+    def test_diff_100k_seats_is_fast(self):
+        a = make_plan(sections=100, rows=20, seats=50)
+        b = copy_plan(a)
+        b.sections["Block 50"].delete_row("7")
+        start = time.perf_counter()
+        d = diff_plans(a, b)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(list(d.sections_changed), ["Block 50"])
+
+
+class TestMergePlans(unittest.TestCase):
+
+    def test_independent_edits_merge_cleanly(self):
+        base = make_plan()
+        ours = copy_plan(base)
+        theirs = copy_plan(base)
+        ours.sections["Block 1"].add_seat("1", "11")
+        theirs.sections["Block 1"].delete_seat("5", "1")
+        ours.rename_section("Block 2", "Balcony")
+        theirs.sections["Block 2"].add_seat("9", "1")
+        theirs.add_section("Floor", is_ga=True)
+
+        result = merge_plans(base, ours, theirs)
+        self.assertTrue(result.clean, result.conflicts)
+        merged = result.plan
+        self.assertIn("1-11", merged.sections["Block 1"].seats)
+        self.assertNotIn("5-1", merged.sections["Block 1"].seats)
+        self.assertNotIn("Block 2", merged.sections)
+        self.assertIn("9-1", merged.sections["Balcony"].seats)
+        self.assertTrue(merged.sections["Floor"].is_ga)
+
+    def test_conflicts_are_reported_and_ours_wins(self):
+        base = make_plan()
+        ours = copy_plan(base)
+        theirs = copy_plan(base)
+        ours.rename_section("Block 1", "Left")
+        theirs.rename_section("Block 1", "Right")
+        ours.delete_section("Block 2")
+        theirs.sections["Block 2"].add_seat("1", "99")
+
+        result = merge_plans(base, ours, theirs)
+        kinds = sorted(c.kind for c in result.conflicts)
+        self.assertEqual(kinds, ["delete_modify", "rename_rename"])
+        self.assertIn("Left", result.plan.sections)
+        self.assertNotIn("Right", result.plan.sections)
+        self.assertNotIn("Block 2", result.plan.sections)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.models.seating_plan import SeatingPlan
+from src.utils.compression import detect_compression, strip_project_extension
+
+
+class TestCompressedProjectFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.plan = SeatingPlan("Arena")
+        self.plan.add_section("North")
+        self.plan.sections["North"].add_seat_range("1", 1, 20)
+        self.plan.add_section("Floor", is_ga=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def roundtrip(self, filename):
+        path = os.path.join(self.tmp, filename)
+        self.plan.export_project(path)
+        loaded = SeatingPlan()
+        loaded.import_project(path)
+        self.assertEqual(loaded.to_dict(), self.plan.to_dict())
+        return path
+
+    def test_plain_json_roundtrip(self):
+        path = self.roundtrip("arena.json")
+        self.assertIsNone(detect_compression(path))
+
+    def test_gzip_roundtrip(self):
+        path = self.roundtrip("arena.json.gz")
+        self.assertEqual(detect_compression(path), "gzip")
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            self.assertIn('"seating_plan_name":"Arena"', f.read())
+
+    def test_xz_roundtrip(self):
+        path = self.roundtrip("arena.seatproj.xz")
+        self.assertEqual(detect_compression(path), "xz")
+        with lzma.open(path, "rt", encoding="utf-8") as f:
+            self.assertIn("North", f.read())
+
+    def test_compression_is_detected_from_content(self):
+        path = self.roundtrip("arena.json.gz")
+        renamed = os.path.join(self.tmp, "arena.seatproj")
+        os.rename(path, renamed)
+        loaded = SeatingPlan()
+        loaded.import_project(renamed)
+        self.assertIn("North", loaded.sections)
+
+    def test_strip_project_extension(self):
+        self.assertEqual(strip_project_extension("a.json"), "a")
+        self.assertEqual(strip_project_extension("a.b.seatproj.xz"), "a.b")
+        self.assertEqual(strip_project_extension("a.JSON.GZ"), "a")
+        self.assertIsNone(strip_project_extension("notes.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
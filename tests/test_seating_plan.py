@@ -48,5 +48,17 @@ class TestSeatingPlan(unittest.TestCase):
         self.assertIn("A", new_seating_plan.sections)
         self.assertIn(("1", "1"), new_seating_plan.sections["A"].seats)
 
+    def test_fingerprint_covers_names_and_flags(self):
+        self.seating_plan.add_section("A")
+        self.seating_plan.sections["A"].add_seat("1", "1")
+        copy = SeatingPlan()
+        copy.from_dict(self.seating_plan.to_dict())
+        self.assertEqual(copy.fingerprint, self.seating_plan.fingerprint)
+        copy.sections["A"].is_ga = True
+        self.assertNotEqual(copy.fingerprint, self.seating_plan.fingerprint)
+        copy.sections["A"].is_ga = False
+        copy.rename_section("A", "B")
+        self.assertNotEqual(copy.fingerprint, self.seating_plan.fingerprint)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -45,5 +45,84 @@ class TestSection(unittest.TestCase):
         self.assertNotIn("B1", self.section.seats)
         self.assertIn("C1", self.section.seats)
 
+    def test_fingerprint_is_order_independent(self):
+        other = Section("B")
+        self.section.add_seat("1", "1")
+        self.section.add_seat("1", "2")
+        other.add_seat("1", "2")
+        other.add_seat("1", "1")
+        self.assertEqual(self.section.fingerprint, other.fingerprint)
+        self.assertNotEqual(self.section.fingerprint, Section("C").fingerprint)
+
+    def test_fingerprint_tracks_mutations(self):
+        empty = self.section.fingerprint
+        self.section.add_seat_range("1", 1, 5)
+        self.section.add_seat_range("2", 1, 5)
+        filled = self.section.fingerprint
+        self.section.add_seat("1", "3")  # duplicate add is a no-op
+        self.assertEqual(self.section.fingerprint, filled)
+        self.section.delete_row("2")
+        self.section.add_seat_range("2", 1, 5)
+        self.assertEqual(self.section.fingerprint, filled)
+        self.assertEqual(self.section.clone().fingerprint, filled)
+        for seat in range(1, 6):
+            self.section.delete_seat("1", str(seat))
+            self.section.delete_seat("2", str(seat))
+        self.assertEqual(self.section.fingerprint, empty)
+
+    def test_renumber_overlapping_rows_keeps_seats_and_fingerprint(self):
+        self.section.add_seat_range("1", 1, 3)
+        self.section.add_seat_range("2", 1, 3)
+        self.section.renumber_rows(["1", "2"], "2")
+        self.assertEqual(sorted(self.section.seats), ["2-1", "2-2", "2-3", "3-1", "3-2", "3-3"])
+        expected = Section("X")
+        expected.add_seat_range("2", 1, 3)
+        expected.add_seat_range("3", 1, 3)
+        self.assertEqual(self.section.fingerprint, expected.fingerprint)
+
+    def test_row_index_tracks_mutations(self):
+        self.section.add_seat_range("A", 1, 3)
+        self.section.add_seat_range("A-B", 1, 2)  # a row whose label contains '-'
+        self.assertEqual(self.section.row_numbers(), ["A", "A-B"])
+        self.assertEqual(self.section.row_count, 2)
+        self.section.delete_row("A")
+        self.assertEqual(self.section.row_numbers(), ["A-B"])
+        self.assertEqual(sorted(self.section.seats), ["A-B-1", "A-B-2"])
+
+        self.section.change_seat_number("A-B", "1", "5")
+        self.assertEqual(sorted(s.seat_number for s in self.section.row_seats("A-B")), ["2", "5"])
+        self.section.renumber_rows(["A-B"], "C")
+        self.assertFalse(self.section.has_row("A-B"))
+        self.assertEqual(len(self.section.row_seats("C")), 2)
+        self.section.delete_seat("C", "2")
+        self.section.delete_seat("C", "5")
+        self.assertEqual(self.section.row_count, 0)
+
+    def test_row_index_survives_clone(self):
+        self.section.add_seat_range("1", 1, 3)
+        cloned = self.section.clone()
+        cloned.delete_row("1")
+        self.assertEqual(self.section.row_numbers(), ["1"])
+        self.assertEqual(len(self.section.row_seats("1")), 3)
+
+    def test_delete_seats_and_transfer_to(self):
+        self.section.add_seat_range("1", 1, 4)
+        self.section.add_seat_range("2", 1, 4)
+        self.assertEqual(self.section.delete_seats(["1-1", "1-2", "9-9"]), 2)
+
+        target = Section("B")
+        target.add_seat("2", "1")
+        moved = self.section.transfer_to(target, self.section.seat_keys_in_rows(["2"]) + ["1-3"])
+        self.assertEqual(moved, 5)
+        self.assertEqual(sorted(self.section.seats), ["1-4"])
+        self.assertEqual(sorted(target.seats), ["1-3", "2-1", "2-2", "2-3", "2-4"])
+        self.assertEqual(target.row_numbers(), ["2", "1"])
+
+        expected = Section("X")
+        for key in target.seats:
+            expected.add_seat(*key.split("-"))
+        self.assertEqual(target.fingerprint, expected.fingerprint)
+        self.assertEqual(self.section.transfer_to(self.section, ["1-4"]), 0)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.api.sqlite_storage import SqliteBackend
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+
+
+class TestSqliteBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.backend = SqliteBackend(os.path.join(self.tmp, "projects.db"))
+        self.plan = SeatingPlan("Arena")
+        for name in ("North", "South", "East"):
+            section = Section(name)
+            section.add_row_range("A", "C", "1", "20")
+            self.plan.sections[name] = section
+        self.plan.sections["Floor"] = Section("Floor", is_ga=True)
+        self.plan.sections["Floor"].add_seat("Floor", "1")
+
+    def tearDown(self):
+        self.backend.close()
+        shutil.rmtree(self.tmp)
+
+    def _section_ids(self):
+        db = self.backend._connection()
+        return dict(db.execute("SELECT name, id FROM sections"))
+
+    def test_round_trip_preserves_order(self):
+        self.backend.save_data("arena", self.plan.to_dict())
+        loaded = self.backend.load("arena")
+        self.assertEqual(loaded.to_dict(), self.plan.to_dict())
+        self.assertEqual(list(loaded.sections), ["North", "South", "East", "Floor"])
+        self.assertTrue(loaded.sections["Floor"].is_ga)
+        self.assertEqual(self.backend._connection().execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_resave_only_rewrites_changed_sections(self):
+        self.backend.save_data("arena", self.plan.to_dict())
+        before = self._section_ids()
+
+        self.plan.sections["South"].add_seat("D", "1")
+        del self.plan.sections["East"]
+        self.plan.sections = {"South": self.plan.sections["South"], "North": self.plan.sections["North"],
+                              "Floor": self.plan.sections["Floor"]}
+        self.backend.save_data("arena", self.plan.to_dict())
+        after = self._section_ids()
+
+        self.assertEqual(after["North"], before["North"])
+        self.assertEqual(after["Floor"], before["Floor"])
+        self.assertNotEqual(after["South"], before["South"])
+        self.assertNotIn("East", after)
+        self.assertEqual(self.backend.load("arena").to_dict(), self.plan.to_dict())
+        # rows and seats of the replaced and deleted sections are gone
+        db = self.backend._connection()
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM seats").fetchone()[0], 60 + 61 + 1)
+
+    def test_load_single_section_and_metadata(self):
+        self.backend.save_data("arena", self.plan.to_dict())
+        self.backend.save_data("empty", SeatingPlan("Empty").to_dict())
+        section = self.backend.load_section("arena", "South")
+        self.assertEqual(section.to_dict(), self.plan.sections["South"].to_dict())
+        with self.assertRaises(KeyError):
+            self.backend.load_section("arena", "West")
+        with self.assertRaises(FileNotFoundError):
+            self.backend.load_section("missing", "South")
+
+        entries = {entry["name"]: entry for entry in self.backend.entries()}
+        self.assertEqual((entries["arena"]["sections"], entries["arena"]["rows"], entries["arena"]["seats"]), (4, 10, 181))
+        self.assertEqual(entries["empty"]["plan_name"], "Empty")
+        self.assertEqual(self.backend.list_names(), ["arena", "empty"])
+
+        self.backend.delete("arena")
+        self.assertFalse(self.backend.exists("arena"))
+        self.assertEqual(self.backend._connection().execute("SELECT COUNT(*) FROM seats").fetchone()[0], 0)
+        with self.assertRaises(FileNotFoundError):
+            self.backend.delete("arena")
+        with self.assertRaises(FileNotFoundError):
+            self.backend.load("arena")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+from src.models.seating_plan import SeatingPlan
+from src.models.section import Section
+from src.utils import tracing
+
+HAS_API = importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("httpx") is not None
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.trace_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+
+    def tearDown(self):
+        tracing.configure(False)
+        tracing.clear()
+        os.remove(self.trace_path)
+
+    def test_disabled_tracing_is_a_pass_through(self):
+        tracing.configure(False)
+        self.assertIsNone(tracing.span("anything").__enter__())
+        section = Section("A")
+        section.add_row_range("A", "B", "1", "5")
+        self.assertEqual(len(section.seats), 10)
+        self.assertEqual(tracing.chrome_trace_events(), [])
+
+    def test_spans_nest_log_slow_operations_and_write_chrome_trace(self):
+        tracing.configure(True, slow_ms=0, chrome_trace=self.trace_path)
+        plan = SeatingPlan("Arena")
+        plan.add_section("North")
+        with self.assertLogs("src.utils.tracing", "WARNING") as logs:
+            with tracing.span("rebuild", sections=1) as outer:
+                plan.sections["North"].add_row_range("A", "C", "1", "10")
+                self.assertIs(tracing.current_span(), outer)
+        self.assertIn("slow operation rebuild > Section.add_row_range", logs.output[0])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "arena.json")
+            plan.export_project(path)
+            SeatingPlan().import_project(path)
+
+        self.assertEqual(tracing.write_chrome_trace(), self.trace_path)
+        with open(self.trace_path, encoding="utf-8") as f:
+            events = {event["name"]: event for event in json.load(f)["traceEvents"]}
+        self.assertLessEqual(
+            {"rebuild", "Section.add_row_range", "SeatingPlan.export_project", "SeatingPlan.write_project_data",
+             "SeatingPlan.import_project", "import_project.parse", "SeatingPlan.from_dict"},
+            set(events))
+        outer, inner = events["rebuild"], events["Section.add_row_range"]
+        self.assertEqual(outer["ph"], "X")
+        self.assertEqual(outer["args"], {"sections": 1})
+        self.assertGreaterEqual(inner["ts"], outer["ts"])
+        self.assertLessEqual(inner["ts"] + inner["dur"], outer["ts"] + outer["dur"])
+
+    @unittest.skipUnless(HAS_API, "fastapi/httpx not installed")
+    def test_route_span_is_parent_of_model_spans(self):
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        from src.api.dependencies import init_registry
+        from src.api.registry import PlanRegistry
+
+        init_registry(PlanRegistry())
+        client = TestClient(app)
+        client.post("/api/sections/", json={"name": "North"})
+        tracing.configure(True, slow_ms=0)
+        with self.assertLogs("src.utils.tracing", "WARNING") as logs:
+            client.post("/api/sections/North/rows/range", json={
+                "start_row": "A", "end_row": "B", "start_seat": "1", "end_seat": "4"})
+        # nested spans end before the route span is renamed after its template
+        self.assertIn("POST /api/sections/North/rows/range > Section.add_row_range", logs.output[0])
+        self.assertIn("slow operation POST /api/sections/{name}/rows/range took", logs.output[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+from benchmarks.venue import generate_venue, main, row_letter, write_avail
+from src.models.seating_plan import SeatingPlan
+
+
+class TestVenueGenerator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.plan = generate_venue(20_000, seed=4)
+
+    def seated(self, plan):
+        return {name: set(section.seats) for name, section in plan.sections.items() if not section.is_ga}
+
+    def test_exact_size_and_deterministic(self):
+        self.assertEqual(sum(len(section.seats) for section in self.plan.sections.values()), 20_000)
+        self.assertEqual(generate_venue(20_000, seed=4).to_dict(), self.plan.to_dict())
+        self.assertNotEqual(generate_venue(20_000, seed=5).to_dict(), self.plan.to_dict())
+        for size in (1, 999, 12_345):
+            self.assertEqual(sum(len(s.seats) for s in generate_venue(size, seed=1).sections.values()), size)
+
+    def test_venue_features(self):
+        sections = self.plan.sections
+        rows = [row for section in sections.values() for row in section.row_numbers()]
+        self.assertTrue(any(row.startswith("#") for row in rows))
+        self.assertTrue(any(row.isalpha() for row in rows))
+        self.assertNotIn("I", rows)
+        self.assertTrue(any(" Box " in name for name in sections))
+        self.assertTrue(all(not section.seats for section in sections.values() if section.is_ga))
+        self.assertFalse([name for name, section in sections.items() if not section.is_ga and not section.seats])
+        # blocks left of the centre carry odd seats only, right of it even ones
+        numbers = {name: {int(seat.seat_number) % 2 for seat in section.seats.values()}
+                   for name, section in sections.items() if name.startswith("Stalls Block")}
+        self.assertEqual(numbers["Stalls Block A"], {1})
+        self.assertIn({0}, numbers.values())
+        self.assertEqual(row_letter(0), "A")
+        self.assertEqual(row_letter(8), "J")
+        self.assertEqual(row_letter(24), "AA")
+
+    def test_thousands_of_sections(self):
+        self.assertGreater(len(generate_venue(200_000, seed=0).sections), 1_000)
+
+    def test_written_files_import_back(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {ext: os.path.join(tmp, f"venue.{ext}") for ext in ("json", "xlsx", "xml")}
+            self.assertEqual(main(["--seats", "3k", "--seed", "2", "--json", paths["json"],
+                                   "--excel", paths["xlsx"], "--avail", paths["xml"]]), 0)
+            plan = generate_venue(3_000, seed=2)
+            for ext, importer in (("json", "import_project"), ("xlsx", "import_from_excel"),
+                                  ("xml", "import_from_avail")):
+                imported = SeatingPlan()
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    getattr(imported, importer)(paths[ext])
+                self.assertEqual(self.seated(imported), self.seated(plan), ext)
+
+    def test_avail_groups_rows_with_the_same_seats(self):
+        plan = SeatingPlan()
+        plan.add_section("Box")
+        plan.sections["Box"].add_row_range("1", "3", "1", "4")
+        plan.add_section("Floor", is_ga=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "venue.xml")
+            write_avail(plan, path)
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        self.assertEqual(content.count("<section_name>Box</section_name>"), 1)
+        self.assertIn("<row_names></row_names><seat_names></seat_names><is_ga>true</is_ga>", content)
+
+
+if __name__ == "__main__":
+    unittest.main()